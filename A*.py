@@ -1,60 +1,13 @@
 import tkinter as tk
-from tkinter import messagebox
-from heapq import heappush, heappop
+from tkinter import filedialog, messagebox
 
-
-class MazeSolver:
-    def __init__(self, maze, initial, goal):
-        self.maze = maze
-        self.start = initial
-        self.goal = goal
-        self.rows = len(maze)
-        self.cols = len(maze[0])
-
-    def heuristic(self, position):
-        """Calculate Manhattan distance heuristic."""
-        return abs(position[0] - self.goal[0]) + abs(position[1] - self.goal[1])
-
-    def solve_a_star(self):
-        """Solve the maze using the A* algorithm."""
-        open_set = []
-        heappush(open_set, (0, self.start))
-        came_from = {}
-        g_score = {self.start: 0}
-        explored = set()
-
-        while open_set:
-            _, current = heappop(open_set)
-
-            if current == self.goal:
-                path = self.reconstruct_path(came_from, current)
-                return path, len(explored)
-
-            explored.add(current)
-
-            for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-                neighbor = (current[0] + dx, current[1] + dy)
-
-                if (0 <= neighbor[0] < self.rows and 0 <= neighbor[1] < self.cols and
-                        self.maze[neighbor[0]][neighbor[1]] == 0 and neighbor not in explored):
-                    tentative_g_score = g_score[current] + 1
-
-                    if tentative_g_score < g_score.get(neighbor, float('inf')):
-                        came_from[neighbor] = current
-                        g_score[neighbor] = tentative_g_score
-                        f_score = tentative_g_score + self.heuristic(neighbor)
-                        heappush(open_set, (f_score, neighbor))
-
-        return None, len(explored)
-
-    def reconstruct_path(self, came_from, current):
-        """Reconstruct the path from the goal to the start."""
-        path = [current]
-        while current in came_from:
-            current = came_from[current]
-            path.append(current)
-        path.reverse()
-        return path
+from maze_ai.background import BackgroundSolve
+from maze_ai.components import ComponentIndex
+from maze_ai.grid_view import MAX_CELLS, GridView
+from maze_ai.incremental import IncrementalSolver
+from maze_ai.mazefile import FILETYPES, load_blocked, save_maze
+from maze_ai.packed import EXTENSION
+from maze_ai.stats import SearchStats
 
 
 class MazeApp:
@@ -67,6 +20,11 @@ class MazeApp:
         self.blocked_cells = set()
         self.start = None
         self.end = None
+        self.components = None  # ComponentIndex of the grid, kept up to date by toggle_block
+        self.stats = None  # SearchStats of the last search
+        self.replanner = None  # Keeps its search state between solves
+        self.job = None  # BackgroundSolve while a search runs; it owns the replanner meanwhile
+        self.pending_changes = []  # Cell toggles not yet sent to the replanner
 
         # Create two pages
         self.page1 = tk.Frame(root, padx=20, pady=20)
@@ -76,8 +34,10 @@ class MazeApp:
         for page in (self.page1, self.page2):
             page.grid(row=0, column=0, sticky="nsew")
 
-        self.grid_frame = None
-        self.result_grid_frame = None
+        self.grid_canvas = None
+        self.grid_view = None
+        self.result_canvas = None
+        self.result_view = None
 
         # Configure the root window for resizing
         root.grid_rowconfigure(0, weight=1)
@@ -101,47 +61,96 @@ class MazeApp:
         self.cols_entry.grid(row=0, column=3, sticky="w")
 
         create_grid_button = tk.Button(self.page1, text="Create Grid", command=self.create_grid)
-        create_grid_button.grid(row=1, column=0, columnspan=4, pady=10)
+        create_grid_button.grid(row=1, column=0, columnspan=2, pady=10)
+
+        open_button = tk.Button(self.page1, text="Open Maze...", command=self.open_maze)
+        open_button.grid(row=1, column=2, pady=10)
+
+        save_button = tk.Button(self.page1, text="Save Maze...", command=self.save_maze)
+        save_button.grid(row=1, column=3, pady=10)
 
         next_page_button = tk.Button(self.page1, text="Next", command=self.show_page2, state="disabled")
         next_page_button.grid(row=2, column=0, columnspan=4, pady=10)
         self.next_page_button = next_page_button
 
     def create_grid(self):
-        """Create a grid of labels to mark blocked cells."""
+        """Create a canvas grid to mark blocked cells."""
         try:
             self.rows = int(self.rows_entry.get())
             self.cols = int(self.cols_entry.get())
 
-            if self.grid_frame:
-                self.grid_frame.destroy()
-            self.grid_frame = tk.Frame(self.page1, padx=10, pady=10)
-            self.grid_frame.grid(row=3, column=0, columnspan=4, pady=(10, 0), sticky="nsew")
+            if self.grid_canvas:
+                self.grid_canvas.destroy()
+            self.grid_canvas = tk.Canvas(self.page1)
+            self.grid_canvas.grid(row=3, column=0, columnspan=4, padx=10, pady=(20, 10))
+            self.grid_canvas.bind("<Button-1>", self.on_grid_click)
 
             self.page1.grid_rowconfigure(3, weight=1)
             self.page1.grid_columnconfigure(0, weight=1)
 
             self.blocked_cells = set()
-            for r in range(self.rows):
-                for c in range(self.cols):
-                    label_text = f"({r},{c})"
-                    label = tk.Label(self.grid_frame, text=label_text, width=5, height=2, relief="solid", bg="lightblue")
-                    label.grid(row=r, column=c, sticky="nsew")
-                    label.bind("<Button-1>", lambda e, r=r, c=c: self.toggle_block(r, c))
+            self.components = ComponentIndex(self.generate_maze())
+            if self.job is not None:
+                self.job.cancel()
+                self.job = None
+            self.replanner = None
+            self.pending_changes = []
+            self.grid_view = GridView(self.grid_canvas, self.rows, self.cols)
 
             self.next_page_button.config(state="normal")
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter valid integers for rows and columns.")
 
+    def open_maze(self):
+        """Load a text or packed maze file into the grid."""
+        path = filedialog.askopenfilename(filetypes=FILETYPES)
+        if not path:
+            return
+        try:
+            rows, cols, blocked, start, goal = load_blocked(path, MAX_CELLS)
+        except (OSError, ValueError) as exc:
+            messagebox.showerror("Cannot Open Maze", str(exc))
+            return
+        for entry, value in ((self.rows_entry, rows), (self.cols_entry, cols)):
+            entry.delete(0, tk.END)
+            entry.insert(0, str(value))
+        self.create_grid()
+        self.blocked_cells = blocked
+        self.components = ComponentIndex(self.generate_maze())
+        self.grid_view.update(blocked)
+        self.start, self.end = start, goal
+        for entries, cell in (((self.start_x_entry, self.start_y_entry), start),
+                              ((self.end_x_entry, self.end_y_entry), goal)):
+            for entry, value in zip(entries, cell or ("", "")):
+                entry.delete(0, tk.END)
+                entry.insert(0, str(value))
+
+    def save_maze(self):
+        """Save the grid, with the last start and goal, as a packed or text maze file."""
+        if self.grid_view is None:
+            messagebox.showinfo("No Grid", "Create a grid first.")
+            return
+        path = filedialog.asksaveasfilename(defaultextension=EXTENSION, filetypes=FILETYPES)
+        if path:
+            try:
+                save_maze(path, self.generate_maze(), self.start, self.end)
+            except OSError as exc:
+                messagebox.showerror("Cannot Save Maze", str(exc))
+
+    def on_grid_click(self, event):
+        cell = self.grid_view.cell_at(event.x, event.y)
+        if cell is not None:
+            self.toggle_block(*cell)
+
     def toggle_block(self, row, col):
-        """Toggle blocked cells by changing the label color."""
-        label = self.grid_frame.grid_slaves(row=row, column=col)[0]
+        """Toggle a blocked cell and recolor it."""
         if (row, col) not in self.blocked_cells:
-            label.config(bg="red")
             self.blocked_cells.add((row, col))
         else:
-            label.config(bg="lightblue")
             self.blocked_cells.remove((row, col))
+        self.grid_view.set_blocked((row, col), (row, col) in self.blocked_cells)
+        self.components.set_blocked((row, col), (row, col) in self.blocked_cells)
+        self.pending_changes.append((row, col, (row, col) in self.blocked_cells))
 
     def create_page2(self):
         """Page 2: Input start/goal positions and show the path."""
@@ -157,8 +166,22 @@ class MazeApp:
         self.end_x_entry.grid(row=1, column=1, sticky="w")
         self.end_y_entry.grid(row=1, column=2, sticky="w")
 
-        find_path_button = tk.Button(self.page2, text="Find Path", command=self.find_path)
-        find_path_button.grid(row=2, column=0, columnspan=4, pady=10)
+        tk.Label(self.page2, text="Time budget (s):").grid(row=0, column=3, padx=10, sticky="w")
+        self.budget_entry = tk.Entry(self.page2, width=5)
+        self.budget_entry.insert(0, "30")
+        self.budget_entry.grid(row=1, column=3, padx=10, sticky="w")
+
+        self.find_path_button = tk.Button(self.page2, text="Find Path", command=self.find_path)
+        self.find_path_button.grid(row=2, column=0, pady=10)
+
+        self.cancel_button = tk.Button(self.page2, text="Cancel", command=self.cancel_search, state="disabled")
+        self.cancel_button.grid(row=2, column=1, pady=10)
+
+        export_button = tk.Button(self.page2, text="Export Stats", command=self.export_stats)
+        export_button.grid(row=2, column=2, pady=10)
+
+        back_button = tk.Button(self.page2, text="Edit Grid", command=self.show_page1)
+        back_button.grid(row=2, column=3, pady=10)
 
         self.result_text = tk.Text(self.page2, height=10, width=40)
         self.result_text.grid(row=3, column=0, columnspan=4, padx=10, pady=10, sticky="nsew")
@@ -171,34 +194,27 @@ class MazeApp:
         self.page2.grid_columnconfigure(0, weight=1)
 
     def display_path_on_grid(self, path):
-        """Display the maze grid and highlight the solution path."""
-        if self.result_grid_frame:
-            self.result_grid_frame.destroy()
-
-        self.result_grid_frame = tk.Frame(self.page2, padx=10, pady=10)
-        self.result_grid_frame.grid(row=5, column=0, columnspan=4, pady=10, sticky="nsew")
-
-        self.page2.grid_rowconfigure(5, weight=1)
-        self.page2.grid_columnconfigure(0, weight=1)
-
-        for r in range(self.rows):
-            for c in range(self.cols):
-                color = "lightblue"
-                text = f"({r},{c})"
-
-                if (r, c) == self.start:
-                    color = "lightgreen"
-                    text = "Start"
-                elif (r, c) == self.end:
-                    color = "lightblue"
-                    text = "End"
-                elif (r, c) in self.blocked_cells:
-                    color = "red"
-                elif (r, c) in path:
-                    color = "green"
-
-                label = tk.Label(self.result_grid_frame, text=text, width=5, height=2, relief="solid", bg=color)
-                label.grid(row=r, column=c, sticky="nsew")
+        """Display the maze grid and highlight the solution path.
+
+        The canvas is kept between solves; only cells whose state changed
+        since the last solve are recolored.
+        """
+        view = self.result_view
+        if view is None or (view.rows, view.cols) != (self.rows, self.cols):
+            if self.result_canvas:
+                self.result_canvas.destroy()
+            self.result_canvas = tk.Canvas(self.page2)
+            self.result_canvas.grid(row=5, column=0, columnspan=4, padx=10, pady=20)
+            view = self.result_view = GridView(self.result_canvas, self.rows, self.cols)
+
+            self.page2.grid_rowconfigure(5, weight=1)
+            self.page2.grid_columnconfigure(0, weight=1)
+
+        view.update(self.blocked_cells, path, self.start, self.end)
+
+    def show_page1(self):
+        """Switch back to Page 1 to edit blocked cells."""
+        self.page1.tkraise()
 
     def show_page2(self):
         """Switch to Page 2."""
@@ -211,46 +227,121 @@ class MazeApp:
             maze[r][c] = 1
         return maze
 
+    @staticmethod
+    def plan(replanner, maze, start, goal, changes, stats=None, trace=None):
+        """Return ``(replanner, path, explored, replan_cost)``, repairing the last plan when possible.
+
+        ``replanner`` is reused while start and goal stay the same; the cell
+        toggles since the last solve are applied to it as one batch, and
+        ``stats`` only counts that repair.  Otherwise a new replanner is
+        built on ``maze``.  Runs on the worker thread.
+        """
+        if replanner is not None and (replanner.start, replanner.goal) == (start, goal):
+            path, replan_cost = replanner.update_cells(changes, stats, trace)
+        else:
+            replanner = IncrementalSolver(maze, start, goal)
+            path, _ = replanner.solve(stats, trace)
+            replan_cost = 0
+        return replanner, path, replanner.explored, replan_cost
+
     def find_path(self):
-        """Find and display the solution path."""
+        """Start the search on a worker thread; the window stays responsive meanwhile."""
         try:
             start_x = int(self.start_x_entry.get())
             start_y = int(self.start_y_entry.get())
             end_x = int(self.end_x_entry.get())
             end_y = int(self.end_y_entry.get())
-
-            self.start = (start_x, start_y)
-            self.end = (end_x, end_y)
-
-            # Validate if start or end position is blocked
-            if self.start in self.blocked_cells:
-                messagebox.showerror("Invalid Start Position", "The start position is in a blocked cell.")
-                return
-            if self.end in self.blocked_cells:
-                messagebox.showerror("Invalid Goal Position", "The goal position is in a blocked cell.")
-                return
-
-            maze = self.generate_maze()
-            solver = MazeSolver(maze, self.start, self.end)
-
-            solution_path, total_cost = solver.solve_a_star()
-
-            self.result_text.delete(1.0, tk.END)
-            if solution_path:
-                path_display = ['({},{})'.format(pos[0], pos[1]) for pos in solution_path]
-                self.result_text.insert(tk.END, '\n'.join(path_display))
-
-                # Calculate optimized cost (steps in the path minus 1)
-                optimized_cost = len(solution_path) - 1
-                self.cost_label.config(text=f"Total explored cost: {total_cost}\nOptimized path cost: {optimized_cost}")
-                self.display_path_on_grid(solution_path)
-            else:
-                messagebox.showinfo("No Path", "No valid path found!")
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter valid integers for start and goal positions.")
+            return
+        try:
+            budget = float(self.budget_entry.get())
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Please enter a number of seconds for the time budget.")
+            return
+
+        self.start = (start_x, start_y)
+        self.end = (end_x, end_y)
+
+        # Validate if start or end position is blocked
+        if self.start in self.blocked_cells:
+            messagebox.showerror("Invalid Start Position", "The start position is in a blocked cell.")
+            return
+        if self.end in self.blocked_cells:
+            messagebox.showerror("Invalid Goal Position", "The goal position is in a blocked cell.")
+            return
+
+        if not self.components.connected(self.start, self.end):
+            # Different regions: every search would fail, so skip it
+            self.result_text.delete(1.0, tk.END)
+            self.cost_label.config(text="Start and goal are in separate regions.")
+            messagebox.showinfo("No Path", "No valid path found!")
+            return
+
+        stats = SearchStats("A*")
+        replanner, changes, maze = self.replanner, self.pending_changes, self.generate_maze()
+        start, end = self.start, self.end
+        # A stopped search leaves no replanner; the next solve plans from scratch
+        self.replanner = None
+        self.pending_changes = []
+
+        self.job = BackgroundSolve(lambda progress: self.plan(replanner, maze, start, end, changes, stats, progress),
+                                   budget).start()
+        self.find_path_button.config(state="disabled")
+        self.cancel_button.config(state="normal")
+        self.job.poll(self.root, self.show_progress, lambda job: self.show_result(job, stats))
+
+    def cancel_search(self):
+        if self.job is not None:
+            self.job.cancel()
+
+    def show_progress(self, expanded):
+        self.cost_label.config(text=f"Searching... {expanded} nodes expanded")
+
+    def show_result(self, job, stats):
+        """Show the finished search in the result text and grid."""
+        if job is not self.job:
+            return  # The grid was recreated while this search ran
+        self.job = None
+        self.find_path_button.config(state="normal")
+        self.cancel_button.config(state="disabled")
+        if job.cancelled:
+            self.cost_label.config(text=f"{job.error} ({job.progress.expanded} nodes expanded)")
+            return
+        if job.error is not None:
+            messagebox.showerror("Search Failed", str(job.error))
+            return
+
+        self.replanner, solution_path, total_cost, replan_cost = job.result
+        stats.finish(solution_path, total_cost, job.seconds)
+        self.stats = stats
+
+        self.result_text.delete(1.0, tk.END)
+        if solution_path:
+            path_display = ['({},{})'.format(pos[0], pos[1]) for pos in solution_path]
+            self.result_text.insert(tk.END, '\n'.join(path_display))
+
+            # Calculate optimized cost (steps in the path minus 1)
+            optimized_cost = len(solution_path) - 1
+            self.cost_label.config(text=f"Total explored cost: {total_cost}\nReplan cost: {replan_cost}\n"
+                                        f"Optimized path cost: {optimized_cost}\n{stats.summary()}")
+            self.display_path_on_grid(solution_path)
+        else:
+            self.cost_label.config(text=stats.summary())
+            messagebox.showinfo("No Path", "No valid path found!")
+
+    def export_stats(self):
+        """Save the statistics of the last search as a JSON file."""
+        if self.stats is None:
+            messagebox.showinfo("No Statistics", "Run a search first.")
+            return
+        path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
+        if path:
+            self.stats.save(path)
 
 
 # Initialize the Tkinter root and application
-root = tk.Tk()
-app = MazeApp(root)
-root.mainloop()
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = MazeApp(root)
+    root.mainloop()
@@ -1,130 +1,19 @@
 import tkinter as tk
-from tkinter import messagebox
-from collections import deque
-
-
-class MazeProblem:
-    def __init__(self, maze, initial, goal):
-        self.maze = maze
-        self.initial = initial
-        self.goal = goal
-        self.rows = len(maze)
-        self.cols = len(maze[0])
-
-    def goal_test(self, state):
-        """Check if the state is the goal state."""
-        return state == self.goal
-
-    def step_cost(self, current_state, action, next_state):
-        """Returns the cost of moving from current_state to next_state."""
-        return 1  # Each move has a uniform cost of 1 in this maze
-
-    def successor(self, state):
-        """Generate successors for a given cell in the maze."""
-        successors = []
-        row, col = state
-        directions = [(1, 0), (0, 1), (-1, 0), (0, -1)]
-
-        for drow, dcol in directions:
-            new_row, new_col = row + drow, col + dcol
-            if 0 <= new_row < self.rows and 0 <= new_col < self.cols and self.maze[new_row][new_col] == 0:
-                successors.append((None, (new_row, new_col)))
-
-        return successors
-
-
-class Node_Depth:
-    def __init__(self, state, parent=None, action=None, path_cost=0):
-        self.state = state
-        self.parent = parent
-        self.action = action
-        self.path_cost = path_cost  # Initialize with the cost to reach this node
-
-    def expand(self, problem):
-        """Return a list of child nodes generated from this node."""
-        return [
-            Node_Depth(next_state, self, action, self.path_cost + problem.step_cost(self.state, action, next_state))
-            for action, next_state in problem.successor(self.state)
-        ]
-
-    def path(self):
-        """Return the path from the root to this node."""
-        node, path_back = self, []
-        while node:
-            path_back.append(node.state)
-            node = node.parent
-        return list(reversed(path_back))
-
-
-def depth_limited_search(problem, limit=50):
-    """
-    Depth-Limited Search (DLS) with correct cost calculation.
-    Counts all unique nodes explored during the search.
-    """
-    explored_nodes = set()  # Set to store all unique nodes visited
-
-    def recursive_dls(node, problem, limit):
-        nonlocal explored_nodes
-
-        if node.state not in explored_nodes:
-            explored_nodes.add(node.state)
-
-        if problem.goal_test(node.state):
-            return node
-        elif limit == 0:
-            return 'cutoff'
-        else:
-            cutoff_occurred = False
-            for child in node.expand(problem):
-                if child.state not in explored_nodes:  # Avoid revisiting nodes in the recursion
-                    result = recursive_dls(child, problem, limit - 1)
-                    if result == 'cutoff':
-                        cutoff_occurred = True
-                    elif result is not None:
-                        return result
-            return 'cutoff' if cutoff_occurred else None
-
-    start_node = Node_Depth(problem.initial)
-    result = recursive_dls(start_node, problem, limit)
-    return result, len(explored_nodes)  # Return the result and total explored cost
-
-
-def bfs(maze, start, end):
-    """
-    Breadth-First Search (BFS) with correct cost calculation.
-    Counts all unique nodes explored during the search.
-    """
-    directions = [(1, 0), (0, 1), (-1, 0), (0, -1)]
-    rows, cols = len(maze), len(maze[0])
-
-    queue = deque([start])
-    visited = set([start])  # Set to store all unique nodes visited
-    parent = {start: None}
-
-    while queue:
-        current = queue.popleft()
-
-        if current == end:
-            break
-
-        for direction in directions:
-            new_row, new_col = current[0] + direction[0], current[1] + direction[1]
-            new_node = (new_row, new_col)
-
-            if (0 <= new_row < rows and 0 <= new_col < cols and
-                    maze[new_row][new_col] == 0 and new_node not in visited):
-                queue.append(new_node)
-                visited.add(new_node)  # Mark as visited
-                parent[new_node] = current
-
-    # Reconstruct the path from start to end
-    path = []
-    current = end
-    while current is not None:
-        path.append(current)
-        current = parent.get(current)
-
-    return path[::-1], len(visited)  # Return path and total explored cost
+from tkinter import filedialog, messagebox
+
+from maze_ai.background import BackgroundSolve
+from maze_ai.components import ComponentIndex
+from maze_ai.grid_view import MAX_CELLS, GridView
+from maze_ai.mazefile import FILETYPES, load_blocked, save_maze
+from maze_ai.packed import EXTENSION
+from maze_ai.stats import SearchStats
+from maze_ai.stepping import SteppedSolve, frame_size
+from maze_ai.uninformed import (
+    MazeProblem, bfs, bfs_steps, depth_limited_search, depth_limited_steps, iterative_deepening_search,
+)
+
+# Searches that have a stepping form and can be animated
+ANIMATED = {"Depth-Limited Search", "Breadth-First Search"}
 
 
 class MazeApp:
@@ -138,13 +27,17 @@ class MazeApp:
         self.blocked_cells = set()
         self.start = None
         self.end = None
-        self.cell_labels = []
+        self.components = None  # ComponentIndex of the grid, kept up to date by toggle_block
+        self.stats = None  # SearchStats of the last search
+        self.job = None  # BackgroundSolve while a search runs
 
         # Create frames for each page
         self.page1 = tk.Frame(root)
         self.page2 = tk.Frame(root)
-        self.grid_frame = None
-        self.result_grid_frame = None
+        self.grid_canvas = None
+        self.grid_view = None
+        self.result_canvas = None
+        self.result_view = None
 
         self.create_page1()  # Display the first page initially
 
@@ -163,49 +56,83 @@ class MazeApp:
 
         # Button to create the grid
         create_grid_button = tk.Button(self.page1, text="Create Grid", command=self.create_grid)
-        create_grid_button.grid(row=1, column=0, columnspan=4, pady=10)
+        create_grid_button.grid(row=1, column=0, columnspan=3, pady=10)
+
+        open_button = tk.Button(self.page1, text="Open Maze...", command=self.open_maze)
+        open_button.grid(row=1, column=3, pady=10)
+
+        save_button = tk.Button(self.page1, text="Save Maze...", command=self.save_maze)
+        save_button.grid(row=1, column=4, pady=10)
 
         # Button to proceed to the next page
         next_page_button = tk.Button(self.page1, text="Next", command=self.show_page2, state="disabled")
-        next_page_button.grid(row=2, column=0, columnspan=4, pady=10)
+        next_page_button.grid(row=2, column=0, columnspan=5, pady=10)
         self.next_page_button = next_page_button
 
     def create_grid(self):
-        """Creates a grid of labels to mark blocked cells based on rows and columns."""
+        """Creates a canvas grid to mark blocked cells based on rows and columns."""
         try:
             self.rows = int(self.rows_entry.get())
             self.cols = int(self.cols_entry.get())
 
-            if self.grid_frame:
-                self.grid_frame.destroy()
-            self.grid_frame = tk.Frame(self.page1)
-            self.grid_frame.grid(row=3, column=0, columnspan=4, pady=(10, 0))
+            if self.grid_canvas:
+                self.grid_canvas.destroy()
+            self.grid_canvas = tk.Canvas(self.page1)
+            self.grid_canvas.grid(row=3, column=0, columnspan=5, pady=(10, 0))
+            self.grid_canvas.bind("<Button-1>", self.on_grid_click)
 
-            self.cell_labels = []
             self.blocked_cells = set()
-
-            for r in range(self.rows):
-                row_labels = []
-                for c in range(self.cols):
-                    label_text = f"({r},{c})"
-                    label = tk.Label(self.grid_frame, text=label_text, width=5, height=2, relief="solid", bg="lightblue")
-                    label.grid(row=r, column=c)
-                    label.bind("<Button-1>", lambda e, r=r, c=c: self.toggle_block(r, c))
-                    row_labels.append(label)
-                self.cell_labels.append(row_labels)
+            self.components = ComponentIndex(self.generate_maze())
+            self.grid_view = GridView(self.grid_canvas, self.rows, self.cols)
 
             self.next_page_button.config(state="normal")
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter valid integers for rows and columns.")
 
+    def open_maze(self):
+        """Load a text or packed maze file into the grid."""
+        path = filedialog.askopenfilename(filetypes=FILETYPES)
+        if not path:
+            return
+        try:
+            rows, cols, blocked, start, goal = load_blocked(path, MAX_CELLS)
+        except (OSError, ValueError) as exc:
+            messagebox.showerror("Cannot Open Maze", str(exc))
+            return
+        for entry, value in ((self.rows_entry, rows), (self.cols_entry, cols)):
+            entry.delete(0, tk.END)
+            entry.insert(0, str(value))
+        self.create_grid()
+        self.blocked_cells = blocked
+        self.components = ComponentIndex(self.generate_maze())
+        self.grid_view.update(blocked)
+        self.start, self.end = start, goal  # Filled into page 2 when it is built
+
+    def save_maze(self):
+        """Save the grid, with the last start and goal, as a packed or text maze file."""
+        if self.grid_view is None:
+            messagebox.showinfo("No Grid", "Create a grid first.")
+            return
+        path = filedialog.asksaveasfilename(defaultextension=EXTENSION, filetypes=FILETYPES)
+        if path:
+            try:
+                save_maze(path, self.generate_maze(), self.start, self.end)
+            except OSError as exc:
+                messagebox.showerror("Cannot Save Maze", str(exc))
+
+    def on_grid_click(self, event):
+        cell = self.grid_view.cell_at(event.x, event.y)
+        if cell is not None:
+            self.toggle_block(*cell)
+
     def toggle_block(self, row, col):
-        """Toggle blocked cells by changing the label color."""
+        """Toggle a blocked cell and recolor it."""
         if (row, col) not in self.blocked_cells:
-            self.cell_labels[row][col].config(bg="red")
             self.blocked_cells.add((row, col))
         else:
-            self.cell_labels[row][col].config(bg="lightblue")
             self.blocked_cells.remove((row, col))
+        self.grid_view.set_blocked((row, col), (row, col) in self.blocked_cells)
+        self.components.set_blocked((row, col), (row, col) in self.blocked_cells)
 
     def show_page2(self):
         """Switch to Page 2 for start/goal input and path finding."""
@@ -228,83 +155,191 @@ class MazeApp:
         self.end_y_entry = tk.Entry(self.page2, width=5)
         self.end_x_entry.grid(row=1, column=1)
         self.end_y_entry.grid(row=1, column=2)
+        for entries, cell in (((self.start_x_entry, self.start_y_entry), self.start),
+                              ((self.end_x_entry, self.end_y_entry), self.end)):
+            for entry, value in zip(entries, cell or ()):
+                entry.insert(0, str(value))
 
         tk.Label(self.page2, text="Select Search Algorithm:").grid(row=2, column=0, padx=10, pady=5)
         self.search_algo = tk.StringVar(value="Depth-Limited Search")
         tk.Radiobutton(self.page2, text="Depth-Limited Search", variable=self.search_algo, value="Depth-Limited Search").grid(row=2, column=1)
         tk.Radiobutton(self.page2, text="Breadth-First Search", variable=self.search_algo, value="Breadth-First Search").grid(row=2, column=2)
+        tk.Radiobutton(self.page2, text="Iterative Deepening", variable=self.search_algo, value="Iterative Deepening").grid(row=2, column=3)
+        tk.Radiobutton(self.page2, text="Bidirectional BFS", variable=self.search_algo, value="Bidirectional BFS").grid(row=2, column=4)
+
+        self.find_path_button = tk.Button(self.page2, text="Find Path", command=self.find_path)
+        self.find_path_button.grid(row=3, column=0, columnspan=2, pady=10)
+
+        self.cancel_button = tk.Button(self.page2, text="Cancel", command=self.cancel_search, state="disabled")
+        self.cancel_button.grid(row=3, column=2, pady=10)
+
+        tk.Label(self.page2, text="Time budget (s):").grid(row=3, column=3)
+        self.budget_entry = tk.Entry(self.page2, width=5)
+        self.budget_entry.insert(0, "30")
+        self.budget_entry.grid(row=3, column=4)
+
+        export_button = tk.Button(self.page2, text="Export Stats", command=self.export_stats)
+        export_button.grid(row=4, column=0, columnspan=2)
 
-        find_path_button = tk.Button(self.page2, text="Find Path", command=self.find_path)
-        find_path_button.grid(row=3, column=0, columnspan=4, pady=10)
+        self.animate = tk.BooleanVar(value=False)
+        tk.Checkbutton(self.page2, text="Animate search (DLS, BFS)", variable=self.animate).grid(row=4, column=2, columnspan=3)
 
         self.result_text = tk.Text(self.page2, height=10, width=40)
-        self.result_text.grid(row=5, column=0, columnspan=4, padx=10, pady=10)
+        self.result_text.grid(row=5, column=0, columnspan=5, padx=10, pady=10)
 
         self.cost_label = tk.Label(self.page2, text="", font=("Arial", 12))
-        self.cost_label.grid(row=6, column=0, columnspan=4, pady=5)
+        self.cost_label.grid(row=6, column=0, columnspan=5, pady=5)
+
+    def generate_maze(self):
+        """Generate a maze array based on blocked cells."""
+        maze = [[0] * self.cols for _ in range(self.rows)]
+        for r, c in self.blocked_cells:
+            maze[r][c] = 1
+        return maze
 
     def find_path(self):
-        """Finds the path and visually displays it on the grid on Page 2."""
+        """Starts the selected search on a worker thread; the window stays responsive meanwhile."""
         try:
             start_x, start_y = int(self.start_x_entry.get()), int(self.start_y_entry.get())
             end_x, end_y = int(self.end_x_entry.get()), int(self.end_y_entry.get())
-            self.start, self.end = (start_x, start_y), (end_x, end_y)
-
-            maze = [[0] * self.cols for _ in range(self.rows)]
-            for r, c in self.blocked_cells:
-                maze[r][c] = 1
-
-            problem = MazeProblem(maze, self.start, self.end)
-
-            path, total_cost = None, None
-            if self.search_algo.get() == "Depth-Limited Search":
-                path_node, total_cost = depth_limited_search(problem, limit=50)
-                if path_node != 'cutoff':
-                    path = path_node.path()
-            elif self.search_algo.get() == "Breadth-First Search":
-                path, total_cost = bfs(maze, self.start, self.end)
-
-            self.result_text.delete(1.0, tk.END)
-            if path:
-                optimized_cost = len(path) - 1  # Optimized cost is the number of steps in the shortest path
-                path_display = ['({},{})'.format(pos[0], pos[1]) for pos in path]
-                self.result_text.insert(tk.END, '\n'.join(path_display))
-
-                # Display both costs
-                self.cost_label.config(
-                    text=f"Total explored cost (unique nodes): {total_cost}\n"
-                         f"Optimized path cost (shortest path length): {optimized_cost}"
-                )
-                self.display_path_on_grid(path)
-            else:
-                messagebox.showinfo("No Path", "No valid path found!")
-                self.cost_label.config(text="")
-                self.display_path_on_grid([])
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter valid integers for start and goal positions.")
+            return
+        try:
+            budget = float(self.budget_entry.get())
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Please enter a number of seconds for the time budget.")
+            return
+        self.start, self.end = (start_x, start_y), (end_x, end_y)
+
+        if not self.components.connected(self.start, self.end):
+            # Different regions: every search would fail, so skip it
+            self.result_text.delete(1.0, tk.END)
+            self.cost_label.config(text="Start and goal are in separate regions.")
+            messagebox.showinfo("No Path", "No valid path found!")
+            return
+
+        maze = self.generate_maze()
+
+        algorithm = self.search_algo.get()
+        stats = SearchStats(algorithm)
+        start, end = self.start, self.end
+
+        view = self.result_grid()
+        view.clear_search()
+        if self.animate.get() and algorithm in ANIMATED:
+            # Draw the search as it runs, one step of expansions per frame
+            view.update(self.blocked_cells, (), start, end)
+            steps = self.search_steps(algorithm, maze, start, end, frame_size(self.rows * self.cols), stats)
+            self.job = SteppedSolve(steps, budget).start()
+            on_progress = self.show_step
+        else:
+            self.job = BackgroundSolve(lambda progress: self.search(algorithm, maze, start, end, stats, progress),
+                                       budget).start()
+            on_progress = self.show_progress
+        self.find_path_button.config(state="disabled")
+        self.cancel_button.config(state="normal")
+        self.job.poll(self.root, on_progress, lambda job: self.show_result(job, stats))
+
+    @staticmethod
+    def search(algorithm, maze, start, end, stats, progress):
+        """Runs one search on the worker thread and returns ``(path, total_cost)``."""
+        problem = MazeProblem(maze, start, end)
+        path, total_cost = None, None
+        if algorithm == "Depth-Limited Search":
+            path_node, total_cost = depth_limited_search(problem, limit=50, stats=stats, trace=progress)
+            if path_node not in (None, 'cutoff'):
+                path = path_node.path()
+        elif algorithm == "Breadth-First Search":
+            path, total_cost = bfs(maze, start, end, stats=stats, trace=progress)
+        elif algorithm == "Bidirectional BFS":
+            path, total_cost = bfs(maze, start, end, bidirectional=True, stats=stats, trace=progress)
+        elif algorithm == "Iterative Deepening":
+            path_node, total_cost = iterative_deepening_search(problem, stats=stats, trace=progress)
+            if path_node is not None:
+                path = path_node.path()
+        return path, total_cost
+
+    @staticmethod
+    def search_steps(algorithm, maze, start, end, every, stats):
+        """Stepping form of ``search`` for the searches in ``ANIMATED``."""
+        if algorithm == "Breadth-First Search":
+            return (yield from bfs_steps(maze, start, end, every=every, stats=stats))
+        path_node, total_cost = yield from depth_limited_steps(MazeProblem(maze, start, end), 50, every, stats)
+        return (path_node.path() if path_node not in (None, 'cutoff') else None), total_cost
+
+    def cancel_search(self):
+        if self.job is not None:
+            self.job.cancel()
+
+    def show_progress(self, expanded):
+        self.cost_label.config(text=f"Searching... {expanded} nodes expanded")
+
+    def show_step(self, step):
+        self.result_view.show_step(step)
+        self.show_progress(step.expanded)
+
+    def show_result(self, job, stats):
+        """Shows the finished search in the result text and on the grid."""
+        self.job = None
+        self.find_path_button.config(state="normal")
+        self.cancel_button.config(state="disabled")
+        if job.cancelled:
+            self.cost_label.config(text=f"{job.error} ({job.progress.expanded} nodes expanded)")
+            return
+        if job.error is not None:
+            messagebox.showerror("Search Failed", str(job.error))
+            return
+
+        path, total_cost = job.result
+        stats.finish(path, total_cost, job.seconds)
+        self.stats = stats
+
+        self.result_text.delete(1.0, tk.END)
+        if path:
+            optimized_cost = len(path) - 1  # Optimized cost is the number of steps in the shortest path
+            path_display = ['({},{})'.format(pos[0], pos[1]) for pos in path]
+            self.result_text.insert(tk.END, '\n'.join(path_display))
+
+            # Display both costs
+            self.cost_label.config(
+                text=f"Total explored cost (unique nodes): {total_cost}\n"
+                     f"Optimized path cost (shortest path length): {optimized_cost}\n"
+                     f"{stats.summary()}"
+            )
+            self.display_path_on_grid(path)
+        else:
+            messagebox.showinfo("No Path", "No valid path found!")
+            self.cost_label.config(text=stats.summary())
+            self.display_path_on_grid([])
+
+    def export_stats(self):
+        """Save the statistics of the last search as a JSON file."""
+        if self.stats is None:
+            messagebox.showinfo("No Statistics", "Run a search first.")
+            return
+        path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
+        if path:
+            self.stats.save(path)
+
+    def result_grid(self):
+        """Returns the result grid view, creating it for the current grid size."""
+        view = self.result_view
+        if view is None or (view.rows, view.cols) != (self.rows, self.cols):
+            if self.result_canvas:
+                self.result_canvas.destroy()
+            self.result_canvas = tk.Canvas(self.page2)
+            self.result_canvas.grid(row=7, column=0, columnspan=5, pady=(10, 0))
+            view = self.result_view = GridView(self.result_canvas, self.rows, self.cols)
+        return view
 
     def display_path_on_grid(self, path):
-        """Creates a grid to visually show the maze with the solution path."""
-        if self.result_grid_frame:
-            self.result_grid_frame.destroy()
-        self.result_grid_frame = tk.Frame(self.page2)
-        self.result_grid_frame.grid(row=7, column=0, columnspan=4, pady=(10, 0))
-
-        for r in range(self.rows):
-            for c in range(self.cols):
-                color = "red" if (r, c) in self.blocked_cells else "green" if (r, c) in path else "lightblue"
-                text = f"({r},{c})"
-                if (r, c) == self.start:
-                    color = "lightgreen"
-                    text = "Start"
-                elif (r, c) == self.end:
-                    color = "lightblue"
-                    text = "End"
-                label = tk.Label(self.result_grid_frame, text=text, width=5, height=2, relief="solid", bg=color)
-                label.grid(row=r, column=c)
+        """Shows the maze with the solution path, recoloring only changed cells."""
+        self.result_grid().update(self.blocked_cells, path, self.start, self.end)
 
 
 # Initialize Tkinter and start the app
-root = tk.Tk()
-app = MazeApp(root)
-root.mainloop()
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = MazeApp(root)
+    root.mainloop()
@@ -1,73 +1,14 @@
 import tkinter as tk
-from tkinter import messagebox
-
-
-class MazeProblem:
-    def __init__(self, maze, initial, goal):
-        self.maze = maze
-        self.initial = initial
-        self.goal = goal
-        self.rows = len(maze)
-        self.cols = len(maze[0])
-        self.facts = set()
-        self.explored_cost = 0
-
-        self.rules = [
-            self.move_up,
-            self.move_down,
-            self.move_left,
-            self.move_right
-        ]
-
-    def is_goal(self, position):
-        return position == self.goal
-
-    def within_bounds(self, row, col):
-        return 0 <= row < self.rows and 0 <= col < self.cols and self.maze[row][col] == 0
-
-    def add_fact(self, fact, path):
-        path_tuple = tuple(path)
-        if fact not in {pos for pos, _ in self.facts}:
-            self.facts.add((fact, path_tuple))
-            self.explored_cost += 1
-
-    def move_up(self, position, path):
-        row, col = position
-        new_pos = (row - 1, col)
-        if self.within_bounds(*new_pos):
-            self.add_fact(new_pos, path + [new_pos])
-
-    def move_down(self, position, path):
-        row, col = position
-        new_pos = (row + 1, col)
-        if self.within_bounds(*new_pos):
-            self.add_fact(new_pos, path + [new_pos])
-
-    def move_left(self, position, path):
-        row, col = position
-        new_pos = (row, col - 1)
-        if self.within_bounds(*new_pos):
-            self.add_fact(new_pos, path + [new_pos])
-
-    def move_right(self, position, path):
-        row, col = position
-        new_pos = (row, col + 1)
-        if self.within_bounds(*new_pos):
-            self.add_fact(new_pos, path + [new_pos])
-
-    def apply_rules(self):
-        self.add_fact(self.initial, [self.initial])
-
-        while True:
-            for position, path in self.facts.copy():
-                if self.is_goal(position):
-                    return list(path), self.explored_cost
-
-                for rule in self.rules:
-                    rule(position, list(path))
-
-            if not self.facts:
-                return None, self.explored_cost
+from tkinter import filedialog, messagebox
+
+from maze_ai.background import BackgroundSolve
+from maze_ai.forward_chaining import MazeProblem
+from maze_ai.components import ComponentIndex
+from maze_ai.grid_view import MAX_CELLS, GridView
+from maze_ai.mazefile import FILETYPES, load_blocked, save_maze
+from maze_ai.packed import EXTENSION
+from maze_ai.stats import SearchStats
+from maze_ai.stepping import SteppedSolve, frame_size
 
 
 class MazeApp:
@@ -80,11 +21,16 @@ class MazeApp:
         self.blocked_cells = set()
         self.start = None
         self.end = None
+        self.components = None  # ComponentIndex of the grid, kept up to date by toggle_block
+        self.stats = None  # SearchStats of the last search
+        self.job = None  # BackgroundSolve while a search runs
 
         self.page1 = tk.Frame(root)
         self.page2 = tk.Frame(root)
-        self.grid_frame = None
-        self.result_grid_frame = None
+        self.grid_canvas = None
+        self.grid_view = None
+        self.result_canvas = None
+        self.result_view = None
         self.create_page1()
 
     def create_page1(self):
@@ -99,7 +45,13 @@ class MazeApp:
         self.cols_entry.grid(row=0, column=3)
 
         create_grid_button = tk.Button(self.page1, text="Create Grid", command=self.create_grid)
-        create_grid_button.grid(row=1, column=0, columnspan=4, pady=10)
+        create_grid_button.grid(row=1, column=0, columnspan=2, pady=10)
+
+        open_button = tk.Button(self.page1, text="Open Maze...", command=self.open_maze)
+        open_button.grid(row=1, column=2, pady=10)
+
+        save_button = tk.Button(self.page1, text="Save Maze...", command=self.save_maze)
+        save_button.grid(row=1, column=3, pady=10)
 
         next_page_button = tk.Button(self.page1, text="Next", command=self.show_page2, state="disabled")
         next_page_button.grid(row=2, column=0, columnspan=4, pady=10)
@@ -110,31 +62,63 @@ class MazeApp:
             self.rows = int(self.rows_entry.get())
             self.cols = int(self.cols_entry.get())
 
-            if self.grid_frame:
-                self.grid_frame.destroy()
-            self.grid_frame = tk.Frame(self.page1)
-            self.grid_frame.grid(row=3, column=0, columnspan=4, pady=(10, 0))
+            if self.grid_canvas:
+                self.grid_canvas.destroy()
+            self.grid_canvas = tk.Canvas(self.page1)
+            self.grid_canvas.grid(row=3, column=0, columnspan=4, pady=(10, 0))
+            self.grid_canvas.bind("<Button-1>", self.on_grid_click)
 
             self.blocked_cells = set()
-            for r in range(self.rows):
-                for c in range(self.cols):
-                    label_text = f"({r},{c})"
-                    label = tk.Label(self.grid_frame, text=label_text, width=5, height=2, relief="solid", bg="lightblue")
-                    label.grid(row=r, column=c)
-                    label.bind("<Button-1>", lambda e, r=r, c=c: self.toggle_block(r, c))
+            self.components = ComponentIndex(self.generate_maze())
+            self.grid_view = GridView(self.grid_canvas, self.rows, self.cols)
 
             self.next_page_button.config(state="normal")
         except ValueError:
             messagebox.showerror("Invalid Input", "Please enter valid integers for rows and columns.")
 
+    def open_maze(self):
+        """Load a text or packed maze file into the grid."""
+        path = filedialog.askopenfilename(filetypes=FILETYPES)
+        if not path:
+            return
+        try:
+            rows, cols, blocked, start, goal = load_blocked(path, MAX_CELLS)
+        except (OSError, ValueError) as exc:
+            messagebox.showerror("Cannot Open Maze", str(exc))
+            return
+        for entry, value in ((self.rows_entry, rows), (self.cols_entry, cols)):
+            entry.delete(0, tk.END)
+            entry.insert(0, str(value))
+        self.create_grid()
+        self.blocked_cells = blocked
+        self.components = ComponentIndex(self.generate_maze())
+        self.grid_view.update(blocked)
+        self.start, self.end = start, goal  # Filled into page 2 when it is built
+
+    def save_maze(self):
+        """Save the grid, with the last start and goal, as a packed or text maze file."""
+        if self.grid_view is None:
+            messagebox.showinfo("No Grid", "Create a grid first.")
+            return
+        path = filedialog.asksaveasfilename(defaultextension=EXTENSION, filetypes=FILETYPES)
+        if path:
+            try:
+                save_maze(path, self.generate_maze(), self.start, self.end)
+            except OSError as exc:
+                messagebox.showerror("Cannot Save Maze", str(exc))
+
+    def on_grid_click(self, event):
+        cell = self.grid_view.cell_at(event.x, event.y)
+        if cell is not None:
+            self.toggle_block(*cell)
+
     def toggle_block(self, row, col):
-        label = self.grid_frame.grid_slaves(row=row, column=col)[0]
         if (row, col) not in self.blocked_cells:
-            label.config(bg="red")
             self.blocked_cells.add((row, col))
         else:
-            label.config(bg="lightblue")
             self.blocked_cells.remove((row, col))
+        self.grid_view.set_blocked((row, col), (row, col) in self.blocked_cells)
+        self.components.set_blocked((row, col), (row, col) in self.blocked_cells)
 
     def show_page2(self):
         self.page1.grid_forget()
@@ -155,9 +139,27 @@ class MazeApp:
         self.end_y_entry = tk.Entry(self.page2, width=5)
         self.end_x_entry.grid(row=1, column=1)
         self.end_y_entry.grid(row=1, column=2)
+        for entries, cell in (((self.start_x_entry, self.start_y_entry), self.start),
+                              ((self.end_x_entry, self.end_y_entry), self.end)):
+            for entry, value in zip(entries, cell or ()):
+                entry.insert(0, str(value))
 
-        find_path_button = tk.Button(self.page2, text="Find Path", command=self.find_path)
-        find_path_button.grid(row=2, column=0, columnspan=4, pady=10)
+        tk.Label(self.page2, text="Time budget (s):").grid(row=0, column=3, padx=10)
+        self.budget_entry = tk.Entry(self.page2, width=5)
+        self.budget_entry.insert(0, "30")
+        self.budget_entry.grid(row=1, column=3)
+
+        self.animate = tk.BooleanVar(value=False)
+        tk.Checkbutton(self.page2, text="Animate search", variable=self.animate).grid(row=1, column=4, padx=10)
+
+        self.find_path_button = tk.Button(self.page2, text="Find Path", command=self.find_path)
+        self.find_path_button.grid(row=2, column=0, columnspan=2, pady=10)
+
+        self.cancel_button = tk.Button(self.page2, text="Cancel", command=self.cancel_search, state="disabled")
+        self.cancel_button.grid(row=2, column=2, pady=10)
+
+        export_button = tk.Button(self.page2, text="Export Stats", command=self.export_stats)
+        export_button.grid(row=2, column=3, pady=10)
 
         self.result_text = tk.Text(self.page2, height=10, width=40)
         self.result_text.grid(row=3, column=0, columnspan=4, padx=10, pady=10)
@@ -165,9 +167,12 @@ class MazeApp:
         self.cost_label = tk.Label(self.page2, text="", font=("Arial", 12))
         self.cost_label.grid(row=4, column=0, columnspan=4, pady=5)
 
-        # Frame for dynamic grid (second page visualization)
-        self.result_grid_frame = tk.Frame(self.page2)
-        self.result_grid_frame.grid(row=5, column=0, columnspan=4, pady=10)
+        # Canvas for the solved grid (second page visualization)
+        if self.result_canvas:
+            self.result_canvas.destroy()
+        self.result_canvas = tk.Canvas(self.page2)
+        self.result_canvas.grid(row=5, column=0, columnspan=4, pady=10)
+        self.result_view = GridView(self.result_canvas, self.rows, self.cols)
 
     def generate_maze(self):
         maze = [[0] * self.cols for _ in range(self.rows)]
@@ -176,57 +181,109 @@ class MazeApp:
         return maze
 
     def find_path(self):
+        """Start the search on a worker thread; the window stays responsive meanwhile."""
         try:
             start_x = int(self.start_x_entry.get())
             start_y = int(self.start_y_entry.get())
             end_x = int(self.end_x_entry.get())
             end_y = int(self.end_y_entry.get())
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Please enter valid integers for start and goal positions.")
+            return
+        try:
+            budget = float(self.budget_entry.get())
+        except ValueError:
+            messagebox.showerror("Invalid Input", "Please enter a number of seconds for the time budget.")
+            return
 
-            self.start = (start_x, start_y)
-            self.end = (end_x, end_y)
-
-            maze = self.generate_maze()
-            problem = MazeProblem(maze, self.start, self.end)
-
-            solution_path, total_cost = problem.apply_rules()
+        self.start = (start_x, start_y)
+        self.end = (end_x, end_y)
 
+        if not self.components.connected(self.start, self.end):
+            # Different regions: every search would fail, so skip it
             self.result_text.delete(1.0, tk.END)
-            if solution_path:
-                path_display = ['({},{})'.format(pos[0], pos[1]) for pos in solution_path]
-                self.result_text.insert(tk.END, '\n'.join(path_display))
-
-                # Calculate optimized cost (steps in the path minus 1)
-                optimized_cost = len(solution_path) - 1
-                self.cost_label.config(
-                    text=f"Total explored cost: {total_cost}\nOptimized path cost: {optimized_cost}"
-                )
-                self.display_path_on_grid(solution_path)
-            else:
-                messagebox.showinfo("No Path", "No valid path found!")
-        except ValueError:
-            messagebox.showerror("Invalid Input", "Please enter valid integers for start and goal positions.")
+            self.cost_label.config(text="Start and goal are in separate regions.")
+            messagebox.showinfo("No Path", "No valid path found!")
+            return
+
+        problem = MazeProblem(self.generate_maze(), self.start, self.end)
+        stats = SearchStats("forward chaining")
+
+        view = self.result_view
+        view.clear_search()
+        if self.animate.get():
+            view.update(self.blocked_cells, (), self.start, self.end)
+            # Steps run on the Tk event loop, so each one is kept to a small slice of firings
+            steps = problem.apply_rules_steps(every=frame_size(self.rows * self.cols), stats=stats)
+            self.job = SteppedSolve(steps, budget).start()
+            on_progress = self.show_step
+        else:
+            self.job = BackgroundSolve(lambda progress: problem.apply_rules(stats=stats, trace=progress),
+                                       budget).start()
+            on_progress = self.show_progress
+        self.find_path_button.config(state="disabled")
+        self.cancel_button.config(state="normal")
+        self.job.poll(self.root, on_progress, lambda job: self.show_result(job, stats))
+
+    def cancel_search(self):
+        if self.job is not None:
+            self.job.cancel()
+
+    def show_progress(self, expanded):
+        self.cost_label.config(text=f"Searching... {expanded} nodes expanded")
+
+    def show_step(self, step):
+        self.result_view.show_step(step)
+        self.show_progress(step.expanded)
+
+    def show_result(self, job, stats):
+        """Show the finished search in the result text and grid."""
+        self.job = None
+        self.find_path_button.config(state="normal")
+        self.cancel_button.config(state="disabled")
+        if job.cancelled:
+            self.cost_label.config(text=f"{job.error} ({job.progress.expanded} nodes expanded)")
+            return
+        if job.error is not None:
+            messagebox.showerror("Search Failed", str(job.error))
+            return
+
+        solution_path, total_cost = job.result
+        stats.finish(solution_path, total_cost, job.seconds)
+        self.stats = stats
+
+        self.result_text.delete(1.0, tk.END)
+        if solution_path:
+            path_display = ['({},{})'.format(pos[0], pos[1]) for pos in solution_path]
+            self.result_text.insert(tk.END, '\n'.join(path_display))
+
+            # Calculate optimized cost (steps in the path minus 1)
+            optimized_cost = len(solution_path) - 1
+            self.cost_label.config(
+                text=f"Total explored cost: {total_cost}\nOptimized path cost: {optimized_cost}\n"
+                     f"{stats.summary()}"
+            )
+            self.display_path_on_grid(solution_path)
+        else:
+            self.cost_label.config(text=stats.summary())
+            messagebox.showinfo("No Path", "No valid path found!")
+
+    def export_stats(self):
+        """Save the statistics of the last search as a JSON file."""
+        if self.stats is None:
+            messagebox.showinfo("No Statistics", "Run a search first.")
+            return
+        path = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON files", "*.json")])
+        if path:
+            self.stats.save(path)
 
     def display_path_on_grid(self, path):
-        """Display the path on the grid, styled like the first page."""
-        if self.result_grid_frame:
-            for widget in self.result_grid_frame.winfo_children():
-                widget.destroy()
-
-        for r in range(self.rows):
-            for c in range(self.cols):
-                color = "red" if (r, c) in self.blocked_cells else "green" if (r, c) in path else "lightblue"
-                text = f"({r},{c})"
-                if (r, c) == self.start:
-                    color = "lightgreen"
-                    text = "Start"
-                elif (r, c) == self.end:
-                    color = "yellow"
-                    text = "End"
-                label = tk.Label(self.result_grid_frame, text=text, width=5, height=2, relief="solid", bg=color)
-                label.grid(row=r, column=c)
+        """Display the path on the grid, recoloring only the cells that changed."""
+        self.result_view.update(self.blocked_cells, path, self.start, self.end)
 
 
 # Initialize the Tkinter root and application
-root = tk.Tk()
-app = MazeApp(root)
-root.mainloop()
+if __name__ == "__main__":
+    root = tk.Tk()
+    app = MazeApp(root)
+    root.mainloop()
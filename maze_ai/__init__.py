@@ -0,0 +1,74 @@
+"""Headless maze solvers.
+
+The solver classes and functions in this package never import tkinter, so
+they can be used on machines without a display.  The GUI front ends live in
+the top-level scripts and import from here.
+"""
+
+from maze_ai.astar import MazeSolver, MultiTargetSolver
+from maze_ai.background import BackgroundSolve, SearchCancelled
+from maze_ai.components import ComponentIndex
+from maze_ai.graph import MazeGraph, MazeGrid, maze_graph
+from maze_ai.hpa import HierarchicalMap, HierarchicalSolver, hierarchical_map
+from maze_ai.incremental import IncrementalSolver
+from maze_ai.jps import JumpPointSolver
+from maze_ai.uninformed import (
+    MazeProblem, Node_Depth, bfs, bfs_steps, depth_limited_search, depth_limited_steps, iterative_deepening_search,
+    multi_source_bfs,
+)
+from maze_ai.wavefront import DistanceField, wavefront_bfs
+from maze_ai import backward_chaining, bidirectional_chaining, forward_chaining
+from maze_ai.mazefile import load_maze, parse_maze, save_maze
+from maze_ai.packed import PackedMaze, load_packed, save_packed
+from maze_ai.oracle import DistanceOracle, OracleCache, distance_oracle
+from maze_ai.runner import ALGORITHMS, solve, solve_with_stats
+from maze_ai.stats import SearchStats
+from maze_ai.stepping import SteppedSolve, run_steps
+from maze_ai.trace import TraceBuffer, TraceFile, read_trace
+
+__all__ = [
+    "ALGORITHMS",
+    "BackgroundSolve",
+    "ComponentIndex",
+    "DistanceField",
+    "DistanceOracle",
+    "HierarchicalMap",
+    "HierarchicalSolver",
+    "IncrementalSolver",
+    "JumpPointSolver",
+    "MazeGraph",
+    "MazeGrid",
+    "MazeProblem",
+    "MazeSolver",
+    "MultiTargetSolver",
+    "Node_Depth",
+    "OracleCache",
+    "PackedMaze",
+    "SearchCancelled",
+    "SearchStats",
+    "SteppedSolve",
+    "TraceBuffer",
+    "TraceFile",
+    "backward_chaining",
+    "bfs",
+    "bfs_steps",
+    "bidirectional_chaining",
+    "depth_limited_search",
+    "depth_limited_steps",
+    "distance_oracle",
+    "forward_chaining",
+    "hierarchical_map",
+    "iterative_deepening_search",
+    "load_maze",
+    "load_packed",
+    "maze_graph",
+    "multi_source_bfs",
+    "parse_maze",
+    "read_trace",
+    "run_steps",
+    "save_maze",
+    "save_packed",
+    "solve",
+    "solve_with_stats",
+    "wavefront_bfs",
+]
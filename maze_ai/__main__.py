@@ -0,0 +1,5 @@
+import sys
+
+from maze_ai.cli import main
+
+sys.exit(main())
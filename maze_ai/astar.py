@@ -0,0 +1,309 @@
+from array import array
+
+from maze_ai.graph import solver_graph
+from maze_ai.open_lists import BucketOpenList, HeapOpenList
+from maze_ai.stepping import Step
+from maze_ai.trace import GOAL
+
+
+class MazeSolver:
+    step_cost = 1  # Every move costs the same, so f-values are small integers
+
+    def __init__(self, maze, initial, goal, open_list=None, graph=None):
+        self.maze = maze
+        self.start = initial
+        self.goal = goal
+        self.rows = len(maze)
+        self.cols = len(maze[0])
+        self.open_list = open_list  # Open list class; None picks one from the cost model
+        self.graph = solver_graph(maze, graph)
+
+    def make_open_list(self):
+        """Create the open list for ``solve_a_star``.
+
+        Integer step costs give integer f-values, which a bucket queue handles
+        in O(1); any other cost model falls back to a binary heap.
+        """
+        if self.open_list is not None:
+            return self.open_list()
+        if isinstance(self.step_cost, int):
+            return BucketOpenList()
+        return HeapOpenList()
+
+    def heuristic(self, position):
+        """Calculate Manhattan distance heuristic."""
+        return abs(position[0] - self.goal[0]) + abs(position[1] - self.goal[1])
+
+    def start_cells(self):
+        """Cells ``solve_a_star`` starts from, all at cost 0."""
+        return [self.start]
+
+    def goal_cells(self):
+        """Cells that end ``solve_a_star`` when popped."""
+        return [self.goal]
+
+    def solve_a_star(self, stats=None, trace=None):
+        """Solve the maze using the A* algorithm.
+
+        ``stats`` (a ``SearchStats``) and ``trace`` (see ``maze_ai.trace``)
+        are optional.
+        """
+        open_set = self.make_open_list()
+        g_score = {}
+        for start in self.start_cells():
+            if start not in g_score:
+                open_set.push(0, start)
+                g_score[start] = 0
+        goals = set(self.goal_cells())
+        came_from = {}
+        explored = set()
+        successors = self.graph.successors
+        expanded = generated = 0
+        pushes = peak = len(open_set)
+
+        while open_set:
+            if len(open_set) > peak:
+                peak = len(open_set)
+            current = open_set.pop()
+
+            if current in goals:
+                path = self.reconstruct_path(came_from, current)
+                if trace is not None:
+                    trace.emit(GOAL, current)
+                break
+
+            explored.add(current)
+            neighbors = successors(current)
+            expanded += 1
+            generated += len(neighbors)
+            if trace is not None:
+                trace.expand(current, neighbors)
+
+            for neighbor in neighbors:
+                if neighbor not in explored:
+                    tentative_g_score = g_score[current] + self.step_cost
+
+                    if tentative_g_score < g_score.get(neighbor, float('inf')):
+                        came_from[neighbor] = current
+                        g_score[neighbor] = tentative_g_score
+                        f_score = tentative_g_score + self.heuristic(neighbor)
+                        open_set.push(f_score, neighbor)
+                        pushes += 1
+        else:
+            path = None
+
+        if stats is not None:
+            stats.record(expanded, generated, pushes, peak)
+        return path, len(explored)
+
+    def solve_a_star_steps(self, every=1000, stats=None):
+        """Stepping form of ``solve_a_star`` (see ``maze_ai.stepping``).
+
+        Yields a ``Step`` every ``every`` expansions and returns the same
+        ``(path, explored)``.  A step's frontier is the cells pushed since
+        the previous step, including re-pushes of cells with a better score.
+        """
+        open_set = self.make_open_list()
+        g_score = {}
+        frontier = []
+        for start in self.start_cells():
+            if start not in g_score:
+                open_set.push(0, start)
+                g_score[start] = 0
+                frontier.append(start)
+        goals = set(self.goal_cells())
+        came_from = {}
+        explored = set()
+        closed = []
+        successors = self.graph.successors
+        expanded = generated = 0
+        pushes = peak = len(open_set)
+        next_step = every
+        path = None
+
+        while open_set:
+            if len(open_set) > peak:
+                peak = len(open_set)
+            current = open_set.pop()
+
+            if current in goals:
+                path = self.reconstruct_path(came_from, current)
+                break
+
+            explored.add(current)
+            closed.append(current)
+            neighbors = successors(current)
+            expanded += 1
+            generated += len(neighbors)
+
+            for neighbor in neighbors:
+                if neighbor not in explored:
+                    tentative_g_score = g_score[current] + self.step_cost
+
+                    if tentative_g_score < g_score.get(neighbor, float('inf')):
+                        came_from[neighbor] = current
+                        g_score[neighbor] = tentative_g_score
+                        f_score = tentative_g_score + self.heuristic(neighbor)
+                        open_set.push(f_score, neighbor)
+                        frontier.append(neighbor)
+                        pushes += 1
+
+            if expanded == next_step:
+                yield Step(closed, frontier, expanded)
+                closed, frontier = [], []
+                next_step += every
+
+        yield Step(closed, frontier, expanded)
+        if stats is not None:
+            stats.record(expanded, generated, pushes, peak)
+        return path, len(explored)
+
+    def solve_a_star_flat(self, stats=None):
+        """Solve the maze with A* over a flat array grid.
+
+        Cells are encoded as ``row * cols + col``.  Scores and parents live in
+        preallocated arrays, the closed set is a bytearray and the open list
+        is a list of buckets of cell ints, one per f-value, popped last in,
+        first out like ``BucketOpenList``.  A move changes the Manhattan
+        heuristic by one, so a successor's f is its parent's f or two more
+        and the lowest bucket never goes back.  Stale entries are skipped,
+        so the path and explored count match ``solve_a_star`` with its
+        default open list.
+        """
+        rows, cols = self.rows, self.cols
+        size = rows * cols
+        goal_row, goal_col = self.goal
+        start = self.start[0] * cols + self.start[1]
+        goal = goal_row * cols + goal_col
+
+        maze = self.maze
+        closed = bytearray(size)
+        g_score = array('i', [size]) * size  # size is larger than any real g
+        parent = array('i', [-1]) * size
+        g_score[start] = 0
+
+        lowest = self.heuristic(self.start)
+        buckets = [[] for _ in range(lowest + 3)]
+        buckets[lowest].append(start)
+        bucket = buckets[lowest]
+        explored = popped = 0
+        pushes = peak = 1
+
+        while pushes > popped:
+            if pushes - popped > peak:
+                peak = pushes - popped
+            while not bucket:
+                lowest += 1
+                if lowest + 2 == len(buckets):
+                    buckets.append([])
+                bucket = buckets[lowest]
+            current = bucket.pop()
+            popped += 1
+
+            if current == goal:
+                break
+            if closed[current]:
+                continue
+
+            closed[current] = 1
+            explored += 1
+
+            row, col = divmod(current, cols)
+            line = maze[row]
+            g = g_score[current] + 1
+            h_row = abs(row - goal_row)
+            h_col = abs(col - goal_col)
+
+            if row > 0:
+                neighbor = current - cols
+                if not closed[neighbor] and g < g_score[neighbor] and not maze[row - 1][col]:
+                    g_score[neighbor] = g
+                    parent[neighbor] = current
+                    buckets[g + abs(row - 1 - goal_row) + h_col].append(neighbor)
+                    pushes += 1
+            if row < rows - 1:
+                neighbor = current + cols
+                if not closed[neighbor] and g < g_score[neighbor] and not maze[row + 1][col]:
+                    g_score[neighbor] = g
+                    parent[neighbor] = current
+                    buckets[g + abs(row + 1 - goal_row) + h_col].append(neighbor)
+                    pushes += 1
+            if col > 0:
+                neighbor = current - 1
+                if not closed[neighbor] and g < g_score[neighbor] and not line[col - 1]:
+                    g_score[neighbor] = g
+                    parent[neighbor] = current
+                    buckets[g + h_row + abs(col - 1 - goal_col)].append(neighbor)
+                    pushes += 1
+            if col < cols - 1:
+                neighbor = current + 1
+                if not closed[neighbor] and g < g_score[neighbor] and not line[col + 1]:
+                    g_score[neighbor] = g
+                    parent[neighbor] = current
+                    buckets[g + h_row + abs(col + 1 - goal_col)].append(neighbor)
+                    pushes += 1
+        else:
+            current = None
+
+        if stats is not None:
+            # Walls are only looked at for cells not reached yet, so only
+            # the neighbors that were pushed count as generated.
+            stats.record(explored, pushes - 1, pushes, peak)
+        if current is None:
+            return None, explored
+        return self.reconstruct_flat_path(parent, current), explored
+
+    def reconstruct_flat_path(self, parent, current):
+        """Reconstruct the path from flat cell indices stored in ``parent``."""
+        cols = self.cols
+        path = []
+        while current != -1:
+            path.append(divmod(current, cols))
+            current = parent[current]
+        path.reverse()
+        return path
+
+    def reconstruct_path(self, came_from, current):
+        """Reconstruct the path from the goal to the start."""
+        path = [current]
+        while current in came_from:
+            current = came_from[current]
+            path.append(current)
+        path.reverse()
+        return path
+
+
+class MultiTargetSolver(MazeSolver):
+    """A* from several sources to the nearest of several goals in one search.
+
+    Every source is seeded at cost 0 and the heuristic is the Manhattan
+    distance to the closest goal, which stays admissible, so the first goal
+    popped is the nearest one to any source.  Only ``solve_a_star`` and
+    ``solve_nearest`` handle several cells; the other solve methods use the
+    first source and goal.
+    """
+
+    def __init__(self, maze, sources, goals, open_list=None, graph=None):
+        self.sources = list(sources)
+        self.goals = list(goals)
+        super().__init__(maze, self.sources[0], self.goals[0], open_list, graph)
+
+    def heuristic(self, position):
+        """Manhattan distance to the closest goal."""
+        row, col = position
+        return min(abs(row - goal_row) + abs(col - goal_col) for goal_row, goal_col in self.goals)
+
+    def start_cells(self):
+        return self.sources
+
+    def goal_cells(self):
+        return self.goals
+
+    def solve_nearest(self, stats=None, trace=None):
+        """Return ``(target, path, explored)`` for the nearest goal.
+
+        ``path`` runs from the closest source to ``target``; both are None
+        when no goal can be reached.
+        """
+        path, explored = self.solve_a_star(stats, trace)
+        return (path[-1] if path else None), path, explored
@@ -0,0 +1,123 @@
+"""Run a solve on a worker thread so a GUI stays responsive.
+
+A ``BackgroundSolve`` calls ``target(progress)`` on a daemon thread, where
+``progress`` is a ``Progress`` to pass to the solver as its ``trace``.  The
+solver then reports every expansion to it, which keeps a running count and
+raises ``SearchCancelled`` inside the solver once the solve is cancelled or
+its time budget runs out.
+
+Tk is not thread-safe, so the worker never touches widgets: ``poll`` checks
+the job from the Tk event loop with ``after()`` and hands the finished job
+back there.  This module does not import tkinter.
+"""
+
+import threading
+import time
+
+from maze_ai.trace import EXPAND, Trace
+
+POLL_MS = 100  # How often poll() checks a running solve
+
+
+class SearchCancelled(Exception):
+    """Raised inside a solver whose ``Progress`` was cancelled or ran out of time."""
+
+
+class Progress(Trace):
+    """Counts expansions and stops the search on request.
+
+    The cancel flag is checked on every expansion and the clock every
+    ``check_every`` expansions.  ``budget`` is in seconds; None means no
+    limit.
+    """
+
+    def __init__(self, budget=None, check_every=256):
+        self.budget = budget
+        self.check_every = check_every
+        self.deadline = None
+        self.expanded = 0
+        self.cancelled = False
+        self.timed_out = False
+
+    def start(self):
+        """Start the budget clock."""
+        if self.budget is not None:
+            self.deadline = time.monotonic() + self.budget
+
+    def cancel(self):
+        self.cancelled = True
+
+    def check(self):
+        """Raise ``SearchCancelled`` if cancelled or past the budget."""
+        if self.cancelled:
+            raise SearchCancelled("Search cancelled")
+        if self.deadline is not None and time.monotonic() > self.deadline:
+            self.timed_out = True
+            raise SearchCancelled(f"Search stopped after its {self.budget:g}s time budget")
+
+    def emit(self, kind, cell):
+        if kind != EXPAND:
+            return
+        self.expanded += 1
+        if self.cancelled or (self.deadline is not None and not self.expanded % self.check_every):
+            self.check()
+
+    def expand(self, cell, successors):
+        # Generated cells are not counted, so skip the per-successor events
+        self.emit(EXPAND, cell)
+
+
+class BackgroundSolve:
+    """Runs ``target(progress)`` on a daemon thread.
+
+    When the thread is done, ``result`` holds what ``target`` returned or
+    ``error`` the exception it raised (a ``SearchCancelled`` after
+    ``cancel`` or a blown budget), and ``seconds`` its wall time.
+    """
+
+    def __init__(self, target, budget=None):
+        self.target = target
+        self.progress = Progress(budget)
+        self.result = None
+        self.error = None
+        self.seconds = None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self):
+        self.progress.start()
+        self.thread.start()
+        return self
+
+    def run(self):
+        began = time.perf_counter()
+        try:
+            self.result = self.target(self.progress)
+        except Exception as error:
+            self.error = error
+        self.seconds = time.perf_counter() - began
+
+    @property
+    def done(self):
+        return not self.thread.is_alive()
+
+    @property
+    def cancelled(self):
+        return isinstance(self.error, SearchCancelled)
+
+    def cancel(self):
+        """Ask the solver to stop at its next expansion."""
+        self.progress.cancel()
+
+    def poll(self, widget, on_progress, on_done, interval=POLL_MS):
+        """Report progress until the job finishes, from the widget's event loop.
+
+        Every ``interval`` ms ``on_progress(expanded)`` is called while the
+        job runs; ``on_done(job)`` is called once when it has finished.
+        """
+        def check():
+            if self.done:
+                on_done(self)
+            else:
+                on_progress(self.progress.expanded)
+                widget.after(interval, check)
+        widget.after(interval, check)
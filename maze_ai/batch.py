@@ -0,0 +1,178 @@
+"""Solve many (start, goal) queries on one maze with a process pool.
+
+Example::
+
+    python -m maze_ai.batch big.mzb queries.txt -a bfs -j 32 -o results.jsonl
+
+``solve_batch`` copies the maze once into a shared memory block, in the
+packed layout of ``maze_ai.packed``, and starts the pool.  Each worker
+attaches to the block once, when it starts, and solves every query it is
+sent on a ``PackedMaze`` over it, so a task is only the query and its index:
+the maze is never pickled.  Results are yielded in completion order.  A
+query with a cell off the grid or on a wall, or one whose solve fails, gets
+an error instead of stopping the batch.
+
+The per-query engines are ``MazeSolver.solve_a_star`` and ``bfs``.
+"""
+
+import argparse
+import json
+import os
+import sys
+from multiprocessing import Pool
+from multiprocessing.shared_memory import SharedMemory
+
+from maze_ai.astar import MazeSolver
+from maze_ai.cli import cell_error, parse_cell
+from maze_ai.mazefile import load_maze
+from maze_ai.packed import pack_maze, read_packed
+from maze_ai.uninformed import bfs
+
+ENGINES = ("astar", "bfs")
+
+worker = None  # The BatchWorker of a pool process, set by start_worker
+
+
+class SharedMaze:
+    """A maze copied into a new shared memory block.
+
+    Use as a context manager, or call ``close`` to free the block.
+    """
+
+    def __init__(self, maze):
+        data = pack_maze(maze)
+        self.shm = SharedMemory(create=True, size=len(data))
+        self.shm.buf[:len(data)] = data
+        self.name = self.shm.name
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        self.shm.close()
+        self.shm.unlink()
+
+
+class BatchWorker:
+    """Per-process state: the shared maze and the engine to run on it.
+
+    Only the maze view is kept between queries; each query's search state
+    is allocated fresh by ``solve_a_star`` or ``bfs``.
+    """
+
+    def __init__(self, name, algorithm):
+        self.shm = SharedMemory(name=name)
+        self.maze = read_packed(self.shm.buf)[0]
+        self.algorithm = algorithm
+
+    def solve(self, start, goal):
+        if self.algorithm == "astar":
+            return MazeSolver(self.maze, start, goal).solve_a_star()
+        return bfs(self.maze, start, goal)
+
+
+def start_worker(name, algorithm):
+    global worker
+    worker = BatchWorker(name, algorithm)
+
+
+def solve_query(task):
+    """Solve one query in a worker and return ``(index, path, explored, error)``."""
+    index, start, goal = task
+    maze = worker.maze
+    error = cell_error(maze, "Start", start) or cell_error(maze, "Goal", goal)
+    if error is not None:
+        return index, None, 0, error
+    try:
+        path, explored = worker.solve(start, goal)
+    except Exception as exc:  # One bad query must not take down the pool
+        return index, None, 0, f"{type(exc).__name__}: {exc}"
+    return index, path, explored, None
+
+
+def solve_batch(maze, queries, algorithm="astar", processes=None, chunksize=None):
+    """Solve ``(start, goal)`` queries and yield ``(index, path, explored, error)`` as each finishes.
+
+    ``index`` is the query's position in ``queries``.  ``error`` is None, or
+    a message when the query could not be solved; ``path`` is then None.  ``processes``
+    defaults to the CPU count.  Queries are sent in chunks of ``chunksize``,
+    by default enough for about four chunks per process, so the pool spends
+    its time solving rather than passing messages.
+    """
+    if algorithm not in ENGINES:
+        raise ValueError(f"Unknown batch algorithm {algorithm!r}; choose from {', '.join(ENGINES)}")
+    tasks = [(index, tuple(start), tuple(goal)) for index, (start, goal) in enumerate(queries)]
+    processes = processes or os.cpu_count() or 1
+    if chunksize is None:
+        chunksize = max(1, len(tasks) // (4 * processes))
+    with SharedMaze(maze) as shared, Pool(processes, start_worker, (shared.name, algorithm)) as pool:
+        yield from pool.imap_unordered(solve_query, tasks, chunksize)
+
+
+def read_queries(path):
+    """Read one ``ROW,COL ROW,COL`` query per line; blank and ``;`` lines are skipped."""
+    queries = []
+    with open(path) as f:
+        for number, line in enumerate(f, 1):
+            line = line.strip()
+            if not line or line.startswith(";"):
+                continue
+            try:
+                start, goal = line.split()
+                queries.append((parse_cell(start), parse_cell(goal)))
+            except (ValueError, argparse.ArgumentTypeError):
+                raise ValueError(f"{path}:{number}: expected ROW,COL ROW,COL, got {line!r}") from None
+    return queries
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="maze_ai.batch",
+                                     description="Solve many queries on one maze in parallel and write JSON lines.")
+    parser.add_argument("maze", help="text or packed maze file")
+    parser.add_argument("queries", help="file with one ROW,COL ROW,COL query per line")
+    parser.add_argument("-a", "--algorithm", choices=ENGINES, default="astar", help="engine (default: astar)")
+    parser.add_argument("-j", "--processes", type=int, help="worker processes (default: CPU count)")
+    parser.add_argument("--chunksize", type=int, help="queries sent to a worker at a time")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        maze = load_maze(args.maze)[0]
+        queries = read_queries(args.queries)
+    except (OSError, ValueError) as exc:
+        print(exc, file=sys.stderr)
+        return 1
+
+    out = open(args.output, "w") if args.output else sys.stdout
+    failures = 0
+    try:
+        for index, path, explored, error in solve_batch(maze, queries, args.algorithm, args.processes,
+                                                        args.chunksize):
+            start, goal = queries[index]
+            if error is not None:
+                failures += 1
+                record = {"query": index, "start": list(start), "goal": list(goal), "error": error}
+            else:
+                record = {
+                    "query": index,
+                    "start": list(start),
+                    "goal": list(goal),
+                    "path": [list(cell) for cell in path] if path else None,
+                    "path_cost": len(path) - 1 if path else None,
+                    "explored": explored,
+                }
+            out.write(json.dumps(record) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
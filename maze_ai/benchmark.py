@@ -0,0 +1,290 @@
+"""Benchmark every solver on a fixed, seeded corpus of mazes.
+
+Example::
+
+    python -m maze_ai.benchmark -o results.json
+    python -m maze_ai.benchmark --sizes 10 100 --repeat 3 --baseline results.json
+
+Each maze family is generated from ``random.Random`` seeded with the corpus
+seed, the family and the size, so the same arguments always give the same
+mazes.  For every solve the wall time, the peak memory allocated by the
+solver, the explored count and the path cost are recorded, and the path is
+checked against the BFS distance from start to goal.  Results are written as
+one JSON document; ``--baseline`` compares them with an earlier run and exits
+with status 1 when something regressed.
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+
+from maze_ai.runner import ALGORITHMS, solve
+from maze_ai.wavefront import DistanceField
+
+SIZES = [10, 30, 100, 300, 1000, 2000]
+
+# Largest maze side each algorithm is run on.  IDS repeats its passes once
+# per depth level and the one-directional chaining engines rescan every fact
+# each round, so they would take hours on the larger sizes.
+MAX_SIZE = {
+    "ids": 30,
+    "forward": 100,
+    "backward": 100,
+}
+
+# Slowdown over the baseline time that counts as a regression; solves faster
+# than MIN_SECONDS are too noisy to compare.
+TIME_TOLERANCE = 1.25
+MIN_SECONDS = 0.005
+
+
+def open_field(rng, size):
+    return [[0] * size for _ in range(size)]
+
+
+def random_obstacles(density):
+    """Block each cell with probability ``density``.
+
+    The cells next to the start and goal corners are kept free, so the
+    endpoints are not trivially boxed in.
+    """
+    def build(rng, size):
+        maze = [[1 if rng.random() < density else 0 for _ in range(size)] for _ in range(size)]
+        last = size - 1
+        for r, c in ((0, 1), (1, 0), (1, 1), (last - 1, last), (last, last - 1), (last - 1, last - 1)):
+            maze[r][c] = 0
+        return maze
+    return build
+
+
+def perfect_maze(rng, size):
+    """Carve a spanning tree of corridors with an iterative backtracker.
+
+    Cells with even row and column are rooms; walls between neighboring
+    rooms are knocked down, so every room is reachable by exactly one path.
+    """
+    maze = [[1] * size for _ in range(size)]
+    maze[0][0] = 0
+    stack = [(0, 0)]
+    while stack:
+        row, col = stack[-1]
+        rooms = [(row + dr, col + dc, row + dr // 2, col + dc // 2)
+                 for dr, dc in ((-2, 0), (2, 0), (0, -2), (0, 2))
+                 if 0 <= row + dr < size and 0 <= col + dc < size and maze[row + dr][col + dc]]
+        if not rooms:
+            stack.pop()
+            continue
+        r, c, wall_r, wall_c = rng.choice(rooms)
+        maze[wall_r][wall_c] = 0
+        maze[r][c] = 0
+        stack.append((r, c))
+    return maze
+
+
+def spiral(rng, size):
+    """Nested square walls, each with one gap on alternating sides.
+
+    The path from the corner to the center winds through every ring.
+    """
+    maze = [[0] * size for _ in range(size)]
+    ring = 0
+    for inset in range(1, size // 2, 2):
+        far = size - 1 - inset
+        if far - inset < 2:
+            break
+        for i in range(inset, far + 1):
+            maze[inset][i] = maze[far][i] = maze[i][inset] = maze[i][far] = 1
+        gap = rng.randrange(inset + 1, far)
+        if ring % 2:
+            maze[far][gap] = 0
+        else:
+            maze[inset][gap] = 0
+        ring += 1
+    return maze
+
+
+def unreachable(rng, size):
+    """Random obstacles with the goal corner walled off."""
+    maze = random_obstacles(0.2)(rng, size)
+    last = size - 1
+    maze[last - 1][last] = maze[last][last - 1] = maze[last - 1][last - 1] = 1
+    return maze
+
+
+FAMILIES = {
+    "open": open_field,
+    "random-10": random_obstacles(0.10),
+    "random-25": random_obstacles(0.25),
+    "random-35": random_obstacles(0.35),
+    "perfect": perfect_maze,
+    "spiral": spiral,
+    "unreachable": unreachable,
+}
+
+
+def make_case(family, size, seed=0):
+    """Build one corpus maze and return ``(maze, start, goal)``.
+
+    The start is the top-left corner and the goal the bottom-right corner,
+    except for spirals whose goal is the center.
+    """
+    rng = random.Random(f"{seed}:{family}:{size}")
+    maze = FAMILIES[family](rng, size)
+    start = (0, 0)
+    if family == "spiral":
+        goal = (size // 2, size // 2)
+    elif family == "perfect":
+        goal = ((size - 1) // 2 * 2, (size - 1) // 2 * 2)
+    else:
+        goal = (size - 1, size - 1)
+    maze[start[0]][start[1]] = 0
+    maze[goal[0]][goal[1]] = 0
+    return maze, start, goal
+
+
+def valid_path(maze, path, start, goal):
+    """Check that ``path`` walks from start to goal through free cells."""
+    if path[0] != start or path[-1] != goal:
+        return False
+    for (r1, c1), (r2, c2) in zip(path, path[1:]):
+        if abs(r1 - r2) + abs(c1 - c2) != 1:
+            return False
+    return all(0 <= r < len(maze) and 0 <= c < len(maze[0]) and maze[r][c] == 0 for r, c in path)
+
+
+def measure(maze, start, goal, algorithm, repeat=1, memory=True):
+    """Solve one case and return ``(path, explored, seconds, peak_kib)``.
+
+    ``seconds`` is the best of ``repeat`` untraced runs.  Peak memory comes
+    from one extra run under ``tracemalloc``, which would distort the timing.
+    """
+    seconds = None
+    for _ in range(repeat):
+        began = time.perf_counter()
+        path, explored = solve(maze, start, goal, algorithm)
+        elapsed = time.perf_counter() - began
+        seconds = elapsed if seconds is None else min(seconds, elapsed)
+
+    peak_kib = None
+    if memory:
+        tracemalloc.start()
+        try:
+            solve(maze, start, goal, algorithm)
+            peak_kib = tracemalloc.get_traced_memory()[1] // 1024
+        finally:
+            tracemalloc.stop()
+    return path, explored, seconds, peak_kib
+
+
+def run(algorithms=None, families=None, sizes=None, seed=0, repeat=1, memory=True, progress=None):
+    """Run the benchmark and return a list of result records."""
+    algorithms = algorithms or list(ALGORITHMS)
+    families = families or list(FAMILIES)
+    sizes = sizes or SIZES
+    records = []
+    for size in sizes:
+        for family in families:
+            maze, start, goal = make_case(family, size, seed)
+            optimal_cost = DistanceField(maze, start, goal).distance(goal)
+            for algorithm in algorithms:
+                if size > MAX_SIZE.get(algorithm, size):
+                    continue
+                path, explored, seconds, peak_kib = measure(maze, start, goal, algorithm, repeat, memory)
+                path_cost = len(path) - 1 if path else None
+                if path is None:
+                    optimal = optimal_cost is None
+                else:
+                    optimal = path_cost == optimal_cost and valid_path(maze, path, start, goal)
+                record = {
+                    "case": f"{family}/{size}",
+                    "family": family,
+                    "size": size,
+                    "algorithm": algorithm,
+                    "seconds": round(seconds, 6),
+                    "peak_kib": peak_kib,
+                    "explored": explored,
+                    "path_cost": path_cost,
+                    "optimal_cost": optimal_cost,
+                    "optimal": optimal,
+                }
+                records.append(record)
+                if progress:
+                    progress(record)
+    return records
+
+
+def compare(records, baseline, tolerance=TIME_TOLERANCE):
+    """Compare records with a baseline run and return a list of regressions.
+
+    A solve regresses when it is slower than ``tolerance`` times the
+    baseline, explores more cells, or loses optimality.
+    """
+    previous = {(r["case"], r["algorithm"]): r for r in baseline}
+    regressions = []
+    for record in records:
+        old = previous.get((record["case"], record["algorithm"]))
+        if old is None:
+            continue
+        name = f"{record['algorithm']} on {record['case']}"
+        if record["seconds"] > max(old["seconds"] * tolerance, MIN_SECONDS):
+            regressions.append(f"{name}: {old['seconds']:.4f}s -> {record['seconds']:.4f}s")
+        if record["explored"] > old["explored"]:
+            regressions.append(f"{name}: explored {old['explored']} -> {record['explored']}")
+        if old["optimal"] and not record["optimal"]:
+            regressions.append(f"{name}: path is no longer optimal")
+    return regressions
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="maze_ai.benchmark", description="Benchmark the maze solvers.")
+    parser.add_argument("-a", "--algorithm", action="append", choices=sorted(ALGORITHMS),
+                        help="algorithm to run (repeatable, default: all)")
+    parser.add_argument("-f", "--family", action="append", choices=sorted(FAMILIES),
+                        help="maze family to run (repeatable, default: all)")
+    parser.add_argument("--sizes", type=int, nargs="+", help=f"maze sides (default: {' '.join(map(str, SIZES))})")
+    parser.add_argument("--seed", type=int, default=0, help="corpus seed (default: 0)")
+    parser.add_argument("--repeat", type=int, default=1, help="timed runs per solve, best is kept (default: 1)")
+    parser.add_argument("--no-memory", action="store_true", help="skip the traced run that measures peak memory")
+    parser.add_argument("--baseline", help="earlier results file to compare against")
+    parser.add_argument("--tolerance", type=float, default=TIME_TOLERANCE,
+                        help=f"allowed slowdown over the baseline (default: {TIME_TOLERANCE})")
+    parser.add_argument("-o", "--output", help="results file (default: stdout)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+
+    def progress(record):
+        print(f"{record['case']:>18} {record['algorithm']:<14} {record['seconds']:10.4f}s "
+              f"explored={record['explored']} optimal={record['optimal']}", file=sys.stderr)
+
+    records = run(args.algorithm, args.family, args.sizes, args.seed, args.repeat, not args.no_memory, progress)
+    results = {
+        "seed": args.seed,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "records": records,
+    }
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=1)
+    else:
+        json.dump(results, sys.stdout, indent=1)
+        sys.stdout.write("\n")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            regressions = compare(records, json.load(f)["records"], args.tolerance)
+        for line in regressions:
+            print("REGRESSION", line, file=sys.stderr)
+        return 1 if regressions else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,77 @@
+from maze_ai import backward_chaining, forward_chaining
+from maze_ai.trace import GOAL
+
+
+class MazeProblem:
+    """Forward and backward chaining run together until their facts meet.
+
+    The two engines take turns deriving one round of facts from their last
+    delta.  As soon as a round derives a position the other side already
+    knows, the two half-paths are joined at that position.
+    """
+
+    def __init__(self, maze, initial, goal, graph=None):
+        self.maze = maze
+        self.initial = initial
+        self.goal = goal
+        self.forward = forward_chaining.MazeProblem(maze, initial, goal, graph)
+        self.backward = backward_chaining.MazeProblem(maze, initial, goal, graph)
+        self.rounds = 0
+        self.rule_firings = 0
+        self.peak_frontier = 0  # Largest pair of deltas waiting to be fired
+
+    @property
+    def explored_cost(self):
+        return self.forward.explored_cost + self.backward.explored_cost
+
+    def join_paths(self, meeting):
+        """Return the start-to-goal path through the shared fact ``meeting``."""
+        head = self.forward.facts.path(meeting)
+        tail = self.backward.facts.path(meeting)
+        return head + tail[-2::-1]
+
+    def apply_rules(self, stats=None, trace=None):
+        self.forward.trace = self.backward.trace = trace
+        try:
+            result = self.meet_in_the_middle()
+        finally:
+            self.forward.trace = self.backward.trace = None
+        if trace is not None and result[0] is not None:
+            trace.emit(GOAL, self.goal)
+        if stats is not None:
+            generated = self.forward.generated + self.backward.generated
+            stats.record(self.rule_firings, generated, self.explored_cost, self.peak_frontier, self.rounds)
+        return result
+
+    def meet_in_the_middle(self):
+        """Alternate forward and backward rounds until the facts meet."""
+        self.forward.add_fact(self.initial)
+        self.backward.add_fact(self.goal)
+        if self.initial == self.goal:
+            return [self.initial], self.explored_cost
+
+        deltas = {
+            self.forward: self.forward.take_delta(),
+            self.backward: self.backward.take_delta(),
+        }
+        side, other = self.forward, self.backward
+
+        while deltas[side] and deltas[other]:
+            self.rounds += 1
+            self.peak_frontier = max(self.peak_frontier, len(deltas[side]) + len(deltas[other]))
+            for position in deltas[side]:
+                for rule in side.rules:
+                    self.rule_firings += 1
+                    rule(position)
+
+            deltas[side] = side.take_delta()
+            # Every new fact on this side is one step deeper, so the best
+            # meeting point is the one closest to the other side's root.
+            meetings = [position for position in deltas[side] if position in other.facts]
+            if meetings:
+                best = min(meetings, key=lambda position: len(other.facts.path(position)))
+                return self.join_paths(best), self.explored_cost
+
+            side, other = other, side
+
+        return None, self.explored_cost
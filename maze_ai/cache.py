@@ -0,0 +1,64 @@
+"""Caches of objects built from a maze, and the hook that invalidates them.
+
+Mazes are plain nested lists, so an edit cannot be detected cheaply.  Code
+that edits a maze in place calls ``maze_changed(maze)`` afterwards, which
+drops what every ``MazeCache`` built from it; ``IncrementalSolver`` and
+``HierarchicalMap`` do so for their own edits.
+"""
+
+import weakref
+from collections import OrderedDict
+
+caches = weakref.WeakSet()  # Every MazeCache, for maze_changed
+
+
+class MazeCache:
+    """Least-recently-used cache of objects built from a maze.
+
+    Entries are keyed by the identity of the maze object plus any extra key
+    parts, and built with ``build(maze, *key)`` on a miss.  After an edit to
+    a cached maze, ``maze_changed(maze)`` drops its entries.
+    """
+
+    def __init__(self, build, maxsize=32):
+        self.build = build
+        self.maxsize = maxsize
+        self.entries = OrderedDict()  # (id(maze), *key) -> (maze, value)
+        self.hits = 0
+        self.misses = 0
+        caches.add(self)
+
+    def __len__(self):
+        return len(self.entries)
+
+    def get(self, maze, *key):
+        """Return the cached value for ``(maze, *key)``, building it on a miss."""
+        full_key = (id(maze),) + key
+        entry = self.entries.get(full_key)
+        # Entries hold a reference to their maze, so its id cannot be reused
+        # by another object while the entry is alive.
+        if entry is not None and entry[0] is maze:
+            self.entries.move_to_end(full_key)
+            self.hits += 1
+            return entry[1]
+
+        self.misses += 1
+        value = self.build(maze, *key)
+        self.entries[full_key] = (maze, value)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+        return value
+
+    def invalidate(self, maze):
+        """Drop every entry built from ``maze``; call this after editing it."""
+        for key in [key for key, (cached, _) in self.entries.items() if cached is maze]:
+            del self.entries[key]
+
+    def clear(self):
+        self.entries.clear()
+
+
+def maze_changed(maze):
+    """Drop the entries built from ``maze`` in every ``MazeCache``; call after editing it."""
+    for cache in list(caches):
+        cache.invalidate(maze)
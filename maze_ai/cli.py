@@ -0,0 +1,180 @@
+"""Batch command line solver.
+
+Example::
+
+    python -m maze_ai mazes/*.txt -a astar -a bfs -o results.jsonl
+
+Each maze file is solved with every requested algorithm and one JSON object
+per solve is written to the output (stdout by default).  Maze files are text
+or bit-packed (see ``maze_ai.packed``); packed ones are solved straight from
+the mapped file.
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+from maze_ai.components import ComponentIndex
+from maze_ai.mazefile import load_maze
+from maze_ai.graph import maze_graph
+from maze_ai.hpa import HierarchicalMap
+from maze_ai.runner import ALGORITHMS, GRAPH_ALGORITHMS, TRACE_ALGORITHMS, solve, solve_with_stats
+from maze_ai.trace import TraceFile
+
+
+def parse_cell(text):
+    """Parse ``"row,col"`` into a ``(row, col)`` tuple."""
+    try:
+        row, col = text.split(",")
+        return int(row), int(col)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected ROW,COL, got {text!r}") from None
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="maze_ai", description="Solve maze files and write JSON lines.")
+    parser.add_argument("files", nargs="+", help="text or packed maze files to solve")
+    parser.add_argument("-a", "--algorithm", action="append", choices=sorted(ALGORITHMS),
+                        help="algorithm to run (repeatable, default: astar)")
+    parser.add_argument("--start", type=parse_cell, help="start cell ROW,COL (overrides S in the file)")
+    parser.add_argument("--goal", type=parse_cell, help="goal cell ROW,COL (overrides G in the file)")
+    parser.add_argument("--limit", type=int, default=50, help="depth limit for dls (default: 50)")
+    parser.add_argument("--semi-naive", action="store_true",
+                        help="use delta-driven evaluation for forward chaining")
+    parser.add_argument("--index", action="store_true",
+                        help="build the neighbor index once per maze and share it between algorithms")
+    parser.add_argument("--components", action="store_true",
+                        help="label the connected regions once per maze and answer goals outside the "
+                             "start's region without searching")
+    parser.add_argument("--hpa-map", metavar="FILE",
+                        help="for hpa, load the hierarchical map saved in FILE, or build it and save it "
+                             "there if FILE does not exist (one maze file only)")
+    parser.add_argument("--stats", action="store_true",
+                        help="add the solver's search statistics to each record")
+    parser.add_argument("--memory", action="store_true",
+                        help="with --stats, also trace peak memory (slows the solve)")
+    parser.add_argument("--trace-dir",
+                        help="write a search-event trace per solve to DIR/<maze>.<algorithm>.trace "
+                             "(replay with python -m maze_ai.replay)")
+    parser.add_argument("-o", "--output", help="output file (default: stdout)")
+    return parser
+
+
+def cell_error(maze, name, cell):
+    """Return why ``cell`` cannot be a start or goal of ``maze``, or None if it can."""
+    rows, cols = len(maze), len(maze[0])
+    row, col = cell
+    if not (0 <= row < rows and 0 <= col < cols):
+        return f"{name} {row},{col} is outside the {rows}x{cols} maze"
+    if maze[row][col]:
+        return f"{name} {row},{col} is a blocked cell"
+    return None
+
+
+def load_hierarchical_map(path, maze):
+    """Load the HPA map saved at ``path``, or build one for ``maze`` and save it there."""
+    if os.path.exists(path):
+        return HierarchicalMap.load(maze, path)
+    hmap = HierarchicalMap(maze).build()
+    hmap.save(path)
+    return hmap
+
+
+def solve_file(path, algorithms, start=None, goal=None, limit=50, semi_naive=False, index=False,
+               stats=False, memory=False, trace_dir=None, components=False, hpa_map=None):
+    """Yield one result record per algorithm for the maze file at ``path``."""
+    try:
+        maze, file_start, file_goal = load_maze(path)
+    except (OSError, ValueError) as exc:
+        yield {"file": path, "error": str(exc)}
+        return
+
+    start = start or file_start
+    goal = goal or file_goal
+    if start is None or goal is None:
+        yield {"file": path, "error": "Maze has no start or goal"}
+        return
+    error = cell_error(maze, "Start", start) or cell_error(maze, "Goal", goal)
+    if error is not None:
+        yield {"file": path, "error": error}
+        return
+
+    graph = maze_graph(maze) if index else None
+    components = ComponentIndex(maze) if components else None
+    hmap = None
+    if hpa_map is not None and "hpa" in algorithms:
+        try:
+            hmap = load_hierarchical_map(hpa_map, maze)
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            yield {"file": path, "error": f"cannot use HPA map {hpa_map}: {exc}"}
+            return
+    for algorithm in algorithms:
+        options = {"components": components}
+        if graph is not None and algorithm in GRAPH_ALGORITHMS:
+            options["graph"] = graph
+        if algorithm == "dls":
+            options["limit"] = limit
+        elif algorithm == "forward":
+            options["semi_naive"] = semi_naive
+        elif algorithm == "hpa" and hmap is not None:
+            options["hmap"] = hmap
+        trace_path = None
+        if trace_dir is not None and algorithm in TRACE_ALGORITHMS:
+            stem = os.path.splitext(os.path.basename(path))[0]
+            trace_path = os.path.join(trace_dir, f"{stem}.{algorithm}.trace")
+            options["trace"] = TraceFile(trace_path)
+        try:
+            if stats:
+                path_cells, search_stats = solve_with_stats(maze, start, goal, algorithm, memory, **options)
+                explored, elapsed = search_stats.explored, search_stats.seconds
+            else:
+                began = time.perf_counter()
+                path_cells, explored = solve(maze, start, goal, algorithm, **options)
+                elapsed = time.perf_counter() - began
+        finally:
+            if trace_path is not None:
+                options["trace"].close()
+        record = {
+            "file": path,
+            "algorithm": algorithm,
+            "start": list(start),
+            "goal": list(goal),
+            "path": [list(cell) for cell in path_cells] if path_cells else None,
+            "path_cost": len(path_cells) - 1 if path_cells else None,
+            "explored": explored,
+            "seconds": round(elapsed, 6),
+        }
+        if stats:
+            record["stats"] = search_stats.to_dict()
+        if trace_path is not None:
+            record["trace"] = trace_path
+        yield record
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    algorithms = args.algorithm or ["astar"]
+    if args.hpa_map is not None and len(args.files) > 1:
+        # A saved map only fits the maze it was built from
+        print("maze_ai: --hpa-map takes a single maze file", file=sys.stderr)
+        return 1
+    if args.trace_dir is not None:
+        try:
+            os.makedirs(args.trace_dir, exist_ok=True)
+        except OSError as exc:
+            print(f"maze_ai: cannot create trace directory: {exc}", file=sys.stderr)
+            return 1
+    out = open(args.output, "w") if args.output else sys.stdout
+    failures = 0
+    try:
+        for path in args.files:
+            for record in solve_file(path, algorithms, args.start, args.goal, args.limit, args.semi_naive, args.index,
+                                     args.stats, args.memory, args.trace_dir, args.components, args.hpa_map):
+                failures += "error" in record
+                out.write(json.dumps(record) + "\n")
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return 1 if failures else 0
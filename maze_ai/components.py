@@ -0,0 +1,177 @@
+"""Connected regions of free cells, for instant "no path" answers.
+
+A ``ComponentIndex`` labels the free cells with a union-find over their
+4-neighbor links.  Two cells are connected exactly when they have the same
+root, so ``connected(start, goal)`` answers in near-constant time, and a
+query whose ends are in different regions needs no search at all.
+
+The index follows wall edits through ``set_blocked`` instead of relabeling
+the maze.  Freeing a cell joins it to its free neighbors.  Blocking a cell
+can split its region, which a union-find cannot undo: when the ring of eight
+cells around it shows its free neighbors stay linked nothing changes,
+otherwise ``split`` finds the pieces that were cut off and gives them fresh
+nodes.
+"""
+
+from collections import deque
+
+# The eight cells around a cell, in ring order; even positions are the 4-neighbors
+RING = [(-1, 0), (-1, 1), (0, 1), (1, 1), (1, 0), (1, -1), (0, -1), (-1, -1)]
+
+
+class ComponentIndex:
+    """Union-find over the free cells of ``maze``, built on the first query.
+
+    Cells map to union-find nodes through ``node``.  A cell gets a new node
+    when it is freed or cut off from its region, so the old nodes left behind
+    never link cells that are not connected.
+    """
+
+    def __init__(self, maze):
+        self.rows = len(maze)
+        self.cols = len(maze[0])
+        self.free = bytearray(b"".join(bytes(v == 0 for v in row) for row in maze))
+        self.node = None  # Cell index -> union-find node
+        self.parent = None
+        self.size = None
+
+    def build(self):
+        """Label every free cell from scratch."""
+        rows, cols, free = self.rows, self.cols, self.free
+        self.node = list(range(rows * cols))
+        self.parent = parent = list(range(rows * cols))
+        self.size = size = [1] * (rows * cols)
+        union = self.union
+        for i in range(rows * cols):
+            if free[i]:
+                if i % cols and free[i - 1]:
+                    # Cell i is still a singleton, so it can hang straight off its run's root
+                    root = self.find(i - 1)
+                    parent[i] = root
+                    size[root] += 1
+                if i >= cols and free[i - cols]:
+                    union(i, i - cols)
+        return self
+
+    def find(self, node):
+        parent = self.parent
+        while parent[node] != node:
+            parent[node] = parent[parent[node]]  # Path halving
+            node = parent[node]
+        return node
+
+    def union(self, a, b):
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return
+        if self.size[a] < self.size[b]:
+            a, b = b, a
+        self.parent[b] = a
+        self.size[a] += self.size[b]
+
+    def new_node(self, size=1):
+        node = len(self.parent)
+        self.parent.append(node)
+        self.size.append(size)
+        return node
+
+    def component(self, cell):
+        """Return the region id of ``cell``, or None if it is blocked or off the grid."""
+        row, col = cell
+        if not self.is_free(row, col):
+            return None
+        if self.parent is None:
+            self.build()
+        return self.find(self.node[row * self.cols + col])
+
+    def connected(self, a, b):
+        """Tell whether free cells ``a`` and ``b`` are in the same region."""
+        region = self.component(a)
+        return region is not None and region == self.component(b)
+
+    def is_free(self, row, col):
+        return 0 <= row < self.rows and 0 <= col < self.cols and self.free[row * self.cols + col] == 1
+
+    def set_blocked(self, cell, blocked):
+        """Follow a wall edit: mark ``cell`` blocked or free."""
+        row, col = cell
+        i = row * self.cols + col
+        if self.free[i] != blocked:
+            return
+        self.free[i] = not blocked
+        if self.parent is None:
+            return
+        if blocked:
+            if self.may_split(row, col):
+                self.split(row, col)
+            return
+        # The cell's old node may still be in a region it has since been cut
+        # off from, so it starts over as a fresh node joined to its neighbors
+        node = self.node[i] = self.new_node()
+        for dr, dc in RING[::2]:
+            if self.is_free(row + dr, col + dc):
+                self.union(node, self.node[(row + dr) * self.cols + col + dc])
+
+    def may_split(self, row, col):
+        """Tell whether blocking cell ``(row, col)`` could disconnect its free neighbors.
+
+        The ring of eight cells around it is split into runs of free cells;
+        its free neighbors stay linked when they all fall in one run.
+        """
+        ring = [self.is_free(row + dr, col + dc) for dr, dc in RING]
+        runs = 0
+        for k in range(0, 8, 2):
+            # Count each run once, at its first 4-neighbor going around the ring
+            if ring[k] and not (ring[k - 1] and ring[k - 2]):
+                runs += 1
+        return runs > 1
+
+    def split(self, row, col):
+        """Give fresh nodes to the pieces cut off by blocking ``(row, col)``.
+
+        A breadth-first search starts from each free neighbor and they take
+        turns expanding one cell; searches that meet join one group.  Once at
+        most one group is still running, each finished group is a whole
+        region.  The running group, or failing that any one group, keeps its
+        old nodes and every other group gets a new one, so the work is
+        bounded by the pieces cut off rather than by the maze.
+        """
+        rows, cols, free = self.rows, self.cols, self.free
+        starts = [(row + dr) * cols + col + dc for dr, dc in RING[::2] if self.is_free(row + dr, col + dc)]
+        group = list(range(len(starts)))  # Search -> search it was merged into
+
+        def root(j):
+            while group[j] != j:
+                j = group[j]
+            return j
+
+        owner = {i: j for j, i in enumerate(starts)}  # Cell index -> search that reached it
+        queues = [deque([i]) for i in starts]
+        while len({root(j) for j, queue in enumerate(queues) if queue}) > 1:
+            for j, queue in enumerate(queues):
+                if not queue:
+                    continue
+                i = queue.popleft()
+                r, c = divmod(i, cols)
+                for n in (i - cols if r > 0 else -1, i + cols if r < rows - 1 else -1,
+                          i - 1 if c > 0 else -1, i + 1 if c < cols - 1 else -1):
+                    if n < 0 or not free[n]:
+                        continue
+                    seen = owner.get(n)
+                    if seen is None:
+                        owner[n] = j
+                        queue.append(n)
+                    elif root(seen) != root(j):
+                        group[root(seen)] = root(j)
+
+        running = [root(j) for j, queue in enumerate(queues) if queue]
+        keep = running[0] if running else root(0)
+        nodes = {}  # Group root -> its new node
+        for i, j in owner.items():
+            j = root(j)
+            if j != keep:
+                if j not in nodes:
+                    nodes[j] = self.new_node(0)
+                self.node[i] = nodes[j]
+                self.size[nodes[j]] += 1
+
@@ -0,0 +1,37 @@
+"""Convert maze files between the text and bit-packed formats.
+
+Example::
+
+    python -m maze_ai.convert maze.txt maze.mzb
+
+The output is a packed file (see ``maze_ai.packed``) unless its name ends in
+``.txt``.
+"""
+
+import argparse
+import sys
+
+from maze_ai.mazefile import load_maze, save_maze
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="maze_ai.convert",
+                                     description="Convert maze files between the text and packed formats.")
+    parser.add_argument("input", help="text or packed maze file")
+    parser.add_argument("output", help="file to write: text if it ends in .txt, else packed (.mzb)")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        maze, start, goal = load_maze(args.input)
+        save_maze(args.output, maze, start, goal)
+    except (OSError, ValueError) as exc:
+        print(exc, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
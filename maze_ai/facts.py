@@ -0,0 +1,34 @@
+class FactStore:
+    """Position facts derived by a chaining engine.
+
+    Each fact only remembers the position it was derived from, so membership
+    and inserts are O(1) and the path to a fact is rebuilt on demand.
+    """
+
+    def __init__(self):
+        self.parent = {}
+
+    def __contains__(self, position):
+        return position in self.parent
+
+    def __len__(self):
+        return len(self.parent)
+
+    def __iter__(self):
+        return iter(self.parent)
+
+    def add(self, position, parent=None):
+        """Record ``position`` derived from ``parent``; return False if already known."""
+        if position in self.parent:
+            return False
+        self.parent[position] = parent
+        return True
+
+    def path(self, position):
+        """Return the chain of positions from the root fact to ``position``."""
+        path = []
+        while position is not None:
+            path.append(position)
+            position = self.parent[position]
+        path.reverse()
+        return path
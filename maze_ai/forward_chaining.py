@@ -0,0 +1,179 @@
+from maze_ai.facts import FactStore
+from maze_ai.graph import solver_graph
+from maze_ai.stepping import Step, run_steps
+from maze_ai.trace import GOAL
+
+
+class MazeProblem:
+    def __init__(self, maze, initial, goal, graph=None):
+        self.maze = maze
+        self.initial = initial
+        self.goal = goal
+        self.rows = len(maze)
+        self.cols = len(maze[0])
+        self.graph = solver_graph(maze, graph)
+        self.facts = FactStore()
+        self.delta = []  # Facts derived since the last call to take_delta
+        self.explored_cost = 0
+        self.rounds = 0
+        self.rule_firings = 0
+        self.generated = 0  # Successor positions produced by the move rule
+        self.peak_frontier = 0  # Most facts a single round fired rules on
+        self.trace = None  # Event sink for the running apply_rules, if any
+
+        self.rules = [self.move]
+
+    def is_goal(self, position):
+        return position == self.goal
+
+    def add_fact(self, fact, parent=None):
+        if self.facts.add(fact, parent):
+            self.delta.append(fact)
+            self.explored_cost += 1
+
+    def take_delta(self):
+        """Return the facts derived since the previous call and start a new delta."""
+        delta, self.delta = self.delta, []
+        return delta
+
+    def move(self, position):
+        """Derive a fact for every free cell next to ``position``."""
+        successors = self.graph.successors(position)
+        self.generated += len(successors)
+        if self.trace is not None:
+            self.trace.expand(position, successors)
+        for new_pos in successors:
+            self.add_fact(new_pos, position)
+
+    def apply_rules(self, semi_naive=False, stats=None, trace=None):
+        """Derive facts until the goal is reached or no new fact appears.
+
+        With ``semi_naive`` set, each round only fires the rules on the facts
+        derived in the previous round instead of on every known fact.
+        """
+        self.trace = trace
+        try:
+            if semi_naive:
+                result = self.apply_rules_semi_naive()
+            else:
+                result = self.apply_rules_naive()
+        finally:
+            self.trace = None
+        if trace is not None and result[0] is not None:
+            trace.emit(GOAL, self.goal)
+        if stats is not None:
+            self.record_stats(stats)
+        return result
+
+    def apply_rules_steps(self, semi_naive=False, every=1000, stats=None):
+        """Stepping form of ``apply_rules`` (see ``maze_ai.stepping``).
+
+        A step's closed cells are the facts the rules fired on for the first
+        time, and its frontier the facts derived since the previous step.
+        """
+        if semi_naive:
+            result = yield from self.semi_naive_steps(every)
+        else:
+            result = yield from self.naive_steps(every)
+        if stats is not None:
+            self.record_stats(stats)
+        return result
+
+    def record_stats(self, stats):
+        stats.record(self.rule_firings, self.generated, self.explored_cost, self.peak_frontier, self.rounds)
+
+    def apply_rules_naive(self):
+        """Fire the rules on every known fact each round."""
+        return run_steps(self.naive_steps())
+
+    def apply_rules_semi_naive(self):
+        """Delta-driven forward chaining; stops at the goal or at the fixpoint."""
+        return run_steps(self.semi_naive_steps())
+
+    def naive_steps(self, every=None):
+        """Generator behind ``apply_rules_naive``.
+
+        Yields a ``Step`` every ``every`` rule firings and one at the end, or
+        nothing when ``every`` is None, and returns ``(path, explored)``.
+        """
+        stepping = every is not None
+        next_step = every if stepping else float('inf')
+        self.add_fact(self.initial)
+        closed_from = frontier_from = 0  # Facts, and entries of self.delta, already in a step
+        result = None
+
+        while result is None:
+            known = len(self.facts)
+            self.rounds += 1
+            self.peak_frontier = max(self.peak_frontier, known)
+            positions = list(self.facts)
+            fired = known
+            for i, position in enumerate(positions):
+                if self.is_goal(position):
+                    result = self.facts.path(position), self.explored_cost
+                    fired = i
+                    break
+
+                for rule in self.rules:
+                    self.rule_firings += 1
+                    rule(position)
+
+                if self.rule_firings >= next_step:
+                    # Facts keep their order, so those fired for the first time come after closed_from
+                    yield Step(positions[closed_from:i + 1], self.delta[frontier_from:], self.rule_firings)
+                    closed_from = max(closed_from, i + 1)
+                    frontier_from = len(self.delta)
+                    next_step += every
+
+            if result is None and len(self.facts) == known:
+                result = None, self.explored_cost
+
+        if stepping:
+            yield Step(positions[closed_from:fired], self.delta[frontier_from:], self.rule_firings)
+        return result
+
+    def semi_naive_steps(self, every=None):
+        """Generator behind ``apply_rules_semi_naive``; steps as in ``naive_steps``."""
+        stepping = every is not None
+        next_step = every if stepping else float('inf')
+        self.add_fact(self.initial)
+        delta = self.take_delta()
+        closed, frontier = [], list(delta)  # Not yet in a step
+        closed_from = frontier_from = 0  # Entries of delta and self.delta already in a step
+        result = None
+
+        while delta:
+            self.rounds += 1
+            self.peak_frontier = max(self.peak_frontier, len(delta))
+            fired = len(delta)
+            for i, position in enumerate(delta):
+                if self.is_goal(position):
+                    result = self.facts.path(position), self.explored_cost
+                    fired = i
+                    break
+
+                for rule in self.rules:
+                    self.rule_firings += 1
+                    rule(position)
+
+                if self.rule_firings >= next_step:
+                    closed += delta[closed_from:i + 1]
+                    frontier += self.delta[frontier_from:]
+                    yield Step(closed, frontier, self.rule_firings)
+                    closed, frontier = [], []
+                    closed_from, frontier_from = i + 1, len(self.delta)
+                    next_step += every
+
+            if stepping:
+                closed += delta[closed_from:fired]
+                frontier += self.delta[frontier_from:]
+                closed_from = frontier_from = 0
+            if result is not None:
+                break
+            delta = self.take_delta()
+
+        if stepping:
+            yield Step(closed, frontier, self.rule_firings)
+        if result is None:
+            result = None, self.explored_cost
+        return result
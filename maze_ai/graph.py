@@ -0,0 +1,115 @@
+"""Shared neighbor index for all solvers.
+
+``MazeGraph`` lists the free neighbors of every cell once per maze, as a
+tuple of ``(row, col)`` cells, so neighbor generation is one list read
+instead of four bounds and wall checks.  Every solver accepts a graph and
+asks it for ``successors(cell)``; ``maze_graph`` returns a cached one.
+
+Building the index costs a pass over the whole maze, which a single small
+search may never touch, so solvers given no graph fall back to ``MazeGrid``:
+the same API computed on the fly.
+"""
+
+from maze_ai.cache import MazeCache
+
+DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]  # Order neighbors are listed in
+
+
+class MazeGraph:
+    """Prebuilt ``MazeGrid`` successors: one tuple of free neighbor cells per cell.
+
+    The tuples are the only per-cell objects kept.  Each free cell is one
+    ``(row, col)`` tuple shared by all the lists it appears in, built over
+    shared int objects, and cells with no free neighbor share the empty
+    tuple.  Like ``MazeGrid``, a blocked cell still lists its free neighbors.
+    """
+
+    def __init__(self, maze):
+        self.maze = maze
+        self.rows = rows = len(maze)
+        self.cols = cols = len(maze[0])
+        self.free = b"".join(bytes(v == 0 for v in row) for row in maze)
+        columns = list(range(cols))
+
+        def free_cells(row):
+            # The free cells of a row as shared tuples, None for walls
+            return [None if v else (row, c) for c, v in zip(columns, maze[row])]
+
+        adjacency = []
+        append = adjacency.append
+        above, line = None, free_cells(0)
+        last = cols - 1
+        for row in range(rows):
+            below = free_cells(row + 1) if row < rows - 1 else None
+            for col in columns:
+                successors = []
+                # In DIRECTIONS order
+                if above is not None and above[col] is not None:
+                    successors.append(above[col])
+                if below is not None and below[col] is not None:
+                    successors.append(below[col])
+                if col and line[col - 1] is not None:
+                    successors.append(line[col - 1])
+                if col < last and line[col + 1] is not None:
+                    successors.append(line[col + 1])
+                append(tuple(successors))
+            above, line = line, below
+        self.adjacency = adjacency
+
+    def index(self, cell):
+        return cell[0] * self.cols + cell[1]
+
+    def is_free(self, row, col):
+        return 0 <= row < self.rows and 0 <= col < self.cols and self.free[row * self.cols + col] == 1
+
+    def successors(self, cell):
+        """Return the free neighbor cells of ``cell`` as a tuple of ``(row, col)``."""
+        return self.adjacency[cell[0] * self.cols + cell[1]]
+
+
+class MazeGrid:
+    """The ``MazeGraph`` successor API without any precomputation."""
+
+    def __init__(self, maze):
+        self.maze = maze
+        self.rows = len(maze)
+        self.cols = len(maze[0])
+
+    def is_free(self, row, col):
+        return 0 <= row < self.rows and 0 <= col < self.cols and self.maze[row][col] == 0
+
+    def successors(self, cell):
+        """Return the free neighbor cells of ``cell``."""
+        row, col = cell
+        maze = self.maze
+        line = maze[row]
+        successors = []
+        # Unrolled in DIRECTIONS order
+        if row > 0 and maze[row - 1][col] == 0:
+            successors.append((row - 1, col))
+        if row < self.rows - 1 and maze[row + 1][col] == 0:
+            successors.append((row + 1, col))
+        if col > 0 and line[col - 1] == 0:
+            successors.append((row, col - 1))
+        if col < self.cols - 1 and line[col + 1] == 0:
+            successors.append((row, col + 1))
+        return successors
+
+
+def solver_graph(maze, graph=None):
+    """Return ``graph`` if given, else an on-the-fly ``MazeGrid`` for ``maze``.
+
+    A maze with its own successor API, such as a ``PackedMaze``, is its own
+    graph.
+    """
+    if graph is not None:
+        return graph
+    return maze if hasattr(maze, "successors") else MazeGrid(maze)
+
+
+graph_cache = MazeCache(MazeGraph, maxsize=2)  # A graph of a 1000x1000 maze takes about 100 MB
+
+
+def maze_graph(maze):
+    """Return the shared cached ``MazeGraph`` for ``maze``."""
+    return graph_cache.get(maze)
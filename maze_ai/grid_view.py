@@ -0,0 +1,168 @@
+"""Maze grid drawn on a single canvas.
+
+``GridView`` draws through the ``tkinter.Canvas`` it is given, so this module
+does not import tkinter itself.  Free cells are the canvas background plus
+grid lines; a rectangle item is only created the first time a cell is
+painted another color, and kept in an index by cell.  Every update repaints
+just the cells whose state changed, so a solve on a 300x300 grid costs
+canvas calls for the old and new paths only, not for 90,000 widgets.
+"""
+
+# Default colors by cell state
+COLORS = {
+    "free": "lightblue",
+    "blocked": "red",
+    "path": "green",
+    "closed": "thistle",
+    "frontier": "orange",
+    "start": "lightgreen",
+    "end": "yellow",
+}
+
+FIT = 720  # Canvas side the automatic cell size aims for, in pixels
+MIN_CELL = 2
+MAX_CELL = 40
+LABEL_MIN_CELL = 36  # Smaller cells are too small for coordinate labels
+MAX_CELLS = 500 * 500  # Largest grid a GUI opens; bigger mazes are for the command line
+
+
+def cell_size_for(rows, cols):
+    """Pick a cell size in pixels that fits the grid in about ``FIT`` pixels."""
+    return max(MIN_CELL, min(MAX_CELL, FIT // max(rows, cols, 1)))
+
+
+class GridView:
+    """Colors maze cells on ``canvas`` by state and repaints them incrementally.
+
+    The cell states, from highest precedence, are start, end, blocked, path,
+    closed, frontier and free; closed and frontier are the overlay of a
+    search streamed with ``show_step``.  ``colors`` overrides entries of
+    ``COLORS``.
+    """
+
+    def __init__(self, canvas, rows, cols, cell_size=None, colors=None):
+        self.canvas = canvas
+        self.rows = rows
+        self.cols = cols
+        self.cell_size = cell_size or cell_size_for(rows, cols)
+        self.colors = dict(COLORS, **(colors or {}))
+        self.labels = self.cell_size >= LABEL_MIN_CELL
+
+        self.items = {}  # Cell -> rectangle item, for cells painted at least once
+        self.texts = {}  # Cell -> text item, when labels are shown
+        self.painted = {}  # Cell -> state of cells not currently free
+        self.blocked = set()
+        self.path = set()
+        self.closed = set()
+        self.frontier = set()
+        self.start = None
+        self.end = None
+        self.draw()
+
+    def draw(self):
+        """Draw the empty grid: background, grid lines and labels."""
+        canvas, size = self.canvas, self.cell_size
+        width, height = self.cols * size, self.rows * size
+        canvas.delete("all")
+        canvas.config(width=width, height=height, bg=self.colors["free"], highlightthickness=0)
+        self.items.clear()
+        self.texts.clear()
+        self.painted.clear()
+        if size >= 6:
+            for r in range(self.rows + 1):
+                canvas.create_line(0, r * size, width, r * size)
+            for c in range(self.cols + 1):
+                canvas.create_line(c * size, 0, c * size, height)
+        if self.labels:
+            for r in range(self.rows):
+                for c in range(self.cols):
+                    self.texts[r, c] = canvas.create_text((c + 0.5) * size, (r + 0.5) * size,
+                                                          text=f"({r},{c})", font=("Arial", 7))
+        for cell in self.blocked | self.path | self.closed | self.frontier | {self.start, self.end}:
+            if cell is not None:
+                self.paint(cell)
+
+    def cell_at(self, x, y):
+        """Return the ``(row, col)`` under canvas point ``(x, y)``, or None."""
+        row, col = int(y // self.cell_size), int(x // self.cell_size)
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return row, col
+        return None
+
+    def state(self, cell):
+        if cell == self.start:
+            return "start"
+        if cell == self.end:
+            return "end"
+        if cell in self.blocked:
+            return "blocked"
+        if cell in self.path:
+            return "path"
+        if cell in self.closed:
+            return "closed"
+        if cell in self.frontier:
+            return "frontier"
+        return "free"
+
+    def paint(self, cell):
+        """Recolor ``cell`` if its state differs from what is drawn."""
+        state = self.state(cell)
+        if self.painted.get(cell, "free") == state:
+            return
+        canvas = self.canvas
+        item = self.items.get(cell)
+        if item is None:
+            size = self.cell_size
+            row, col = cell
+            # The outline redraws the grid lines the rectangle covers
+            item = self.items[cell] = canvas.create_rectangle(
+                col * size, row * size, (col + 1) * size, (row + 1) * size,
+                fill=self.colors[state], outline="black" if size >= 6 else "")
+            if cell in self.texts:
+                canvas.tag_raise(self.texts[cell])
+        else:
+            canvas.itemconfigure(item, fill=self.colors[state])
+        if cell in self.texts:
+            text = {"start": "Start", "end": "End"}.get(state, f"({cell[0]},{cell[1]})")
+            canvas.itemconfigure(self.texts[cell], text=text)
+        if state == "free":
+            del self.painted[cell]
+        else:
+            self.painted[cell] = state
+
+    def set_blocked(self, cell, blocked):
+        """Mark one cell blocked or free and repaint it."""
+        if blocked:
+            self.blocked.add(cell)
+        else:
+            self.blocked.discard(cell)
+        self.paint(cell)
+
+    def update(self, blocked=(), path=(), start=None, end=None):
+        """Show a new maze state, repainting only the cells that changed."""
+        blocked = set(blocked)
+        path = set(path or ())
+        changed = (self.blocked ^ blocked) | (self.path ^ path) | {self.start, self.end, start, end}
+        self.blocked, self.path, self.start, self.end = blocked, path, start, end
+        for cell in changed:
+            if cell is not None:
+                self.paint(cell)
+
+    def show_step(self, step):
+        """Add the cells of a stepping solver's ``Step`` to the search overlay."""
+        frontier, closed, paint = self.frontier, self.closed, self.paint
+        for cell in step.frontier:
+            if cell not in frontier:
+                frontier.add(cell)
+                paint(cell)
+        for cell in step.closed:
+            if cell not in closed:
+                closed.add(cell)
+                paint(cell)
+
+    def clear_search(self):
+        """Remove the search overlay."""
+        cells = self.closed | self.frontier
+        self.closed, self.frontier = set(), set()
+        for cell in cells:
+            self.paint(cell)
@@ -0,0 +1,372 @@
+"""Hierarchical pathfinding (HPA*) for very large mazes.
+
+The grid is cut into square clusters.  Wherever free cells face each other
+across a cluster border, an entrance is made of one or two transitions (a
+pair of adjacent cells, one on each side).  Transition cells become the nodes
+of a small abstract graph, joined by the cost-1 step across the border and by
+the shortest distance between nodes of the same cluster.
+
+Building that graph is a separate, saveable step (``HierarchicalMap``);
+``hierarchical_map`` returns a cached one per maze and cluster size.  A
+query connects the start and goal to the nodes of their clusters, searches
+the abstract graph, and refines each abstract edge with ``MazeSolver`` on
+just the cluster it crosses.  Paths are near-optimal, not always optimal.
+"""
+
+import json
+from collections import deque
+from heapq import heappush, heappop
+
+from maze_ai.astar import MazeSolver
+from maze_ai.cache import MazeCache, maze_changed
+
+MIN_WIDE_ENTRANCE = 6  # Entrances this long get a transition at each end
+
+
+def flat_distances(free, width, source, targets):
+    """Yield ``(targets[index], distance)`` for each target a BFS reaches."""
+    remaining = len(targets)
+    if not remaining:
+        return
+    dist = [-1] * len(free)
+    dist[source] = 0
+    queue = deque([source])
+    while queue:
+        current = queue.popleft()
+        d = dist[current] + 1
+        for neighbor in (current - 1, current + 1, current - width, current + width):
+            if free[neighbor] and dist[neighbor] < 0:
+                dist[neighbor] = d
+                queue.append(neighbor)
+                if neighbor in targets:
+                    yield targets[neighbor], d
+                    remaining -= 1
+                    if not remaining:
+                        return
+
+
+class HierarchicalMap:
+    def __init__(self, maze, cluster_size=16):
+        self.maze = maze
+        self.cluster_size = cluster_size
+        self.rows = len(maze)
+        self.cols = len(maze[0])
+        self.cluster_rows = -(-self.rows // cluster_size)
+        self.cluster_cols = -(-self.cols // cluster_size)
+        self.links = {}  # border -> list of (cell, cell) transitions
+        self.inter = {}  # cell -> set of cells across a border
+        self.intra = {}  # cluster -> {node: {node: distance}}
+
+    def build(self):
+        """Find every entrance and the distances inside every cluster."""
+        for border in self.borders():
+            self.link_border(border)
+        for cr in range(self.cluster_rows):
+            for cc in range(self.cluster_cols):
+                self.connect_cluster((cr, cc))
+        return self
+
+    def borders(self):
+        """Yield every border as ``(axis, cr, cc)``.
+
+        ``("h", cr, cc)`` separates cluster ``(cr, cc)`` from ``(cr, cc + 1)``
+        and ``("v", cr, cc)`` separates it from ``(cr + 1, cc)``.
+        """
+        for cr in range(self.cluster_rows):
+            for cc in range(self.cluster_cols):
+                if cc + 1 < self.cluster_cols:
+                    yield ("h", cr, cc)
+                if cr + 1 < self.cluster_rows:
+                    yield ("v", cr, cc)
+
+    def cluster_of(self, cell):
+        return cell[0] // self.cluster_size, cell[1] // self.cluster_size
+
+    def cluster_bounds(self, cluster):
+        """Return ``(row0, row1, col0, col1)``, end-exclusive."""
+        size = self.cluster_size
+        row0, col0 = cluster[0] * size, cluster[1] * size
+        return row0, min(row0 + size, self.rows), col0, min(col0 + size, self.cols)
+
+    def cluster_borders(self, cluster):
+        """Return the borders touching ``cluster``."""
+        cr, cc = cluster
+        borders = []
+        if cc > 0:
+            borders.append(("h", cr, cc - 1))
+        if cc + 1 < self.cluster_cols:
+            borders.append(("h", cr, cc))
+        if cr > 0:
+            borders.append(("v", cr - 1, cc))
+        if cr + 1 < self.cluster_rows:
+            borders.append(("v", cr, cc))
+        return borders
+
+    def link_border(self, border):
+        """(Re)compute the transitions across one border."""
+        for pair in self.links.pop(border, []):
+            for a, b in (pair, pair[::-1]):
+                self.inter[a].discard(b)
+                if not self.inter[a]:
+                    del self.inter[a]
+
+        axis, cr, cc = border
+        row0, row1, col0, col1 = self.cluster_bounds((cr, cc))
+        if axis == "h":
+            pairs = [((r, col1 - 1), (r, col1)) for r in range(row0, row1)]
+        else:
+            pairs = [((row1 - 1, c), (row1, c)) for c in range(col0, col1)]
+
+        maze = self.maze
+        links = []
+        run = []
+        for a, b in pairs + [(None, None)]:
+            if a is not None and maze[a[0]][a[1]] == 0 and maze[b[0]][b[1]] == 0:
+                run.append((a, b))
+                continue
+            if len(run) >= MIN_WIDE_ENTRANCE:
+                links.extend((run[0], run[-1]))
+            elif run:
+                links.append(run[len(run) // 2])
+            run = []
+
+        self.links[border] = links
+        for a, b in links:
+            self.inter.setdefault(a, set()).add(b)
+            self.inter.setdefault(b, set()).add(a)
+
+    def cluster_nodes(self, cluster):
+        """Return the transition cells that lie inside ``cluster``."""
+        nodes = set()
+        for border in self.cluster_borders(cluster):
+            for pair in self.links.get(border, []):
+                nodes.update(cell for cell in pair if self.cluster_of(cell) == cluster)
+        return nodes
+
+    def local_distances(self, cluster, source):
+        """BFS from ``source`` that stays inside ``cluster``; return a distance dict."""
+        row0, row1, col0, col1 = self.cluster_bounds(cluster)
+        maze = self.maze
+        dist = {source: 0}
+        queue = deque([source])
+        while queue:
+            row, col = queue.popleft()
+            d = dist[(row, col)] + 1
+            for nr, nc in ((row + 1, col), (row, col + 1), (row - 1, col), (row, col - 1)):
+                if (row0 <= nr < row1 and col0 <= nc < col1 and
+                        maze[nr][nc] == 0 and (nr, nc) not in dist):
+                    dist[(nr, nc)] = d
+                    queue.append((nr, nc))
+        return dist
+
+    def connect_cluster(self, cluster):
+        """(Re)compute the distances between the nodes of one cluster.
+
+        The cluster is copied into a wall-padded flat bytearray once, and
+        each BFS stops as soon as it has reached every node not yet paired.
+        """
+        row0, row1, col0, col1 = self.cluster_bounds(cluster)
+        width = col1 - col0 + 2
+        free = bytearray(width)
+        for row in self.maze[row0:row1]:
+            free += b"\0" + bytes(v == 0 for v in row[col0:col1]) + b"\0"
+        free += bytearray(width)
+
+        nodes = sorted(self.cluster_nodes(cluster))
+        index = [(r - row0 + 1) * width + c - col0 + 1 for r, c in nodes]
+        edges = {node: {} for node in nodes}
+        for i, node in enumerate(nodes):
+            targets = {index[j]: nodes[j] for j in range(i + 1, len(nodes))}
+            for other, d in flat_distances(free, width, index[i], targets):
+                edges[node][other] = d
+                edges[other][node] = d
+        self.intra[cluster] = edges
+
+    def set_cell(self, row, col, value):
+        """Change one maze cell and rebuild only the clusters it affects.
+
+        Cells inside a cluster only change that cluster's distances; cells on
+        a border also relink that border and reconnect the cluster across it.
+        """
+        self.maze[row][col] = value
+        maze_changed(self.maze)
+        cluster = self.cluster_of((row, col))
+        row0, row1, col0, col1 = self.cluster_bounds(cluster)
+        cr, cc = cluster
+
+        touched = []
+        if col == col0 and cc > 0:
+            touched.append(("h", cr, cc - 1))
+        if col == col1 - 1 and cc + 1 < self.cluster_cols:
+            touched.append(("h", cr, cc))
+        if row == row0 and cr > 0:
+            touched.append(("v", cr - 1, cc))
+        if row == row1 - 1 and cr + 1 < self.cluster_rows:
+            touched.append(("v", cr, cc))
+
+        affected = {cluster}
+        for border in touched:
+            self.link_border(border)
+            axis, br, bc = border
+            affected.update(((br, bc), (br, bc + 1) if axis == "h" else (br + 1, bc)))
+        for other in affected:
+            self.connect_cluster(other)
+
+    def to_dict(self):
+        return {
+            "rows": self.rows,
+            "cols": self.cols,
+            "cluster_size": self.cluster_size,
+            "links": [[list(border), [list(a) + list(b) for a, b in links]]
+                      for border, links in self.links.items()],
+            "intra": [[list(cluster), [list(a) + list(b) + [d] for a, edges in nodes.items() for b, d in edges.items()]]
+                      for cluster, nodes in self.intra.items()],
+        }
+
+    def save(self, path):
+        """Write the preprocessed graph (not the maze) as JSON."""
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f)
+
+    @classmethod
+    def from_dict(cls, maze, data):
+        hmap = cls(maze, data["cluster_size"])
+        if (hmap.rows, hmap.cols) != (data["rows"], data["cols"]):
+            raise ValueError("Saved map was built for a {}x{} maze".format(data["rows"], data["cols"]))
+        for (axis, cr, cc), links in data["links"]:
+            pairs = [((r1, c1), (r2, c2)) for r1, c1, r2, c2 in links]
+            hmap.links[(axis, cr, cc)] = pairs
+            for a, b in pairs:
+                hmap.inter.setdefault(a, set()).add(b)
+                hmap.inter.setdefault(b, set()).add(a)
+        for (cr, cc), edges in data["intra"]:
+            nodes = hmap.intra[(cr, cc)] = {}
+            for r1, c1, r2, c2, d in edges:
+                nodes.setdefault((r1, c1), {})[(r2, c2)] = d
+        for cluster in hmap.intra:
+            for node in hmap.cluster_nodes(cluster):
+                hmap.intra[cluster].setdefault(node, {})
+        return hmap
+
+    @classmethod
+    def load(cls, maze, path):
+        """Load a graph saved with ``save`` for the same ``maze``."""
+        with open(path) as f:
+            return cls.from_dict(maze, json.load(f))
+
+
+class HierarchicalSolver:
+    def __init__(self, hmap, initial, goal):
+        self.hmap = hmap
+        self.start = initial
+        self.goal = goal
+        self.explored = 0
+
+    def heuristic(self, position):
+        return abs(position[0] - self.goal[0]) + abs(position[1] - self.goal[1])
+
+    def solve(self, stats=None):
+        """Return ``(path, explored)`` through the abstract graph.
+
+        ``stats`` gets the abstract search and the in-cluster A* refinements;
+        the local distance searches from start and goal only count as explored.
+        """
+        hmap, start, goal = self.hmap, self.start, self.goal
+        self.explored = 0
+        if start == goal:
+            return [start], 0
+
+        start_cluster = hmap.cluster_of(start)
+        goal_cluster = hmap.cluster_of(goal)
+        start_dist = hmap.local_distances(start_cluster, start)
+        goal_dist = hmap.local_distances(goal_cluster, goal)
+        self.explored += len(start_dist) + len(goal_dist)
+
+        start_edges = {node: start_dist[node] for node in hmap.cluster_nodes(start_cluster) if node in start_dist}
+        goal_edges = {node: goal_dist[node] for node in hmap.cluster_nodes(goal_cluster) if node in goal_dist}
+        if goal in start_dist:
+            start_edges[goal] = start_dist[goal]
+
+        abstract_path = self.search_abstract(start_edges, goal_edges, stats)
+        if abstract_path is None:
+            return None, self.explored
+        return self.refine(abstract_path, stats), self.explored
+
+    def neighbors(self, cell, start_edges, goal_edges):
+        hmap = self.hmap
+        if cell == self.start:
+            yield from start_edges.items()
+        if cell in goal_edges:
+            yield self.goal, goal_edges[cell]
+        yield from hmap.intra.get(hmap.cluster_of(cell), {}).get(cell, {}).items()
+        for other in hmap.inter.get(cell, ()):
+            yield other, 1
+
+    def search_abstract(self, start_edges, goal_edges, stats=None):
+        """A* over transition nodes plus the temporary start and goal nodes."""
+        open_set = [(self.heuristic(self.start), self.start)]
+        came_from = {}
+        g_score = {self.start: 0}
+        closed = set()
+        generated = 0
+        pushes = peak = 1
+        path = None
+
+        while open_set:
+            if len(open_set) > peak:
+                peak = len(open_set)
+            _, current = heappop(open_set)
+            if current == self.goal:
+                path = [current]
+                while current in came_from:
+                    current = came_from[current]
+                    path.append(current)
+                path.reverse()
+                break
+            if current in closed:
+                continue
+            closed.add(current)
+            self.explored += 1
+
+            for neighbor, cost in self.neighbors(current, start_edges, goal_edges):
+                generated += 1
+                tentative_g_score = g_score[current] + cost
+                if neighbor not in closed and tentative_g_score < g_score.get(neighbor, float('inf')):
+                    came_from[neighbor] = current
+                    g_score[neighbor] = tentative_g_score
+                    heappush(open_set, (tentative_g_score + self.heuristic(neighbor), neighbor))
+                    pushes += 1
+
+        if stats is not None:
+            stats.record(len(closed), generated, pushes, peak)
+        return path
+
+    def refine(self, abstract_path, stats=None):
+        """Turn abstract edges into cells, running A* inside one cluster at a time."""
+        path = [abstract_path[0]]
+        for a, b in zip(abstract_path, abstract_path[1:]):
+            if abs(a[0] - b[0]) + abs(a[1] - b[1]) == 1:
+                path.append(b)
+            else:
+                path.extend(self.refine_in_cluster(a, b, stats)[1:])
+        return path
+
+    def refine_in_cluster(self, a, b, stats=None):
+        row0, row1, col0, col1 = self.hmap.cluster_bounds(self.hmap.cluster_of(a))
+        submaze = [row[col0:col1] for row in self.hmap.maze[row0:row1]]
+        solver = MazeSolver(submaze, (a[0] - row0, a[1] - col0), (b[0] - row0, b[1] - col0))
+        local_path, explored = solver.solve_a_star(stats)
+        self.explored += explored
+        return [(r + row0, c + col0) for r, c in local_path]
+
+
+def build_map(maze, cluster_size):
+    return HierarchicalMap(maze, cluster_size).build()
+
+
+map_cache = MazeCache(build_map, maxsize=8)
+
+
+def hierarchical_map(maze, cluster_size=16):
+    """Return the shared cached, built ``HierarchicalMap`` for ``maze``."""
+    return map_cache.get(maze, cluster_size)
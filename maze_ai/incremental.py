@@ -0,0 +1,143 @@
+from heapq import heappush, heappop
+
+from maze_ai.astar import MazeSolver
+from maze_ai.cache import maze_changed
+from maze_ai.trace import EXPAND, GENERATE, GOAL
+
+INF = float('inf')
+
+
+class IncrementalSolver(MazeSolver):
+    """Incremental replanning for a fixed start and goal.
+
+    This is Lifelong Planning A*, the fixed-start form of D* Lite: it keeps
+    ``g`` (settled cost from the start) and ``rhs`` (one-step lookahead cost)
+    for every cell it has touched, plus its open list, between calls.  After
+    a batch of cell changes only the cells whose costs became inconsistent
+    are re-expanded, instead of searching the whole maze again.
+    """
+
+    def __init__(self, maze, initial, goal):
+        super().__init__(maze, initial, goal)
+        self.g = {}
+        self.rhs = {initial: 0}
+        self.open_set = []
+        self.open_keys = {}  # cell -> key of its live open-list entry
+        self.explored = 0  # Expansions of the first plan
+        self.replan_cost = 0  # Expansions of the last update_cells
+        self.pushes = 0
+        self.push(initial)
+
+    def key(self, cell):
+        best = min(self.g.get(cell, INF), self.rhs.get(cell, INF))
+        return best + self.heuristic(cell), best
+
+    def push(self, cell):
+        key = self.key(cell)
+        self.open_keys[cell] = key
+        heappush(self.open_set, (key, cell))
+        self.pushes += 1
+
+    def neighbors(self, cell):
+        row, col = cell
+        for dx, dy in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            r, c = row + dx, col + dy
+            if 0 <= r < self.rows and 0 <= c < self.cols and self.maze[r][c] == 0:
+                yield r, c
+
+    def update_vertex(self, cell):
+        """Recompute ``rhs`` for ``cell`` and queue it if it is inconsistent."""
+        if cell != self.start:
+            row, col = cell
+            if self.maze[row][col] == 0:
+                self.rhs[cell] = min((self.g.get(n, INF) + 1 for n in self.neighbors(cell)), default=INF)
+            else:
+                self.rhs[cell] = INF
+        self.open_keys.pop(cell, None)
+        if self.g.get(cell, INF) != self.rhs.get(cell, INF):
+            self.push(cell)
+
+    def top_key(self):
+        """Return the smallest live key, dropping stale heap entries."""
+        open_set, open_keys = self.open_set, self.open_keys
+        while open_set:
+            key, cell = open_set[0]
+            if open_keys.get(cell) == key:
+                return key
+            heappop(open_set)
+        return (INF, INF)
+
+    def compute_shortest_path(self, stats=None, trace=None):
+        """Expand inconsistent cells until the goal's cost is settled.
+
+        Each expansion is reported to ``trace`` before the cell leaves the
+        open list, so a trace that stops the search by raising leaves the
+        plan consistent and a later call resumes it.
+        """
+        expansions = generated = 0
+        pushes = self.pushes
+        peak = len(self.open_keys)
+        goal = self.goal
+        while (self.top_key() < self.key(goal) or
+               self.rhs.get(goal, INF) != self.g.get(goal, INF)):
+            if not self.open_keys:
+                break
+            if len(self.open_keys) > peak:
+                peak = len(self.open_keys)
+            if trace is not None:
+                trace.emit(EXPAND, self.open_set[0][1])
+            _, cell = heappop(self.open_set)
+            del self.open_keys[cell]
+            expansions += 1
+
+            if self.g.get(cell, INF) > self.rhs.get(cell, INF):
+                self.g[cell] = self.rhs[cell]
+            else:
+                self.g[cell] = INF
+                self.update_vertex(cell)
+            for neighbor in self.neighbors(cell):
+                generated += 1
+                if trace is not None:
+                    trace.emit(GENERATE, neighbor)
+                self.update_vertex(neighbor)
+        if trace is not None and self.g.get(goal, INF) < INF:
+            trace.emit(GOAL, goal)
+        if stats is not None:
+            stats.record(expansions, generated, self.pushes - pushes, peak)
+        return expansions
+
+    def extract_path(self):
+        """Follow the cheapest predecessors from the goal back to the start."""
+        if self.g.get(self.goal, INF) == INF:
+            return None
+        current = self.goal
+        path = [current]
+        while current != self.start:
+            current = min(self.neighbors(current), key=lambda n: self.g.get(n, INF))
+            path.append(current)
+        path.reverse()
+        return path
+
+    def solve(self, stats=None, trace=None):
+        """Plan from scratch and return ``(path, explored)``."""
+        self.explored = self.compute_shortest_path(stats, trace)
+        return self.extract_path(), self.explored
+
+    def update_cells(self, changes, stats=None, trace=None):
+        """Apply ``(row, col, blocked)`` changes and repair the plan.
+
+        Returns ``(path, replan_cost)`` where ``replan_cost`` is the number of
+        cells re-expanded for this batch.  ``stats`` only gets the repair.
+        """
+        touched = set()
+        for row, col, blocked in changes:
+            self.maze[row][col] = 1 if blocked else 0
+            touched.add((row, col))
+            touched.update(self.neighbors((row, col)))
+        if changes:
+            maze_changed(self.maze)
+        for cell in touched:
+            self.update_vertex(cell)
+
+        self.replan_cost = self.compute_shortest_path(stats, trace)
+        return self.extract_path(), self.replan_cost
@@ -0,0 +1,165 @@
+from maze_ai.astar import MazeSolver
+
+
+# Turns a row of 0/1 cells into the binary digits of its free-cell mask
+FREE_DIGITS = bytes.maketrans(b"\0\1", b"10")
+
+
+class JumpPointSolver(MazeSolver):
+    """Jump Point Search for the 4-connected, unit-cost maze grid.
+
+    Instead of pushing every neighbor, the search jumps in a straight line
+    until it reaches the goal or a cell where the path could usefully turn
+    (a jump point), and only those cells enter the open list.  Moving
+    vertically, a cell is also a jump point when a horizontal scan from it
+    finds one, so horizontal turns are never missed.
+
+    Those scans would walk whole rows for every vertical step, so each
+    search first turns every row into int bitmasks: its free cells, and per
+    direction the cells where a horizontal scan stops.  A scan is then a
+    shift and a lowest- or highest-bit lookup.
+    """
+
+    ALL_DIRECTIONS = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+
+    def build_masks(self):
+        """Build the row bitmasks (bit ``c`` is column ``c``) for this search.
+
+        ``free[row + 1]`` holds the free cells of each row, with an empty row
+        padded on either side.  ``stops[dcol][row]`` holds the cells where a
+        horizontal scan in direction ``dcol`` stops: walls, the goal, and
+        free cells with a free cell above or below whose neighbor behind is
+        blocked.
+        """
+        self.free = free = [0] + [int(bytes(line).translate(FREE_DIGITS)[::-1], 2) for line in self.maze] + [0]
+        full = (1 << self.cols) - 1
+        self.stops = {}
+        for dcol in (1, -1):
+            stops = []
+            for above, line, below in zip(free, free[1:], free[2:]):
+                if dcol > 0:
+                    forced = above & ~(above << 1) | below & ~(below << 1)
+                else:
+                    forced = above & ~(above >> 1) | below & ~(below >> 1)
+                stops.append(~line & full | line & forced)
+            stops[self.goal[0]] |= 1 << self.goal[1]
+            self.stops[dcol] = stops
+
+    def jump_horizontal(self, row, col, dcol):
+        """Scan along ``row`` from ``col`` and return the first jump point, or None."""
+        stops = self.stops[dcol][row]
+        if dcol > 0:
+            ahead = stops >> col >> 1
+            if not ahead:
+                return None  # Ran off the grid
+            col += (ahead & -ahead).bit_length()
+        else:
+            ahead = stops & (1 << col) - 1
+            if not ahead:
+                return None
+            col = ahead.bit_length() - 1
+        return (row, col) if self.free[row + 1] >> col & 1 else None
+
+    def jump_vertical(self, row, col, drow):
+        """Scan along ``col`` from ``row`` and return the first jump point, or None."""
+        free, right, left = self.free, self.stops[1], self.stops[-1]
+        bit = 1 << col
+        sides = bit << 1 | bit >> 1
+        behind = free[row + 1]
+        while True:
+            row += drow
+            line = free[row + 1]
+            if not line & bit:
+                return None
+            if (row, col) == self.goal:
+                return (row, col)
+            # A side cell that is free here but blocked in the row behind
+            if line & ~behind & sides:
+                return (row, col)
+            # The first stop on either side is a jump point when it is free
+            # (jump_horizontal inlined, as it runs on every step)
+            ahead = right[row] >> col >> 1
+            if ahead and line >> col >> (ahead & -ahead).bit_length() & 1:
+                return (row, col)
+            ahead = left[row] & bit - 1
+            if ahead and line >> (ahead.bit_length() - 1) & 1:
+                return (row, col)
+            behind = line
+
+    def jump(self, position, drow, dcol):
+        if drow:
+            return self.jump_vertical(position[0], position[1], drow)
+        return self.jump_horizontal(position[0], position[1], dcol)
+
+    def pruned_directions(self, position, parent):
+        """Directions worth jumping in from ``position`` when reached from ``parent``."""
+        if parent is None:
+            return self.ALL_DIRECTIONS
+        if position[0] == parent[0]:
+            dcol = 1 if position[1] > parent[1] else -1
+            return [(0, dcol), (-1, 0), (1, 0)]
+        drow = 1 if position[0] > parent[0] else -1
+        return [(drow, 0), (0, -1), (0, 1)]
+
+    def solve_jump_point(self, stats=None):
+        """Solve the maze with Jump Point Search.
+
+        Returns the full cell-by-cell path and the number of jump points
+        expanded.  In ``stats``, the generated nodes are the jump points found.
+        """
+        self.build_masks()
+        open_set = self.make_open_list()
+        open_set.push(self.heuristic(self.start), self.start)
+        came_from = {}
+        g_score = {self.start: 0}
+        explored = set()
+        generated = 0
+        pushes = peak = 1
+        path = None
+
+        while open_set:
+            if len(open_set) > peak:
+                peak = len(open_set)
+            current = open_set.pop()
+
+            if current == self.goal:
+                path = self.expand_jump_points(self.reconstruct_path(came_from, current))
+                break
+            if current in explored:
+                continue
+
+            explored.add(current)
+
+            for drow, dcol in self.pruned_directions(current, came_from.get(current)):
+                jump_point = self.jump(current, drow, dcol)
+                if jump_point is None:
+                    continue
+                generated += 1
+                if jump_point in explored:
+                    continue
+
+                distance = abs(jump_point[0] - current[0]) + abs(jump_point[1] - current[1])
+                tentative_g_score = g_score[current] + distance * self.step_cost
+
+                if tentative_g_score < g_score.get(jump_point, float('inf')):
+                    came_from[jump_point] = current
+                    g_score[jump_point] = tentative_g_score
+                    open_set.push(tentative_g_score + self.heuristic(jump_point), jump_point)
+                    pushes += 1
+
+        if stats is not None:
+            stats.record(len(explored), generated, pushes, peak)
+        return path, len(explored)
+
+    def expand_jump_points(self, jump_points):
+        """Fill in the straight runs between consecutive jump points."""
+        path = [jump_points[0]]
+        for row, col in jump_points[1:]:
+            prev_row, prev_col = path[-1]
+            drow = (row > prev_row) - (row < prev_row)
+            dcol = (col > prev_col) - (col < prev_col)
+            while (prev_row, prev_col) != (row, col):
+                prev_row += drow
+                prev_col += dcol
+                path.append((prev_row, prev_col))
+        return path
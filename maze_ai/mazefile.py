@@ -0,0 +1,110 @@
+"""Plain-text maze files.
+
+One line per row.  ``.`` or ``0`` is a free cell, ``#`` or ``1`` is a blocked
+cell, ``S`` marks the start and ``G`` marks the goal (both are free cells).
+Blank lines and lines starting with ``;`` are ignored.
+
+``load_maze`` and ``save_maze`` also handle the bit-packed format of
+``maze_ai.packed``.
+"""
+
+import os
+
+from maze_ai.packed import PackedMaze, is_packed, load_packed, save_packed
+
+FREE_CHARS = ".0SG"
+BLOCKED_CHARS = "#1"
+
+# For file dialogs
+FILETYPES = [("Maze files", "*.mzb *.txt"), ("Packed mazes", "*.mzb"), ("Text mazes", "*.txt"), ("All files", "*")]
+
+
+def parse_maze(text):
+    """Parse maze text and return ``(maze, start, goal)``.
+
+    ``start`` and ``goal`` are ``None`` when the text has no ``S``/``G``.
+    """
+    maze = []
+    start = goal = None
+    for line in text.splitlines():
+        line = line.rstrip()
+        if not line or line.startswith(";"):
+            continue
+        r = len(maze)
+        row = []
+        for c, ch in enumerate(line):
+            if ch in BLOCKED_CHARS:
+                row.append(1)
+            elif ch in FREE_CHARS:
+                row.append(0)
+                if ch == "S":
+                    start = (r, c)
+                elif ch == "G":
+                    goal = (r, c)
+            else:
+                raise ValueError(f"Invalid maze character {ch!r} at ({r},{c})")
+        if maze and len(row) != len(maze[0]):
+            raise ValueError(f"Row {r} has {len(row)} cells, expected {len(maze[0])}")
+        maze.append(row)
+    if not maze:
+        raise ValueError("Maze is empty")
+    return maze, start, goal
+
+
+def load_maze(path):
+    """Read a text or packed maze file and return ``(maze, start, goal)``.
+
+    A packed file gives a ``PackedMaze`` mapped over the file instead of
+    nested lists.
+    """
+    if is_packed(path):
+        return load_packed(path)
+    with open(path) as f:
+        return parse_maze(f.read())
+
+
+def save_maze(path, maze, start=None, goal=None):
+    """Write a maze file: text if ``path`` ends in ``.txt``, else packed."""
+    if os.path.splitext(path)[1].lower() == ".txt":
+        with open(path, "w") as f:
+            f.write(format_maze(maze, start, goal))
+    else:
+        save_packed(path, maze, start, goal)
+
+
+def load_blocked(path, max_cells=None):
+    """Read a maze file and return ``(rows, cols, blocked, start, goal)``.
+
+    ``blocked`` is the set of blocked cells.  Raises ``ValueError`` when the
+    maze has more than ``max_cells`` cells.
+    """
+    maze, start, goal = load_maze(path)
+    try:
+        rows, cols = len(maze), len(maze[0])
+        if max_cells is not None and rows * cols > max_cells:
+            raise ValueError(f"{path} is {rows}x{cols}, more than the {max_cells} cells the grid can show; "
+                             "solve it with python -m maze_ai instead")
+        if isinstance(maze, PackedMaze):
+            blocked = maze.blocked_cells()
+        else:
+            blocked = {(r, c) for r, row in enumerate(maze) for c, cell in enumerate(row) if cell}
+    finally:
+        if isinstance(maze, PackedMaze):
+            maze.close()
+    return rows, cols, blocked, start, goal
+
+
+def format_maze(maze, start=None, goal=None):
+    """Return maze text that ``parse_maze`` reads back unchanged."""
+    lines = []
+    for r, row in enumerate(maze):
+        chars = []
+        for c, cell in enumerate(row):
+            if (r, c) == start:
+                chars.append("S")
+            elif (r, c) == goal:
+                chars.append("G")
+            else:
+                chars.append("#" if cell else ".")
+        lines.append("".join(chars))
+    return "\n".join(lines) + "\n"
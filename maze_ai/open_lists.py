@@ -0,0 +1,59 @@
+"""Open lists (priority queues) for best-first search.
+
+Every open list supports ``push(priority, item)``, ``pop()`` returning the
+item with the lowest priority, and ``len()``.
+"""
+
+from heapq import heappush, heappop
+
+
+class HeapOpenList:
+    """Binary heap; ties are broken by comparing the items themselves."""
+
+    def __init__(self):
+        self.heap = []
+
+    def __len__(self):
+        return len(self.heap)
+
+    def push(self, priority, item):
+        heappush(self.heap, (priority, item))
+
+    def pop(self):
+        return heappop(self.heap)[1]
+
+
+class BucketOpenList:
+    """Dial's bucket queue for small non-negative integer priorities.
+
+    Pushes and pops are O(1) amortized when the lowest priority never drops
+    far below the last one popped, which holds for A* with unit costs and a
+    consistent heuristic.  Items with equal priority come out last in, first
+    out, so the search keeps going deep along one f-contour.
+    """
+
+    def __init__(self):
+        self.buckets = []
+        self.lowest = 0
+        self.count = 0
+
+    def __len__(self):
+        return self.count
+
+    def push(self, priority, item):
+        buckets = self.buckets
+        if priority >= len(buckets):
+            buckets.extend([] for _ in range(priority + 1 - len(buckets)))
+        buckets[priority].append(item)
+        if priority < self.lowest:
+            self.lowest = priority
+        self.count += 1
+
+    def pop(self):
+        if not self.count:
+            raise IndexError("pop from an empty open list")
+        buckets = self.buckets
+        while not buckets[self.lowest]:
+            self.lowest += 1
+        self.count -= 1
+        return buckets[self.lowest].pop()
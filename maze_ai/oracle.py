@@ -0,0 +1,46 @@
+"""Goal-rooted distance oracles for many-start queries.
+
+A ``DistanceOracle`` runs one full reverse BFS from the goal.  Afterwards a
+shortest path from any start is found by walking down the distance gradient,
+and an unreachable start is detected with a single lookup.
+
+Oracles are kept in an LRU ``OracleCache`` keyed by the maze object and the
+goal; whoever edits a cached maze must call ``maze_ai.cache.maze_changed``.
+"""
+
+from maze_ai.cache import MazeCache
+from maze_ai.wavefront import DistanceField
+
+
+class DistanceOracle:
+    def __init__(self, maze, goal, use_numpy=None):
+        self.maze = maze
+        self.goal = goal
+        self.field = DistanceField(maze, goal, use_numpy=use_numpy)
+        self.explored = self.field.explored  # Cells labelled by the reverse search
+
+    def distance_from(self, start):
+        """Return the shortest path length from ``start`` to the goal, or None."""
+        return self.field.distance(start)
+
+    def reachable(self, start):
+        return self.field.distance(start) is not None
+
+    def path_from(self, start):
+        """Return a shortest path from ``start`` to the goal, or None."""
+        return self.field.descend(start)
+
+
+class OracleCache(MazeCache):
+    """Least-recently-used cache of ``DistanceOracle`` objects."""
+
+    def __init__(self, maxsize=32):
+        super().__init__(DistanceOracle, maxsize)
+
+
+oracle_cache = OracleCache()
+
+
+def distance_oracle(maze, goal):
+    """Return the shared cached oracle for ``(maze, goal)``."""
+    return oracle_cache.get(maze, goal)
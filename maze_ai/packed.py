@@ -0,0 +1,214 @@
+"""Bit-packed binary maze files, loaded through ``mmap``.
+
+A packed file is a 32-byte header followed by one bit per cell::
+
+    magic      8 bytes  b"MAZEBIT1"
+    rows, cols          u32 each
+    start, goal         (row, col) as i32 each; -1 when not set
+    body                rows * ceil(cols / 8) bytes
+
+Each row starts on a byte boundary, and cell ``c`` of a row is bit ``c % 8``
+(least significant first) of byte ``c // 8``.  A set bit is a blocked cell.
+A 10000x10000 maze takes 12.5 MB.
+
+``load_packed`` maps the file instead of reading it, and the ``PackedMaze``
+it returns reads cells straight from the mapping: it has the list-of-lists
+interface the solvers use (``len(maze)``, ``maze[row][col]``) and the
+``MazeGrid`` successor API, so no nested lists are built.
+
+``python -m maze_ai.convert IN OUT`` converts between text and packed files.
+"""
+
+import mmap
+import struct
+
+MAGIC = b"MAZEBIT1"
+HEADER = struct.Struct("<8sIIiiii")
+EXTENSION = ".mzb"
+
+
+class PackedRow:
+    """One row of a ``PackedMaze``, indexable like a list of 0/1 ints."""
+
+    def __init__(self, buf, offset, cols):
+        self.buf = buf
+        self.offset = offset
+        self.cols = cols
+
+    def __len__(self):
+        return self.cols
+
+    def __getitem__(self, col):
+        if isinstance(col, slice):
+            return [self[c] for c in range(*col.indices(self.cols))]
+        if col < 0:
+            col += self.cols
+        if not 0 <= col < self.cols:
+            raise IndexError("maze column out of range")
+        return self.buf[self.offset + (col >> 3)] >> (col & 7) & 1
+
+    def __iter__(self):
+        cols = self.cols
+        for c, byte in enumerate(self.buf[self.offset:self.offset + (cols + 7) // 8]):
+            for bit in range(min(8, cols - 8 * c)):
+                yield byte >> bit & 1
+
+
+class PackedMaze:
+    """A maze stored one bit per cell in ``buf``, starting at ``offset``.
+
+    ``buf`` is any bytes-like object; ``load_packed`` passes an ``mmap``.
+    Cells are read-only.
+    """
+
+    def __init__(self, buf, rows, cols, start=None, goal=None, offset=HEADER.size):
+        self.buf = buf
+        self.rows = rows
+        self.cols = cols
+        self.stride = (cols + 7) // 8
+        self.offset = offset
+        self.start = start
+        self.goal = goal
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Release the mapping, if the maze was loaded from a file."""
+        if isinstance(self.buf, mmap.mmap):
+            self.buf.close()
+
+    def __len__(self):
+        return self.rows
+
+    def __getitem__(self, row):
+        if isinstance(row, slice):
+            return [self[r] for r in range(*row.indices(self.rows))]
+        if row < 0:
+            row += self.rows
+        if not 0 <= row < self.rows:
+            raise IndexError("maze row out of range")
+        return PackedRow(self.buf, self.offset + row * self.stride, self.cols)
+
+    def __iter__(self):
+        for row in range(self.rows):
+            yield PackedRow(self.buf, self.offset + row * self.stride, self.cols)
+
+    def __array__(self, dtype=None, copy=None):
+        """Unpack every cell at once for NumPy, instead of row by row."""
+        import numpy as np
+        body = np.frombuffer(self.buf, np.uint8, self.rows * self.stride, self.offset)
+        cells = np.unpackbits(body.reshape(self.rows, self.stride), axis=1, count=self.cols, bitorder="little")
+        return cells if dtype is None else cells.astype(dtype)
+
+    def blocked(self, row, col):
+        return self.buf[self.offset + row * self.stride + (col >> 3)] >> (col & 7) & 1
+
+    def is_free(self, row, col):
+        return 0 <= row < self.rows and 0 <= col < self.cols and not self.blocked(row, col)
+
+    def successors(self, cell):
+        """Return the free neighbor cells of ``cell``, in ``MazeGrid`` order."""
+        row, col = cell
+        buf, stride = self.buf, self.stride
+        at = self.offset + row * stride + (col >> 3)
+        mask = 1 << (col & 7)
+        here = buf[at]
+        successors = []
+        if row and not buf[at - stride] & mask:
+            successors.append((row - 1, col))
+        if row < self.rows - 1 and not buf[at + stride] & mask:
+            successors.append((row + 1, col))
+        # Side neighbors are in the cell's own byte unless it is at a byte edge
+        if col and not (here & mask >> 1 if mask > 1 else buf[at - 1] & 128):
+            successors.append((row, col - 1))
+        if col < self.cols - 1 and not (here & mask << 1 if mask < 128 else buf[at + 1] & 1):
+            successors.append((row, col + 1))
+        return successors
+
+    def blocked_cells(self):
+        """Return the set of blocked ``(row, col)`` cells, skipping empty bytes."""
+        cells = set()
+        buf, stride, offset = self.buf, self.stride, self.offset
+        for row in range(self.rows):
+            base = offset + row * stride
+            for i, byte in enumerate(buf[base:base + stride]):
+                while byte:
+                    low = byte & -byte
+                    cells.add((row, 8 * i + low.bit_length() - 1))
+                    byte ^= low
+        return cells
+
+    def to_lists(self):
+        """Return the maze as a list of lists of 0/1 ints."""
+        return [list(row) for row in self]
+
+
+def pack_rows(maze):
+    """Return the packed body of a list-of-lists maze."""
+    stride = (len(maze[0]) + 7) // 8
+    # Cell c becomes bit c of a little-endian integer
+    return b"".join(int("".join("1" if cell else "0" for cell in reversed(row)) or "0", 2).to_bytes(stride, "little")
+                    for row in maze)
+
+
+def is_packed(path):
+    """Tell whether the file at ``path`` starts with the packed-maze magic."""
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def pack_maze(maze, start=None, goal=None):
+    """Return ``maze`` (a list of lists or a ``PackedMaze``) in the packed file layout."""
+    rows, cols = len(maze), len(maze[0])
+    if isinstance(maze, PackedMaze):
+        body = maze.buf[maze.offset:maze.offset + rows * maze.stride]
+    else:
+        body = pack_rows(maze)
+    start_row, start_col = start if start is not None else (-1, -1)
+    goal_row, goal_col = goal if goal is not None else (-1, -1)
+    return HEADER.pack(MAGIC, rows, cols, start_row, start_col, goal_row, goal_col) + body
+
+
+def save_packed(path, maze, start=None, goal=None):
+    """Write ``maze`` (a list of lists or a ``PackedMaze``) as a packed file."""
+    with open(path, "wb") as f:
+        f.write(pack_maze(maze, start, goal))
+
+
+def read_packed(buf):
+    """Return ``(maze, start, goal)`` for the packed layout in ``buf``, without copying it.
+
+    ``buf`` is any bytes-like object, such as an ``mmap`` or the buffer of
+    a shared memory block.  Raises ``ValueError`` if it does not hold a
+    packed maze.
+    """
+    if len(buf) < HEADER.size or bytes(buf[:len(MAGIC)]) != MAGIC:
+        raise ValueError("not a packed maze file")
+    _, rows, cols, start_row, start_col, goal_row, goal_col = HEADER.unpack_from(buf)
+    if not rows or not cols or len(buf) < HEADER.size + rows * ((cols + 7) // 8):
+        raise ValueError("truncated packed maze, or an empty one")
+    start = (start_row, start_col) if start_row >= 0 else None
+    goal = (goal_row, goal_col) if goal_row >= 0 else None
+    return PackedMaze(buf, rows, cols, start, goal), start, goal
+
+
+def load_packed(path):
+    """Map a packed file and return ``(maze, start, goal)``.
+
+    ``maze`` is a ``PackedMaze`` over the mapping; ``start`` and ``goal``
+    are None when the header does not set them.
+    """
+    with open(path, "rb") as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file
+            raise ValueError(f"{path} is not a packed maze file") from None
+    try:
+        return read_packed(buf)
+    except ValueError as exc:
+        buf.close()
+        raise ValueError(f"{path}: {exc}") from None
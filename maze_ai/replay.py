@@ -0,0 +1,53 @@
+"""Replay a search trace as a heat map of events per cell.
+
+Example::
+
+    python -m maze_ai.replay search.trace --top 10 --pgm heat.pgm
+
+Prints the event totals, the hottest cells and a text heat map; ``--pgm``
+also writes the map as a greyscale image.
+"""
+
+import argparse
+import sys
+from collections import Counter
+
+from maze_ai.trace import KIND_NAMES, heat_map, read_trace, render_heat_map, write_pgm
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="maze_ai.replay", description="Replay a search trace as a heat map.")
+    parser.add_argument("trace", help="trace file written by TraceFile or TraceBuffer.save")
+    parser.add_argument("--kind", choices=sorted(KIND_NAMES), default="expand",
+                        help="event kind to count (default: expand)")
+    parser.add_argument("--rows", type=int, help="maze rows (default: extent of the trace)")
+    parser.add_argument("--cols", type=int, help="maze columns (default: extent of the trace)")
+    parser.add_argument("--top", type=int, default=10, help="number of hottest cells to list (default: 10)")
+    parser.add_argument("--pgm", help="also write the heat map as a PGM image")
+    parser.add_argument("--no-map", action="store_true", help="skip the text heat map")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    try:
+        events = list(read_trace(args.trace))
+    except (OSError, ValueError) as exc:
+        print(exc, file=sys.stderr)
+        return 1
+
+    counts = heat_map(events, KIND_NAMES[args.kind])
+    totals = Counter(kind for kind, _ in events)
+    print(f"{len(events)} events: " + ", ".join(f"{totals[k]} {name}" for name, k in KIND_NAMES.items()))
+    print(f"{len(counts)} cells with {args.kind} events")
+    for (row, col), n in counts.most_common(args.top):
+        print(f"  ({row},{col}) {n}")
+    if not args.no_map:
+        print(render_heat_map(counts, args.rows, args.cols))
+    if args.pgm:
+        write_pgm(args.pgm, counts, args.rows, args.cols)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,137 @@
+"""Uniform entry point over all solvers.
+
+Every entry in ``ALGORITHMS`` takes ``(maze, start, goal, **options)`` and
+returns ``(path, explored)`` where ``path`` is a list of ``(row, col)`` cells
+from start to goal, or ``None`` when no path was found.  Every entry also
+takes a ``stats`` option, a ``maze_ai.stats.SearchStats`` to fill in.
+"""
+
+import time
+import tracemalloc
+
+from maze_ai import backward_chaining, bidirectional_chaining, forward_chaining
+from maze_ai.astar import MazeSolver
+from maze_ai.hpa import HierarchicalSolver, hierarchical_map
+from maze_ai.jps import JumpPointSolver
+from maze_ai.stats import SearchStats
+from maze_ai.uninformed import MazeProblem, bfs, depth_limited_search, iterative_deepening_search
+from maze_ai.wavefront import wavefront_bfs
+
+
+def solve_astar(maze, start, goal, graph=None, stats=None, trace=None):
+    return MazeSolver(maze, start, goal, graph=graph).solve_a_star(stats, trace)
+
+
+def solve_astar_flat(maze, start, goal, stats=None):
+    return MazeSolver(maze, start, goal).solve_a_star_flat(stats)
+
+
+def solve_jps(maze, start, goal, stats=None):
+    return JumpPointSolver(maze, start, goal).solve_jump_point(stats)
+
+
+def solve_hpa(maze, start, goal, cluster_size=16, hmap=None, stats=None):
+    if hmap is None:
+        hmap = hierarchical_map(maze, cluster_size)
+    return HierarchicalSolver(hmap, start, goal).solve(stats)
+
+
+def solve_bfs(maze, start, goal, graph=None, stats=None, trace=None):
+    return bfs(maze, start, goal, graph, stats=stats, trace=trace)
+
+
+def solve_bibfs(maze, start, goal, graph=None, stats=None, trace=None):
+    return bfs(maze, start, goal, graph, bidirectional=True, stats=stats, trace=trace)
+
+
+def solve_wavefront(maze, start, goal, stats=None):
+    return wavefront_bfs(maze, start, goal, stats=stats)
+
+
+def solve_dls(maze, start, goal, limit=50, graph=None, stats=None, trace=None):
+    problem = MazeProblem(maze, start, goal, graph)
+    result, explored = depth_limited_search(problem, limit=limit, stats=stats, trace=trace)
+    if result is None or result == 'cutoff':
+        return None, explored
+    return result.path(), explored
+
+
+def solve_ids(maze, start, goal, graph=None, stats=None, trace=None):
+    result, explored = iterative_deepening_search(MazeProblem(maze, start, goal, graph), stats=stats, trace=trace)
+    if result is None or result == 'cutoff':
+        return None, explored
+    return result.path(), explored
+
+
+def solve_forward(maze, start, goal, semi_naive=False, graph=None, stats=None, trace=None):
+    problem = forward_chaining.MazeProblem(maze, start, goal, graph)
+    return problem.apply_rules(semi_naive=semi_naive, stats=stats, trace=trace)
+
+
+def solve_backward(maze, start, goal, graph=None, stats=None, trace=None):
+    return backward_chaining.MazeProblem(maze, start, goal, graph).apply_rules(stats, trace)
+
+
+def solve_bidirectional(maze, start, goal, graph=None, stats=None, trace=None):
+    return bidirectional_chaining.MazeProblem(maze, start, goal, graph).apply_rules(stats, trace)
+
+
+ALGORITHMS = {
+    "astar": solve_astar,
+    "astar-flat": solve_astar_flat,
+    "jps": solve_jps,
+    "hpa": solve_hpa,
+    "bfs": solve_bfs,
+    "bibfs": solve_bibfs,
+    "wavefront": solve_wavefront,
+    "dls": solve_dls,
+    "ids": solve_ids,
+    "forward": solve_forward,
+    "backward": solve_backward,
+    "bidirectional": solve_bidirectional,
+}
+
+# Algorithms that take a shared ``graph`` (see maze_ai.graph) as an option
+GRAPH_ALGORITHMS = {"astar", "bfs", "bibfs", "dls", "ids", "forward", "backward", "bidirectional"}
+
+# Algorithms that take a ``trace`` event sink (see maze_ai.trace) as an option
+TRACE_ALGORITHMS = {"astar", "bfs", "bibfs", "dls", "ids", "forward", "backward", "bidirectional"}
+
+
+def solve(maze, start, goal, algorithm="astar", components=None, **options):
+    """Solve one maze with the named algorithm and return ``(path, explored)``.
+
+    With a ``maze_ai.components.ComponentIndex`` for the maze as
+    ``components``, a goal outside the start's region returns ``(None, 0)``
+    at once instead of searching that whole region.
+    """
+    try:
+        solver = ALGORITHMS[algorithm]
+    except KeyError:
+        raise ValueError(f"Unknown algorithm {algorithm!r}; choose from {', '.join(ALGORITHMS)}") from None
+    if components is not None and not components.connected(start, goal):
+        return None, 0
+    return solver(maze, start, goal, **options)
+
+
+def solve_with_stats(maze, start, goal, algorithm="astar", memory=False, **options):
+    """Solve like ``solve`` and return ``(path, stats)``.
+
+    ``stats`` is a ``SearchStats`` with the solver's counters, the wall time
+    and the path cost.  With ``memory`` set the solve runs under
+    ``tracemalloc`` to record its peak allocation, which slows it down and
+    inflates the wall time.
+    """
+    stats = SearchStats(algorithm)
+    if memory:
+        tracemalloc.start()
+    began = time.perf_counter()
+    try:
+        path, explored = solve(maze, start, goal, algorithm, stats=stats, **options)
+        stats.finish(path, explored, time.perf_counter() - began)
+        if memory:
+            stats.peak_kib = tracemalloc.get_traced_memory()[1] // 1024
+    finally:
+        if memory:
+            tracemalloc.stop()
+    return path, stats
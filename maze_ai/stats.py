@@ -0,0 +1,108 @@
+"""Search statistics shared by every solver.
+
+Solvers keep their counters in local variables and only copy them into a
+``SearchStats`` when one is passed in, so searching without stats costs
+nothing extra.  The counters mean the same thing for every algorithm:
+
+``expanded``
+    cells whose successors were generated (rule firings for chaining)
+``generated``
+    successor cells produced by those expansions
+``pushes``
+    insertions into the frontier (queue, heap, stack or fact base)
+``peak_frontier``
+    largest frontier size seen during the search
+``rounds``
+    chaining rounds, IDS passes or BFS levels; ``None`` for other searches
+
+``explored`` is the algorithm's own explored count, as returned next to the
+path.  ``seconds``, ``peak_kib`` and ``path_cost`` are filled in by
+``maze_ai.runner.solve_with_stats``.
+"""
+
+import json
+
+FIELDS = (
+    "algorithm",
+    "explored",
+    "expanded",
+    "generated",
+    "pushes",
+    "peak_frontier",
+    "rounds",
+    "path_cost",
+    "seconds",
+    "peak_kib",
+)
+
+# Shown by summary(); the GUIs already print the explored and path costs
+SUMMARY_FIELDS = ("expanded", "generated", "pushes", "peak_frontier", "rounds", "seconds", "peak_kib")
+
+LABELS = {
+    "expanded": "Nodes expanded",
+    "generated": "Nodes generated",
+    "pushes": "Frontier pushes",
+    "peak_frontier": "Peak frontier size",
+    "rounds": "Rounds",
+    "seconds": "Wall time (s)",
+    "peak_kib": "Peak memory (KiB)",
+}
+
+
+class SearchStats:
+    """Counters for one search; see the module docstring for their meaning."""
+
+    def __init__(self, algorithm=None):
+        self.algorithm = algorithm
+        self.explored = 0
+        self.expanded = 0
+        self.generated = 0
+        self.pushes = 0
+        self.peak_frontier = 0
+        self.rounds = None
+        self.path_cost = None
+        self.seconds = None
+        self.peak_kib = None
+
+    def record(self, expanded, generated, pushes, peak_frontier, rounds=None):
+        """Add one search's counters; repeated searches accumulate."""
+        self.expanded += expanded
+        self.generated += generated
+        self.pushes += pushes
+        self.peak_frontier = max(self.peak_frontier, peak_frontier)
+        if rounds is not None:
+            self.rounds = (self.rounds or 0) + rounds
+
+    def finish(self, path, explored, seconds=None):
+        """Fill in the solver's result and, if measured, its wall time."""
+        self.explored = explored
+        self.path_cost = len(path) - 1 if path else None
+        if seconds is not None:
+            self.seconds = seconds
+
+    def to_dict(self):
+        return {name: getattr(self, name) for name in FIELDS}
+
+    def to_json(self):
+        return json.dumps(self.to_dict())
+
+    def save(self, path):
+        """Write the stats to ``path`` as a JSON object."""
+        with open(path, "w") as f:
+            json.dump(self.to_dict(), f, indent=1)
+
+    def summary(self):
+        """Return one ``label: value`` line per counter that has a value."""
+        lines = []
+        for name in SUMMARY_FIELDS:
+            value = getattr(self, name)
+            if value is None:
+                continue
+            if name == "seconds":
+                value = f"{value:.4f}"
+            lines.append(f"{LABELS[name]}: {value}")
+        return "\n".join(lines)
+
+    def __repr__(self):
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in FIELDS)
+        return f"SearchStats({fields})"
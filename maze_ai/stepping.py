@@ -0,0 +1,107 @@
+"""Stepping solvers: generator forms that stream a search while it runs.
+
+A stepping solver is a generator that yields a ``Step`` every ``every``
+expansions and once more when the search ends, then returns exactly what
+its plain form returns.  A step only holds the cells that changed since the
+previous one, so a viewer draws deltas instead of redrawing the maze::
+
+    steps = bfs_steps(maze, start, goal, every=500)
+    for step in steps:
+        view.show_step(step)
+
+The stepping forms are ``maze_ai.uninformed.bfs_steps`` and
+``depth_limited_steps``, ``MazeSolver.solve_a_star_steps`` and the
+``apply_rules_steps`` method of the forward and backward chaining engines.
+``run_steps`` drives one to the end and returns its result;
+``SteppedSolve`` drives one from a Tk event loop, one step per frame.
+"""
+
+import time
+
+from maze_ai.background import Progress, SearchCancelled
+
+FRAME_MS = 33  # Delay between steps shown by SteppedSolve, about 30 frames a second
+ANIMATION_FRAMES = 300  # Steps a search over the whole maze is spread across
+
+
+class Step:
+    """Cells that changed state since the previous step."""
+    __slots__ = ("closed", "frontier", "expanded")
+
+    def __init__(self, closed, frontier, expanded):
+        self.closed = closed  # Cells expanded since the previous step
+        self.frontier = frontier  # Cells put on the frontier since the previous step
+        self.expanded = expanded  # Expansions so far
+
+
+def frame_size(cells, frames=ANIMATION_FRAMES):
+    """Expansions per step so that a search over ``cells`` cells takes about ``frames`` steps."""
+    return max(1, cells // frames)
+
+
+def run_steps(steps):
+    """Drive a stepping solver to the end and return its result."""
+    while True:
+        try:
+            next(steps)
+        except StopIteration as stop:
+            return stop.value
+
+
+class SteppedSolve:
+    """Runs a stepping solver from a widget's event loop, one step per frame.
+
+    It has the ``result``, ``error``, ``seconds``, ``progress`` and
+    ``cancel`` interface of ``maze_ai.background.BackgroundSolve``, so a GUI
+    shows both kinds of job the same way.  ``seconds`` only counts the time
+    spent in the solver, not the frames in between.
+    """
+
+    def __init__(self, steps, budget=None):
+        self.steps = steps
+        self.progress = Progress(budget)
+        self.result = None
+        self.error = None
+        self.seconds = 0.0
+        self.done = False
+
+    def start(self):
+        self.progress.start()
+        return self
+
+    @property
+    def cancelled(self):
+        return isinstance(self.error, SearchCancelled)
+
+    def cancel(self):
+        """Stop the solver before its next step."""
+        self.progress.cancel()
+
+    def advance(self):
+        """Run the solver to its next step and return it, or None once it has finished."""
+        began = time.perf_counter()
+        try:
+            self.progress.check()
+            step = next(self.steps)
+            self.progress.expanded = step.expanded
+            return step
+        except StopIteration as stop:
+            self.result = stop.value
+        except Exception as error:
+            self.steps.close()
+            self.error = error
+        finally:
+            self.seconds += time.perf_counter() - began
+        self.done = True
+        return None
+
+    def poll(self, widget, on_step, on_done, interval=FRAME_MS):
+        """Show one step every ``interval`` ms, then call ``on_done(job)``."""
+        def tick():
+            step = self.advance()
+            if step is None:
+                on_done(self)
+            else:
+                on_step(step)
+                widget.after(interval, tick)
+        widget.after(0, tick)
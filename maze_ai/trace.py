@@ -0,0 +1,181 @@
+"""Search-event traces and heat maps built from them.
+
+Solvers that take a ``trace`` argument report three kinds of events:
+
+``EXPAND``
+    a cell's successors were generated
+``GENERATE``
+    a successor cell was produced by the last expansion
+``GOAL``
+    the goal was reached
+
+A ``TraceBuffer`` keeps the most recent events in preallocated arrays, so
+memory stays fixed however long the search runs.  A ``TraceFile`` streams
+every event to a binary file: the 8-byte header ``MAZETRC1`` followed by
+one little-endian ``(kind: u8, row: i32, col: i32)`` record per event.  With
+no trace the solvers only pay a ``None`` check per expansion.
+
+``python -m maze_ai.replay`` turns a saved trace into a heat map.
+"""
+
+import struct
+from abc import ABC, abstractmethod
+from array import array
+from collections import Counter
+
+EXPAND, GENERATE, GOAL = 0, 1, 2
+KIND_NAMES = {"expand": EXPAND, "generate": GENERATE, "goal": GOAL}
+
+MAGIC = b"MAZETRC1"
+RECORD = struct.Struct("<Bii")
+
+# Shades from no events to the hottest cell
+SHADES = " .:-=+*#%@"
+
+
+class Trace(ABC):
+    """Event sink interface shared by ``TraceBuffer`` and ``TraceFile``."""
+
+    @abstractmethod
+    def emit(self, kind, cell):
+        """Record one ``kind`` event at ``cell``."""
+
+    def expand(self, cell, successors):
+        """Record an expansion of ``cell`` and each successor it generated."""
+        emit = self.emit
+        emit(EXPAND, cell)
+        for successor in successors:
+            emit(GENERATE, successor)
+
+
+class TraceBuffer(Trace):
+    """Ring buffer holding the last ``capacity`` events."""
+
+    def __init__(self, capacity=1 << 16):
+        self.capacity = capacity
+        self.kinds = bytearray(capacity)
+        self.rows = array('i', bytes(4 * capacity))
+        self.cols = array('i', bytes(4 * capacity))
+        self.count = 0  # Events emitted, including overwritten ones
+
+    def __len__(self):
+        return min(self.count, self.capacity)
+
+    @property
+    def dropped(self):
+        """Number of events overwritten by newer ones."""
+        return max(0, self.count - self.capacity)
+
+    def emit(self, kind, cell):
+        i = self.count % self.capacity
+        self.kinds[i] = kind
+        self.rows[i], self.cols[i] = cell
+        self.count += 1
+
+    def events(self):
+        """Yield ``(kind, (row, col))`` from the oldest kept event to the newest."""
+        first = self.dropped % self.capacity
+        for n in range(len(self)):
+            i = (first + n) % self.capacity
+            yield self.kinds[i], (self.rows[i], self.cols[i])
+
+    def save(self, path):
+        """Write the kept events in the ``TraceFile`` format."""
+        write_trace(path, self.events())
+
+
+class TraceFile(Trace):
+    """Streams events to a binary trace file.
+
+    Records are packed into a buffer and written every ``flush_events``
+    events.  Use as a context manager, or call ``close`` when the search is
+    done.
+    """
+
+    def __init__(self, path, flush_events=4096):
+        self.file = open(path, "wb")
+        self.file.write(MAGIC)
+        self.pending = bytearray()
+        self.flush_bytes = flush_events * RECORD.size
+        self.count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def emit(self, kind, cell):
+        self.pending += RECORD.pack(kind, cell[0], cell[1])
+        self.count += 1
+        if len(self.pending) >= self.flush_bytes:
+            self.flush()
+
+    def flush(self):
+        self.file.write(self.pending)
+        self.pending.clear()
+
+    def close(self):
+        if not self.file.closed:
+            self.flush()
+            self.file.close()
+
+
+def write_trace(path, events):
+    """Write ``(kind, (row, col))`` events to ``path``."""
+    with TraceFile(path) as trace:
+        for kind, cell in events:
+            trace.emit(kind, cell)
+
+
+def read_trace(path):
+    """Yield ``(kind, (row, col))`` for every event in a trace file."""
+    with open(path, "rb") as f:
+        if f.read(len(MAGIC)) != MAGIC:
+            raise ValueError(f"{path} is not a maze trace file")
+        data = f.read()
+    usable = len(data) - len(data) % RECORD.size  # Ignore a torn last record
+    for kind, row, col in RECORD.iter_unpack(memoryview(data)[:usable]):
+        yield kind, (row, col)
+
+
+def heat_map(events, kind=EXPAND):
+    """Count the events of one kind per cell."""
+    return Counter(cell for event_kind, cell in events if event_kind == kind)
+
+
+def grid_shape(counts, rows=None, cols=None):
+    """Return ``(rows, cols)``, defaulting to the extent of the counted cells."""
+    if rows is None:
+        rows = max((r for r, _ in counts), default=-1) + 1
+    if cols is None:
+        cols = max((c for _, c in counts), default=-1) + 1
+    return rows, cols
+
+
+def render_heat_map(counts, rows=None, cols=None):
+    """Return the counts as text, one shade character per cell."""
+    rows, cols = grid_shape(counts, rows, cols)
+    hottest = max(counts.values(), default=0)
+    lines = []
+    for r in range(rows):
+        line = []
+        for c in range(cols):
+            n = counts.get((r, c), 0)
+            # Any event at all gets at least the first visible shade
+            line.append(SHADES[0] if not n else SHADES[max(1, n * (len(SHADES) - 1) // hottest)])
+        lines.append("".join(line))
+    return "\n".join(lines)
+
+
+def write_pgm(path, counts, rows=None, cols=None):
+    """Write the counts as a greyscale PGM image, brightest where hottest."""
+    rows, cols = grid_shape(counts, rows, cols)
+    hottest = max(counts.values(), default=0) or 1
+    pixels = bytearray(rows * cols)
+    for (r, c), n in counts.items():
+        if 0 <= r < rows and 0 <= c < cols:
+            pixels[r * cols + c] = n * 255 // hottest
+    with open(path, "wb") as f:
+        f.write(f"P5\n{cols} {rows}\n255\n".encode())
+        f.write(pixels)
@@ -0,0 +1,511 @@
+from collections import deque
+from itertools import islice
+
+from maze_ai.graph import solver_graph
+from maze_ai.stepping import Step
+from maze_ai.trace import EXPAND, GENERATE, GOAL
+
+
+class MazeProblem:
+    def __init__(self, maze, initial, goal, graph=None):
+        self.maze = maze
+        self.initial = initial
+        self.goal = goal
+        self.rows = len(maze)
+        self.cols = len(maze[0])
+        self.graph = solver_graph(maze, graph)
+
+    def goal_test(self, state):
+        """Check if the state is the goal state."""
+        return state == self.goal
+
+    def step_cost(self, current_state, action, next_state):
+        """Returns the cost of moving from current_state to next_state."""
+        return 1  # Each move has a uniform cost of 1 in this maze
+
+    def successor(self, state):
+        """Generate successors for a given cell in the maze."""
+        return [(None, next_state) for next_state in self.successor_states(state)]
+
+    def successor_states(self, state):
+        """Return an iterator over the free neighbor cells of a given cell."""
+        return iter(self.graph.successors(state))
+
+
+class Node_Depth:
+    __slots__ = ("state", "parent", "action", "path_cost")  # No per-node __dict__
+
+    def __init__(self, state, parent=None, action=None, path_cost=0):
+        self.state = state
+        self.parent = parent
+        self.action = action
+        self.path_cost = path_cost  # Initialize with the cost to reach this node
+
+    def expand(self, problem):
+        """Return a list of child nodes generated from this node."""
+        return list(self.children(problem))
+
+    def children(self, problem):
+        """Yield child nodes one at a time, without building a successor list."""
+        for next_state in problem.successor_states(self.state):
+            yield Node_Depth(next_state, self, None, self.path_cost + problem.step_cost(self.state, None, next_state))
+
+    def path(self):
+        """Return the path from the root to this node."""
+        node, path_back = self, []
+        while node:
+            path_back.append(node.state)
+            node = node.parent
+        return list(reversed(path_back))
+
+
+def node_from_path(problem, states):
+    """Build the Node_Depth chain for a list of states from the root."""
+    node = Node_Depth(states[0])
+    for next_state in states[1:]:
+        node = Node_Depth(next_state, node, None, node.path_cost + problem.step_cost(node.state, None, next_state))
+    return node
+
+
+def depth_limited_search(problem, limit=50, stats=None, trace=None):
+    """
+    Depth-Limited Search (DLS) with correct cost calculation.
+    Counts all unique nodes explored during the search.
+    The current branch is kept as a list of states; nodes are only built
+    for the path that reaches the goal.
+    """
+    explored_nodes = set()  # Set to store all unique nodes visited
+    branch = []  # States from the root to the state being searched
+    counts = [0, 0, 0]  # Expanded, generated, peak branch length
+
+    def recursive_dls(state, problem, limit):
+        explored_nodes.add(state)
+        branch.append(state)
+        if len(branch) > counts[2]:
+            counts[2] = len(branch)
+
+        if problem.goal_test(state):
+            if trace is not None:
+                trace.emit(GOAL, state)
+            return node_from_path(problem, branch)
+        elif limit == 0:
+            result = 'cutoff'
+        else:
+            cutoff_occurred = False
+            result = None
+            counts[0] += 1
+            if trace is not None:
+                trace.emit(EXPAND, state)
+            for child in problem.successor_states(state):
+                counts[1] += 1
+                if trace is not None:
+                    trace.emit(GENERATE, child)
+                if child not in explored_nodes:  # Avoid revisiting nodes in the recursion
+                    child_result = recursive_dls(child, problem, limit - 1)
+                    if child_result == 'cutoff':
+                        cutoff_occurred = True
+                    elif child_result is not None:
+                        return child_result
+            if cutoff_occurred:
+                result = 'cutoff'
+
+        branch.pop()
+        return result
+
+    result = recursive_dls(problem.initial, problem, limit)
+    if stats is not None:
+        stats.record(counts[0], counts[1], len(explored_nodes), counts[2])
+    return result, len(explored_nodes)  # Return the result and total explored cost
+
+
+def depth_limited_steps(problem, limit=50, every=1000, stats=None):
+    """
+    Stepping form of depth_limited_search (see maze_ai.stepping): yields a
+    Step every ``every`` expansions and returns the same (result, explored).
+    The recursion is unrolled onto an explicit stack of
+    [successor iterator, depth left, cutoff seen] frames, one per state on
+    the branch, so the search can pause between any two expansions.
+    A step's frontier is the states entered since the previous step.
+    """
+    explored_nodes = set()
+    branch = []
+    frames = []
+    closed, frontier = [], []
+    expanded = generated = peak = 0
+    next_step = every
+
+    state, depth_left = problem.initial, limit
+    while True:
+        # Enter ``state`` as recursive_dls would
+        explored_nodes.add(state)
+        branch.append(state)
+        frontier.append(state)
+        if len(branch) > peak:
+            peak = len(branch)
+        if problem.goal_test(state):
+            result = node_from_path(problem, branch)
+            break
+        if depth_left == 0:
+            branch.pop()
+            returned = 'cutoff'
+        else:
+            expanded += 1
+            closed.append(state)
+            frames.append([problem.successor_states(state), depth_left, False])
+            returned = None
+            if expanded == next_step:
+                yield Step(closed, frontier, expanded)
+                closed, frontier = [], []
+                next_step += every
+
+        # Return to the deepest frame with an unexplored child
+        while frames:
+            frame = frames[-1]
+            if returned == 'cutoff':
+                frame[2] = True
+            for child in frame[0]:
+                generated += 1
+                if child not in explored_nodes:
+                    break
+            else:
+                frames.pop()
+                branch.pop()
+                returned = 'cutoff' if frame[2] else None
+                continue
+            state, depth_left = child, frame[1] - 1
+            break
+        else:
+            result = returned
+            break
+
+    yield Step(closed, frontier, expanded)
+    if stats is not None:
+        stats.record(expanded, generated, len(explored_nodes), peak)
+    return result, len(explored_nodes)
+
+
+def bfs(maze, start, end, graph=None, bidirectional=False, stats=None, trace=None):
+    """
+    Breadth-First Search (BFS) with correct cost calculation.
+    Counts all unique nodes explored during the search.
+    Returns None for the path when end cannot be reached.
+    """
+    if bidirectional:
+        return bidirectional_bfs(maze, start, end, graph, stats, trace)
+
+    successors = solver_graph(maze, graph).successors
+
+    queue = deque([start])
+    visited = set([start])  # Set to store all unique nodes visited
+    parent = {start: None}
+    peak = 1
+
+    while queue:
+        if len(queue) > peak:
+            peak = len(queue)
+        current = queue.popleft()
+
+        if current == end:
+            if trace is not None:
+                trace.emit(GOAL, current)
+            break
+
+        neighbors = successors(current)
+        if trace is not None:
+            trace.expand(current, neighbors)
+        for new_node in neighbors:
+            if new_node not in visited:
+                queue.append(new_node)
+                visited.add(new_node)  # Mark as visited
+                parent[new_node] = current
+
+    if stats is not None:
+        # Cells are popped in discovery order, which parent keeps, so the
+        # expanded cells are its first entries; count them after the search.
+        expanded = len(visited) - len(queue) - (end in parent)
+        generated = sum(len(successors(cell)) for cell in islice(parent, expanded))
+        stats.record(expanded, generated, len(visited), peak)
+    if end not in parent:
+        return None, len(visited)
+
+    # Reconstruct the path from start to end
+    path = []
+    current = end
+    while current is not None:
+        path.append(current)
+        current = parent.get(current)
+
+    return path[::-1], len(visited)  # Return path and total explored cost
+
+
+def bfs_steps(maze, start, end, graph=None, every=1000, stats=None):
+    """
+    Stepping form of bfs (see maze_ai.stepping): yields a Step every
+    ``every`` expansions and returns the same (path, explored).
+    The queue is a list read through a head index, so the cells expanded
+    and discovered since the previous step are slices of it.
+    """
+    successors = solver_graph(maze, graph).successors
+
+    queue = [start]  # Every discovered cell in order; queue[head:] is the frontier
+    parent = {start: None}
+    head = closed_from = frontier_from = 0
+    peak = 1
+    next_step = every
+
+    while head < len(queue):
+        if len(queue) - head > peak:
+            peak = len(queue) - head
+        current = queue[head]
+
+        if current == end:
+            break
+        head += 1
+
+        for new_node in successors(current):
+            if new_node not in parent:
+                queue.append(new_node)
+                parent[new_node] = current
+
+        if head == next_step:
+            yield Step(queue[closed_from:head], queue[frontier_from:], head)
+            closed_from, frontier_from = head, len(queue)
+            next_step += every
+
+    yield Step(queue[closed_from:head], queue[frontier_from:], head)
+    if stats is not None:
+        generated = sum(len(successors(cell)) for cell in islice(queue, head))
+        stats.record(head, generated, len(parent), peak)
+    if end not in parent:
+        return None, len(parent)
+
+    path = []
+    current = end
+    while current is not None:
+        path.append(current)
+        current = parent[current]
+    return path[::-1], len(parent)
+
+
+def multi_source_bfs(maze, sources, targets, graph=None, stats=None, trace=None):
+    """
+    BFS seeded with every source at once, stopping at the first target
+    reached, which is the target nearest to any source.
+    Returns (target, path, explored); the path runs from the closest source
+    to the target, and target and path are None when no target is reachable.
+    """
+    successors = solver_graph(maze, graph).successors
+    targets = set(targets)
+
+    parent = dict.fromkeys(sources)  # Also the visited set, in discovery order
+    queue = deque(parent)
+    peak = len(queue)
+    target = None
+
+    while queue:
+        if len(queue) > peak:
+            peak = len(queue)
+        current = queue.popleft()
+
+        if current in targets:
+            target = current
+            if trace is not None:
+                trace.emit(GOAL, current)
+            break
+
+        neighbors = successors(current)
+        if trace is not None:
+            trace.expand(current, neighbors)
+        for new_node in neighbors:
+            if new_node not in parent:
+                queue.append(new_node)
+                parent[new_node] = current
+
+    if stats is not None:
+        # Same post-hoc count as bfs: the expanded cells are parent's first entries
+        expanded = len(parent) - len(queue) - (target is not None)
+        generated = sum(len(successors(cell)) for cell in islice(parent, expanded))
+        stats.record(expanded, generated, len(parent), peak)
+    if target is None:
+        return None, None, len(parent)
+
+    path = []
+    current = target
+    while current is not None:
+        path.append(current)
+        current = parent[current]
+    return target, path[::-1], len(parent)
+
+
+def bidirectional_bfs(maze, start, end, graph=None, stats=None, trace=None):
+    """
+    Bidirectional BFS: grows one frontier from start and one from end, a
+    whole level at a time, always expanding the smaller frontier.
+    Stops when the frontiers meet, or when either side runs out of nodes
+    (no path). Counts all unique nodes visited by both sides.
+    """
+    if start == end:
+        if stats is not None:
+            stats.record(0, 0, 1, 1, 0)
+        return [start], 1
+
+    successors = solver_graph(maze, graph).successors
+    forward = {start: None}  # Visited node -> parent, for each side
+    backward = {end: None}
+    forward_frontier = [start]
+    backward_frontier = [end]
+    expanded = generated = levels = 0
+    peak = 2
+    path = None
+
+    while forward_frontier and backward_frontier and path is None:
+        expand_forward = len(forward_frontier) <= len(backward_frontier)
+        if expand_forward:
+            parent, other, frontier = forward, backward, forward_frontier
+        else:
+            parent, other, frontier = backward, forward, backward_frontier
+        levels += 1
+
+        # The visited sets were disjoint after the previous level, so the
+        # first node this level shares with the other side is on a
+        # shortest path.
+        next_frontier = []
+        for current in frontier:
+            neighbors = successors(current)
+            expanded += 1
+            generated += len(neighbors)
+            if trace is not None:
+                trace.expand(current, neighbors)
+            for new_node in neighbors:
+                if new_node not in parent:
+                    parent[new_node] = current
+                    if new_node in other:
+                        path = join_bfs_paths(forward, backward, new_node)
+                        if trace is not None:
+                            trace.emit(GOAL, new_node)
+                        break
+                    next_frontier.append(new_node)
+            if path is not None:
+                break
+
+        if expand_forward:
+            forward_frontier = next_frontier
+        else:
+            backward_frontier = next_frontier
+        peak = max(peak, len(forward_frontier) + len(backward_frontier))
+
+    # A meeting node is in both parent tables but was visited once
+    explored = len(forward) + len(backward) - (path is not None)
+    if stats is not None:
+        stats.record(expanded, generated, len(forward) + len(backward), peak, levels)
+    return path, explored
+
+
+def join_bfs_paths(forward, backward, meeting):
+    """Join the start-side and end-side parent chains at ``meeting``."""
+    path = []
+    current = meeting
+    while current is not None:
+        path.append(current)
+        current = forward[current]
+    path.reverse()
+    current = backward[meeting]
+    while current is not None:
+        path.append(current)
+        current = backward[current]
+    return path
+
+
+def iterative_deepening_search(problem, limit=None, max_limit=None, stats=None, trace=None):
+    """
+    Iterative Deepening Search (IDS) without recursion.
+    Runs depth-limited passes with growing limits until the goal is found or
+    no path exists: a pass ends without hitting the limit, or reaches no cell
+    the previous pass did not. Counts all unique nodes explored over every
+    pass.
+    """
+    explored_nodes = set()  # Set to store all unique nodes visited
+
+    if limit is None:
+        # Every move changes one coordinate by 1, so the Manhattan distance
+        # is a lower bound on the depth of the goal.
+        limit = abs(problem.initial[0] - problem.goal[0]) + abs(problem.initial[1] - problem.goal[1])
+
+    while True:
+        known = len(explored_nodes)
+        result, cutoff_occurred = iterative_dls(problem, limit, explored_nodes, stats, trace)
+        if result is not None:
+            return result, len(explored_nodes)
+        # A pass reaches every cell within the limit, so one that finds no new
+        # cell means none lies further out. Snake-shaped branches in open areas
+        # keep hitting the limit long after that, so the cutoff flag alone
+        # would only stop once the limit nears the number of free cells.
+        if not cutoff_occurred or len(explored_nodes) == known:
+            return None, len(explored_nodes)
+        if max_limit is not None and limit >= max_limit:
+            return 'cutoff', len(explored_nodes)
+        limit += 1
+
+
+def iterative_dls(problem, limit, explored_nodes, stats=None, trace=None):
+    """
+    One depth-limited pass with an explicit stack instead of recursion.
+    The stack holds (state, lazy successor iterator) pairs, so it is the
+    current branch and no node objects are made until the goal is found.
+    A transposition table keeps the shallowest depth each state was reached
+    at in this pass; a state is only searched again from a shallower depth.
+    Returns (goal node or None, whether any branch was cut off by the limit).
+    Each pass adds one round to ``stats``.
+    """
+    start = problem.initial
+    explored_nodes.add(start)
+    if problem.goal_test(start):
+        if stats is not None:
+            stats.record(0, 0, 1, 1, 1)
+        if trace is not None:
+            trace.emit(GOAL, start)
+        return Node_Depth(start), False
+    if trace is not None:
+        trace.emit(EXPAND, start)
+
+    best_depth = {start: 0}
+    stack = [(start, problem.successor_states(start))]
+    cutoff_occurred = False
+    result = None
+    expanded = pushes = peak = 1
+    generated = 0
+
+    while stack:
+        child = next(stack[-1][1], None)
+        if child is None:
+            stack.pop()
+            continue
+
+        generated += 1
+        if trace is not None:
+            trace.emit(GENERATE, child)
+        depth = len(stack)
+        if best_depth.get(child, limit + 1) <= depth:
+            continue
+        best_depth[child] = depth
+        explored_nodes.add(child)
+
+        if problem.goal_test(child):
+            result = node_from_path(problem, [state for state, _ in stack] + [child])
+            if trace is not None:
+                trace.emit(GOAL, child)
+            break
+        if depth == limit:
+            cutoff_occurred = True
+        else:
+            if trace is not None:
+                trace.emit(EXPAND, child)
+            stack.append((child, problem.successor_states(child)))
+            expanded += 1
+            pushes += 1
+            if depth >= peak:
+                peak = depth + 1
+
+    if stats is not None:
+        stats.record(expanded, generated, pushes, peak, 1)
+    return result, cutoff_occurred
@@ -0,0 +1,180 @@
+"""Level-synchronous (wavefront) breadth-first search.
+
+Each BFS level is grown as a whole: the frontier is an array of flat cell
+indices into a grid padded with a ring of walls, so the four neighbors of
+every frontier cell are ``cell - 1``, ``cell + 1``, ``cell - width`` and
+``cell + width`` without bounds checks.  With NumPy installed each level is a
+handful of vectorized array operations; without it the same scheme runs in
+pure Python.
+"""
+
+from collections import deque
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional
+    np = None
+
+
+class DistanceField:
+    """BFS distances from ``source`` to every reachable cell of a maze.
+
+    When ``target`` is given the wavefront stops after the level containing
+    it; otherwise the whole reachable region is labelled.
+    """
+
+    def __init__(self, maze, source, target=None, use_numpy=None):
+        if use_numpy is None:
+            use_numpy = np is not None
+        elif use_numpy and np is None:
+            raise ImportError("NumPy is not installed")
+
+        self.rows = len(maze)
+        self.cols = len(maze[0])
+        self.width = self.cols + 2
+        self.source = source
+        self.expanded = 0  # Cells whose neighbors were labelled
+        self.levels = 0  # Levels grown past the source
+        self.peak_frontier = 1
+        if use_numpy:
+            self.free, self.dist = self.grow_numpy(maze, source, target)
+        else:
+            self.free, self.dist = self.grow_python(maze, source, target)
+
+    def index(self, cell):
+        return (cell[0] + 1) * self.width + cell[1] + 1
+
+    def cell(self, index):
+        row, col = divmod(index, self.width)
+        return row - 1, col - 1
+
+    def grow_numpy(self, maze, source, target):
+        free = np.zeros((self.rows + 2, self.width), dtype=bool)
+        free[1:-1, 1:-1] = np.asarray(maze) == 0
+        free = free.ravel()
+        dist = np.full(free.shape, -1, dtype=np.int32)
+        unvisited = free.copy()
+
+        offsets = np.array([-1, 1, -self.width, self.width])
+        target_index = None if target is None else self.index(target)
+        frontier = np.array([self.index(source)])
+        unvisited[frontier] = False
+        dist[frontier] = 0
+        level = 0
+
+        while frontier.size and (target_index is None or dist[target_index] < 0):
+            level += 1
+            self.expanded += frontier.size
+            neighbors = (frontier[:, None] + offsets).ravel()
+            neighbors = np.unique(neighbors[unvisited[neighbors]])
+            unvisited[neighbors] = False
+            dist[neighbors] = level
+            frontier = neighbors
+            self.peak_frontier = max(self.peak_frontier, frontier.size)
+
+        self.levels = level - (not frontier.size)
+        return free, dist
+
+    def grow_python(self, maze, source, target):
+        width = self.width
+        free = bytearray(width) + bytearray().join(b"\0" + bytes(v == 0 for v in row) + b"\0" for row in maze)
+        free += bytearray(width)
+        dist = [-1] * len(free)
+
+        target_index = None if target is None else self.index(target)
+        start = self.index(source)
+        dist[start] = 0
+        queue = deque([start])
+        level = 0
+        expanded = 0
+        peak = 1
+
+        while queue:
+            current = queue.popleft()
+            # Stop once the target's whole level is labelled, as the NumPy
+            # engine does: that is when the first cell of that level is popped.
+            if target_index is not None and 0 <= dist[target_index] == dist[current]:
+                break
+            if dist[current] == level:
+                # First cell of a new level: the queue holds the rest of it
+                level += 1
+                peak = max(peak, len(queue) + 1)
+            expanded += 1
+            for neighbor in (current - 1, current + 1, current - width, current + width):
+                if free[neighbor] and dist[neighbor] < 0:
+                    dist[neighbor] = level
+                    queue.append(neighbor)
+
+        self.expanded = expanded
+        self.levels = dist[current]  # The last cell popped is on the deepest level
+        self.peak_frontier = peak
+        return free, dist
+
+    def distance(self, cell):
+        """Return the number of steps from the source to ``cell``, or None."""
+        if not (0 <= cell[0] < self.rows and 0 <= cell[1] < self.cols):
+            return None
+        d = int(self.dist[self.index(cell)])
+        return d if d >= 0 else None
+
+    @property
+    def explored(self):
+        """Number of cells the wavefront reached."""
+        if np is not None and isinstance(self.dist, np.ndarray):
+            return int(np.count_nonzero(self.dist >= 0))
+        return sum(1 for d in self.dist if d >= 0)
+
+    def descend(self, cell):
+        """Return a shortest path from ``cell`` back to the source, or None.
+
+        Follows the distance gradient one step at a time, so the cost is
+        proportional to the path length.
+        """
+        d = self.distance(cell)
+        if d is None:
+            return None
+        dist, width = self.dist, self.width
+        current = self.index(cell)
+        path = [cell]
+        while d:
+            d -= 1
+            for neighbor in (current + width, current + 1, current - width, current - 1):
+                if dist[neighbor] == d:
+                    current = neighbor
+                    break
+            path.append(self.cell(current))
+        return path
+
+    def path_to(self, cell):
+        """Return a shortest path from the source to ``cell``, or None."""
+        path = self.descend(cell)
+        if path is not None:
+            path.reverse()
+        return path
+
+    def unreachable(self):
+        """Return the free cells the wavefront did not reach."""
+        if np is not None and isinstance(self.dist, np.ndarray):
+            indices = np.flatnonzero(self.free & (self.dist < 0)).tolist()
+        else:
+            indices = [i for i, d in enumerate(self.dist) if d < 0 and self.free[i]]
+        return [self.cell(i) for i in indices]
+
+    def to_rows(self):
+        """Return the distances as a list of rows, with -1 for unreached cells."""
+        width = self.width
+        dist = self.dist.tolist() if not isinstance(self.dist, list) else self.dist
+        return [dist[(r + 1) * width + 1:(r + 1) * width + 1 + self.cols] for r in range(self.rows)]
+
+
+def wavefront_bfs(maze, start, end, use_numpy=None, stats=None):
+    """Breadth-first search that grows whole levels at once.
+
+    Returns ``(path, explored)`` like ``bfs``, with ``path`` set to None when
+    ``end`` cannot be reached.
+    """
+    field = DistanceField(maze, start, target=end, use_numpy=use_numpy)
+    explored = field.explored
+    if stats is not None:
+        stats.record(field.expanded, explored - 1, explored, field.peak_frontier, field.levels)
+    return field.path_to(end), explored
@@ -0,0 +1,45 @@
+"""Random mazes shared by the tests."""
+
+import random
+
+
+def random_maze(rng, rows, cols, density=0.3):
+    """Return a ``rows`` x ``cols`` list-of-lists maze with about ``density`` walls."""
+    return [[int(rng.random() < density) for _ in range(cols)] for _ in range(rows)]
+
+
+def random_case(rng, max_size=10, density=0.3):
+    """Return ``(maze, start, goal)`` with free start and goal cells, or None if the maze is all walls."""
+    maze = random_maze(rng, rng.randint(1, max_size), rng.randint(1, max_size), density)
+    free = free_cells(maze)
+    if not free:
+        return None
+    return maze, rng.choice(free), rng.choice(free)
+
+
+def random_cases(seed, count, max_size=10, density=0.3):
+    rng = random.Random(seed)
+    cases = []
+    while len(cases) < count:
+        case = random_case(rng, max_size, density)
+        if case is not None:
+            cases.append(case)
+    return cases
+
+
+def free_cells(maze):
+    return [(r, c) for r, row in enumerate(maze) for c, v in enumerate(row) if v == 0]
+
+
+def reachable(maze, start):
+    """Return the set of free cells reachable from ``start`` by flood fill."""
+    rows, cols = len(maze), len(maze[0])
+    seen = {start}
+    stack = [start]
+    while stack:
+        r, c = stack.pop()
+        for n in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if 0 <= n[0] < rows and 0 <= n[1] < cols and maze[n[0]][n[1]] == 0 and n not in seen:
+                seen.add(n)
+                stack.append(n)
+    return seen
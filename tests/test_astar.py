@@ -0,0 +1,27 @@
+from maze_ai.astar import MazeSolver
+from maze_ai.open_lists import HeapOpenList
+from maze_ai.stats import SearchStats
+
+from mazes import random_cases
+
+CASES = random_cases(seed=11, count=200, max_size=15)
+
+
+def test_flat_matches_default_open_list():
+    for maze, start, goal in CASES:
+        assert MazeSolver(maze, start, goal).solve_a_star_flat() == MazeSolver(maze, start, goal).solve_a_star()
+
+
+def test_open_lists_agree_on_cost():
+    for maze, start, goal in CASES:
+        bucket = MazeSolver(maze, start, goal).solve_a_star()[0]
+        heap = MazeSolver(maze, start, goal, open_list=HeapOpenList).solve_a_star()[0]
+        assert (bucket is None) == (heap is None)
+        assert bucket is None or len(bucket) == len(heap)
+
+
+def test_flat_stats():
+    maze, start, goal = CASES[0]
+    stats = SearchStats()
+    explored = MazeSolver(maze, start, goal).solve_a_star_flat(stats)[1]
+    assert stats.expanded == explored
@@ -0,0 +1,48 @@
+import json
+import random
+
+from maze_ai import batch
+from maze_ai.packed import save_packed
+from maze_ai.uninformed import bfs
+
+from mazes import free_cells, random_maze
+
+
+def test_results_match_bfs():
+    maze = random_maze(random.Random(14), 12, 12, density=0.25)
+    free = free_cells(maze)
+    rng = random.Random(15)
+    queries = [(rng.choice(free), rng.choice(free)) for _ in range(40)]
+    for algorithm in batch.ENGINES:
+        results = sorted(batch.solve_batch(maze, queries, algorithm, processes=2))
+        assert [index for index, _, _, _ in results] == list(range(len(queries)))
+        for index, path, _, error in results:
+            expected = bfs(maze, *queries[index])[0]
+            assert error is None
+            assert (path is None) == (expected is None)
+            assert path is None or len(path) == len(expected)
+
+
+def test_bad_queries_get_error_records(tmp_path, capsys):
+    maze = [[0] * 8 for _ in range(8)]
+    maze[5][5] = 1
+    maze_path, queries_path = tmp_path / "maze.mzb", tmp_path / "queries.txt"
+    save_packed(maze_path, maze)
+    queries_path.write_text("-1,0 3,3\n9,9 3,3\n0,0 5,5\n0,0 3,3\n")
+    assert batch.main([str(maze_path), str(queries_path), "-j", "2"]) == 1
+    records = sorted((json.loads(line) for line in capsys.readouterr().out.splitlines()),
+                     key=lambda record: record["query"])
+    assert "outside" in records[0]["error"] and "outside" in records[1]["error"]
+    assert "blocked" in records[2]["error"]
+    assert records[3]["path_cost"] == 6 and "error" not in records[3]
+
+
+def test_failed_solve_is_reported(monkeypatch):
+    class FailingWorker:
+        maze = [[0, 0], [0, 0]]
+
+        def solve(self, start, goal):
+            raise RuntimeError("engine failed")
+
+    monkeypatch.setattr(batch, "worker", FailingWorker())
+    assert batch.solve_query((3, (0, 0), (1, 1))) == (3, None, 0, "RuntimeError: engine failed")
@@ -0,0 +1,28 @@
+import json
+
+from maze_ai import cli
+from maze_ai.mazefile import save_maze
+
+
+def test_bad_cells_give_error_records(tmp_path, capsys):
+    maze = [[0, 0, 0],
+            [1, 1, 0],
+            [0, 0, 0]]
+    first, second = tmp_path / "first.txt", tmp_path / "second.txt"
+    save_maze(first, maze, (0, 0), (2, 0))
+    save_maze(second, maze, (0, 0), (2, 0))
+    assert cli.main([str(first), str(second), "--start", "1,0"]) == 1
+    records = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert [record["file"] for record in records] == [str(first), str(second)]
+    assert all("blocked" in record["error"] for record in records)
+    assert "error" in next(cli.solve_file(str(first), ["astar"], goal=(5, 0)))
+
+
+def test_trace_dir_is_created(tmp_path, capsys):
+    maze_path = tmp_path / "maze.txt"
+    save_maze(maze_path, [[0, 0], [0, 0]], (0, 0), (1, 1))
+    trace_dir = tmp_path / "traces" / "run"
+    assert cli.main([str(maze_path), "-a", "bfs", "--trace-dir", str(trace_dir)]) == 0
+    record = json.loads(capsys.readouterr().out)
+    assert record["path_cost"] == 2
+    assert (trace_dir / "maze.bfs.trace").exists()
@@ -0,0 +1,50 @@
+import random
+
+from maze_ai.components import ComponentIndex
+
+from mazes import free_cells, random_maze, reachable
+
+
+def check_regions(index, maze):
+    free = free_cells(maze)
+    for cell in free:
+        region = reachable(maze, cell)
+        for other in free:
+            assert index.connected(cell, other) == (other in region), (cell, other)
+
+
+def test_connected_matches_flood_fill():
+    rng = random.Random(3)
+    for _ in range(30):
+        maze = random_maze(rng, rng.randint(1, 8), rng.randint(1, 8), density=0.35)
+        check_regions(ComponentIndex(maze), maze)
+
+
+def test_wall_edits_match_flood_fill():
+    rng = random.Random(4)
+    for _ in range(30):
+        rows, cols = rng.randint(2, 8), rng.randint(2, 8)
+        maze = random_maze(rng, rows, cols, density=0.25)
+        index = ComponentIndex(maze)
+        index.build()
+        for _ in range(25):
+            row, col = rng.randrange(rows), rng.randrange(cols)
+            maze[row][col] ^= 1
+            index.set_blocked((row, col), maze[row][col] == 1)
+            check_regions(index, maze)
+
+
+def test_split_by_blocking_a_corridor():
+    maze = [[1, 1, 1, 1, 1],
+            [0, 0, 0, 0, 0],
+            [1, 1, 1, 1, 1]]
+    index = ComponentIndex(maze)
+    assert index.connected((1, 0), (1, 4))
+    maze[1][2] = 1
+    index.set_blocked((1, 2), True)
+    assert not index.connected((1, 0), (1, 4))
+    assert index.connected((1, 0), (1, 1)) and index.connected((1, 3), (1, 4))
+    assert index.component((1, 2)) is None
+    maze[1][2] = 0
+    index.set_blocked((1, 2), False)
+    assert index.connected((1, 0), (1, 4))
@@ -0,0 +1,24 @@
+from maze_ai.graph import MazeGraph, MazeGrid, solver_graph
+from maze_ai.packed import pack_maze, read_packed
+
+from mazes import random_cases
+
+CASES = random_cases(seed=9, count=100)
+
+
+def test_successors_match_grid():
+    for maze, _, _ in CASES:
+        graph, grid = MazeGraph(maze), MazeGrid(maze)
+        for r in range(len(maze)):
+            for c in range(len(maze[0])):
+                # Blocked cells included, so a walled start behaves the same either way
+                assert list(graph.successors((r, c))) == grid.successors((r, c))
+
+
+def test_solver_graph():
+    maze = CASES[0][0]
+    graph = MazeGraph(maze)
+    assert solver_graph(maze, graph) is graph
+    assert isinstance(solver_graph(maze), MazeGrid)
+    packed = read_packed(pack_maze(maze))[0]
+    assert solver_graph(packed) is packed
@@ -0,0 +1,74 @@
+import json
+import random
+
+from maze_ai import cli
+from maze_ai.benchmark import valid_path
+from maze_ai.hpa import HierarchicalMap, HierarchicalSolver, hierarchical_map
+from maze_ai.mazefile import save_maze
+from maze_ai.runner import solve
+from maze_ai.uninformed import bfs
+
+from mazes import free_cells, random_maze
+
+
+def check_queries(rng, hmap, maze, count=10):
+    free = free_cells(maze)
+    for _ in range(count if free else 0):
+        start, goal = rng.choice(free), rng.choice(free)
+        path = HierarchicalSolver(hmap, start, goal).solve()[0]
+        if bfs(maze, start, goal)[0] is None:
+            assert path is None
+        else:
+            assert path is not None and valid_path(maze, path, start, goal)
+
+
+def test_set_cell_matches_fresh_map():
+    rng = random.Random(5)
+    for _ in range(20):
+        rows, cols = rng.randint(4, 14), rng.randint(4, 14)
+        maze = random_maze(rng, rows, cols, density=0.25)
+        hmap = HierarchicalMap(maze, cluster_size=4).build()
+        for _ in range(10):
+            row, col = rng.randrange(rows), rng.randrange(cols)
+            hmap.set_cell(row, col, 1 - maze[row][col])
+            fresh = HierarchicalMap([line[:] for line in maze], cluster_size=4).build()
+            assert (hmap.links, hmap.inter, hmap.intra) == (fresh.links, fresh.inter, fresh.intra)
+            check_queries(rng, hmap, maze, count=3)
+
+
+def test_save_and_load(tmp_path):
+    rng = random.Random(6)
+    maze = random_maze(rng, 12, 9, density=0.25)
+    hmap = HierarchicalMap(maze, cluster_size=4).build()
+    path = tmp_path / "maze.hpa"
+    hmap.save(path)
+    loaded = HierarchicalMap.load(maze, path)
+    assert (loaded.links, loaded.inter, loaded.intra) == (hmap.links, hmap.inter, hmap.intra)
+    check_queries(rng, loaded, maze)
+
+
+def test_runner_reuses_the_cached_map():
+    rng = random.Random(7)
+    maze = random_maze(rng, 20, 20, density=0.2)
+    assert hierarchical_map(maze) is hierarchical_map(maze)
+    free = free_cells(maze)
+    for _ in range(10):
+        start, goal = rng.choice(free), rng.choice(free)
+        path = solve(maze, start, goal, "hpa")[0]
+        assert (path is None) == (bfs(maze, start, goal)[0] is None)
+    hmap = HierarchicalMap(maze, cluster_size=5).build()
+    assert solve(maze, free[0], free[0], "hpa", hmap=hmap)[0] == [free[0]]
+
+
+def test_cli_saves_then_loads_the_map(tmp_path, capsys):
+    maze = [[0] * 12 for _ in range(12)]
+    maze_path, map_path = tmp_path / "maze.txt", tmp_path / "maze.hpa"
+    save_maze(maze_path, maze, (0, 0), (11, 11))
+    for _ in range(2):
+        assert cli.main([str(maze_path), "-a", "hpa", "--hpa-map", str(map_path)]) == 0
+        assert json.loads(capsys.readouterr().out)["path_cost"] == 22
+    assert HierarchicalMap.load(maze, map_path).links == HierarchicalMap(maze).build().links
+    assert cli.main([str(maze_path), str(maze_path), "-a", "hpa", "--hpa-map", str(map_path)]) == 1
+    map_path.write_text("{}")
+    assert cli.main([str(maze_path), "-a", "hpa", "--hpa-map", str(map_path)]) == 1
+    assert "cannot use HPA map" in json.loads(capsys.readouterr().out)["error"]
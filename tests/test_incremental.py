@@ -0,0 +1,45 @@
+import random
+
+from maze_ai.graph import maze_graph
+from maze_ai.incremental import IncrementalSolver
+from maze_ai.oracle import distance_oracle
+from maze_ai.uninformed import bfs
+
+from mazes import random_maze
+
+
+def test_repair_matches_fresh_search():
+    rng = random.Random(2)
+    for _ in range(40):
+        rows, cols = rng.randint(2, 10), rng.randint(2, 10)
+        maze = random_maze(rng, rows, cols)
+        start, goal = (0, 0), (rows - 1, cols - 1)
+        maze[0][0] = maze[rows - 1][cols - 1] = 0
+        solver = IncrementalSolver(maze, start, goal)
+        solver.solve()
+        for _ in range(10):
+            changes = []
+            for _ in range(rng.randint(1, 4)):
+                cell = (rng.randrange(rows), rng.randrange(cols))
+                if cell not in (start, goal):
+                    changes.append((cell[0], cell[1], rng.random() < 0.5))
+            path = solver.update_cells(changes)[0]
+            expected = bfs(maze, start, goal)[0]
+            if expected is None:
+                assert path is None
+            else:
+                assert path is not None and len(path) == len(expected)
+                assert all(maze[r][c] == 0 for r, c in path)
+
+
+def test_edits_invalidate_cached_objects():
+    maze = [[0] * 5 for _ in range(5)]
+    oracle = distance_oracle(maze, (4, 4))
+    graph = maze_graph(maze)
+    solver = IncrementalSolver(maze, (0, 0), (4, 4))
+    solver.solve()
+    solver.update_cells([(0, 1, True), (1, 0, True)])
+    assert distance_oracle(maze, (4, 4)) is not oracle
+    assert not distance_oracle(maze, (4, 4)).reachable((0, 0))
+    assert maze_graph(maze) is not graph
+    assert maze_graph(maze).successors((0, 0)) == ()
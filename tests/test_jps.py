@@ -0,0 +1,33 @@
+import pytest
+
+from maze_ai.jps import JumpPointSolver
+from maze_ai.packed import pack_maze, read_packed
+from maze_ai.uninformed import bfs
+
+from mazes import random_cases
+
+
+@pytest.mark.parametrize("density", [0.1, 0.3, 0.45])
+def test_path_lengths_match_bfs(density):
+    for maze, start, goal in random_cases(seed=12, count=300, max_size=14, density=density):
+        path = JumpPointSolver(maze, start, goal).solve_jump_point()[0]
+        expected = bfs(maze, start, goal)[0]
+        if expected is None:
+            assert path is None
+        else:
+            assert path[0] == start and path[-1] == goal and len(path) == len(expected)
+            assert all(maze[r][c] == 0 for r, c in path)
+
+
+def test_packed_maze():
+    for maze, start, goal in random_cases(seed=13, count=100, max_size=20):
+        path = JumpPointSolver(read_packed(pack_maze(maze))[0], start, goal).solve_jump_point()[0]
+        expected = bfs(maze, start, goal)[0]
+        assert (path is None) == (expected is None)
+        assert path is None or len(path) == len(expected)
+
+
+def test_open_grid_expands_few_jump_points():
+    maze = [[0] * 200 for _ in range(200)]
+    path, explored = JumpPointSolver(maze, (0, 0), (199, 199)).solve_jump_point()
+    assert len(path) == 399 and explored <= 3
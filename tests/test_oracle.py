@@ -0,0 +1,48 @@
+from maze_ai.benchmark import valid_path
+from maze_ai.cache import MazeCache, maze_changed
+from maze_ai.hpa import HierarchicalMap
+from maze_ai.oracle import distance_oracle
+from maze_ai.uninformed import bfs
+
+from mazes import free_cells, random_cases
+
+CASES = random_cases(seed=8, count=60)
+
+
+def test_paths_match_bfs():
+    for maze, start, goal in CASES:
+        oracle = distance_oracle(maze, goal)
+        expected = bfs(maze, start, goal)[0]
+        path = oracle.path_from(start)
+        if expected is None:
+            assert path is None and not oracle.reachable(start)
+        else:
+            assert valid_path(maze, path, start, goal)
+            assert len(path) == len(expected) == oracle.distance_from(start) + 1
+
+
+def test_cache_reuses_oracles():
+    maze, _, goal = CASES[0]
+    assert distance_oracle(maze, goal) is distance_oracle(maze, goal)
+
+
+def test_maze_changed_drops_entries_everywhere():
+    maze = [[0] * 4 for _ in range(4)]
+    other = [[0] * 4 for _ in range(4)]
+    cache = MazeCache(lambda maze: object())
+    kept = cache.get(other)
+    built = cache.get(maze)
+    maze_changed(maze)
+    assert cache.get(maze) is not built
+    assert cache.get(other) is kept
+
+
+def test_hierarchical_edits_invalidate_oracles():
+    maze = [[0] * 6 for _ in range(6)]
+    oracle = distance_oracle(maze, (5, 5))
+    hmap = HierarchicalMap(maze, cluster_size=3).build()
+    for cell in free_cells(maze):
+        if cell[0] == 2:
+            hmap.set_cell(cell[0], cell[1], 1)
+    assert distance_oracle(maze, (5, 5)) is not oracle
+    assert not distance_oracle(maze, (5, 5)).reachable((0, 0))
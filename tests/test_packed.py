@@ -0,0 +1,64 @@
+import random
+
+import pytest
+
+from maze_ai.benchmark import valid_path
+from maze_ai.graph import MazeGrid
+from maze_ai.packed import load_packed, pack_maze, read_packed, save_packed
+from maze_ai.runner import solve
+from maze_ai.uninformed import bfs
+
+from mazes import random_cases, random_maze
+
+
+@pytest.mark.parametrize("cols", [1, 7, 8, 9, 15, 16, 17, 25])
+def test_cells_and_successors_at_byte_edges(cols):
+    rng = random.Random(cols)
+    for _ in range(20):
+        maze = random_maze(rng, rng.randint(1, 5), cols, density=0.4)
+        packed = read_packed(pack_maze(maze))[0]
+        grid = MazeGrid(maze)
+        assert packed.to_lists() == maze
+        for r in range(len(maze)):
+            assert list(packed[r]) == maze[r]
+            for c in range(cols):
+                assert packed[r][c] == maze[r][c]
+                assert packed.successors((r, c)) == grid.successors((r, c))
+
+
+def test_blocked_cells():
+    maze = random_maze(random.Random(0), 6, 19, density=0.4)
+    packed = read_packed(pack_maze(maze))[0]
+    assert packed.blocked_cells() == {(r, c) for r in range(6) for c in range(19) if maze[r][c]}
+
+
+def test_file_round_trip(tmp_path):
+    maze = random_maze(random.Random(1), 5, 13)
+    maze[0][0] = maze[4][12] = 0
+    path = tmp_path / "maze.mzb"
+    save_packed(path, maze, (0, 0), (4, 12))
+    packed, start, goal = load_packed(path)
+    with packed:
+        assert packed.to_lists() == maze
+        assert (start, goal) == ((0, 0), (4, 12))
+        # Saving the packed maze itself copies its body unchanged
+        assert pack_maze(packed, start, goal) == path.read_bytes()
+
+
+def test_rejects_other_data():
+    with pytest.raises(ValueError):
+        read_packed(b"not a maze, just some bytes here")
+    with pytest.raises(ValueError):
+        read_packed(pack_maze([[0] * 20] * 4)[:-1])
+
+
+@pytest.mark.parametrize("algorithm", ["astar", "bfs", "bibfs", "ids", "forward", "backward"])
+def test_solvers_on_packed_mazes(algorithm):
+    for maze, start, goal in random_cases(seed=10, count=60, max_size=20):
+        packed = read_packed(pack_maze(maze))[0]
+        path = solve(packed, start, goal, algorithm)[0]
+        expected = bfs(maze, start, goal)[0]
+        if expected is None:
+            assert path is None
+        else:
+            assert valid_path(maze, path, start, goal) and len(path) == len(expected)
@@ -0,0 +1,45 @@
+import pytest
+
+from maze_ai.benchmark import valid_path
+from maze_ai.graph import MazeGraph
+from maze_ai.runner import ALGORITHMS, GRAPH_ALGORITHMS, solve
+from maze_ai.uninformed import bfs
+
+from mazes import random_cases
+
+CASES = random_cases(seed=1, count=150)
+
+# Algorithms that may return a longer path than the shortest one
+SUBOPTIMAL = {"dls", "hpa"}
+
+
+def options_for(algorithm, maze):
+    if algorithm == "dls":
+        return {"limit": len(maze) * len(maze[0])}
+    if algorithm == "hpa":
+        return {"cluster_size": 3}
+    return {}
+
+
+def check_against_bfs(maze, start, goal, path, algorithm):
+    expected = bfs(maze, start, goal)[0]
+    if expected is None:
+        assert path is None
+        return
+    assert path is not None and valid_path(maze, path, start, goal)
+    if algorithm not in SUBOPTIMAL:
+        assert len(path) == len(expected)
+
+
+@pytest.mark.parametrize("algorithm", sorted(ALGORITHMS))
+def test_matches_bfs(algorithm):
+    for maze, start, goal in CASES:
+        path = solve(maze, start, goal, algorithm, **options_for(algorithm, maze))[0]
+        check_against_bfs(maze, start, goal, path, algorithm)
+
+
+@pytest.mark.parametrize("algorithm", sorted(GRAPH_ALGORITHMS))
+def test_matches_bfs_with_graph(algorithm):
+    for maze, start, goal in CASES:
+        path = solve(maze, start, goal, algorithm, graph=MazeGraph(maze), **options_for(algorithm, maze))[0]
+        check_against_bfs(maze, start, goal, path, algorithm)
@@ -0,0 +1,71 @@
+import pytest
+
+from maze_ai import backward_chaining, forward_chaining
+from maze_ai.astar import MazeSolver
+from maze_ai.stepping import frame_size, run_steps
+from maze_ai.uninformed import MazeProblem, bfs, bfs_steps, depth_limited_search, depth_limited_steps
+
+from mazes import random_cases
+
+CASES = random_cases(seed=7, count=80, max_size=12, density=0.25)
+
+
+def collect(steps):
+    """Drive a stepping solver and return ``(result, steps)``."""
+    seen = []
+    while True:
+        try:
+            seen.append(next(steps))
+        except StopIteration as stop:
+            return stop.value, seen
+
+
+@pytest.mark.parametrize("every", [1, 3, 1000])
+def test_bfs_steps(every):
+    for maze, start, goal in CASES:
+        result, steps = collect(bfs_steps(maze, start, goal, every=every))
+        assert result == bfs(maze, start, goal)
+        assert steps[-1].expanded == sum(len(step.closed) for step in steps)
+
+
+@pytest.mark.parametrize("every", [1, 3, 1000])
+def test_depth_limited_steps(every):
+    for maze, start, goal in CASES:
+        for limit in (0, 3, 50):
+            plain = depth_limited_search(MazeProblem(maze, start, goal), limit=limit)
+            stepped = run_steps(depth_limited_steps(MazeProblem(maze, start, goal), limit=limit, every=every))
+            assert stepped[1] == plain[1]
+            if plain[0] is None or plain[0] == 'cutoff':
+                assert stepped[0] == plain[0]
+            else:
+                assert stepped[0].path() == plain[0].path()
+
+
+@pytest.mark.parametrize("every", [1, 3, 1000])
+def test_a_star_steps(every):
+    for maze, start, goal in CASES:
+        plain = MazeSolver(maze, start, goal).solve_a_star()
+        assert run_steps(MazeSolver(maze, start, goal).solve_a_star_steps(every=every)) == plain
+
+
+@pytest.mark.parametrize("semi_naive", [False, True])
+@pytest.mark.parametrize("every", [1, 3, 1000])
+def test_forward_chaining_steps(every, semi_naive):
+    for maze, start, goal in CASES:
+        plain = forward_chaining.MazeProblem(maze, start, goal).apply_rules(semi_naive=semi_naive)
+        problem = forward_chaining.MazeProblem(maze, start, goal)
+        assert run_steps(problem.apply_rules_steps(semi_naive, every=every)) == plain
+
+
+@pytest.mark.parametrize("every", [1, 3, 1000])
+def test_backward_chaining_steps(every):
+    for maze, start, goal in CASES:
+        plain = backward_chaining.MazeProblem(maze, start, goal).apply_rules()
+        problem = backward_chaining.MazeProblem(maze, start, goal)
+        assert run_steps(problem.apply_rules_steps(every=every)) == plain
+
+
+def test_frame_size():
+    assert frame_size(10) == 1
+    assert frame_size(300 * 300) == 300
+    assert frame_size(1000, frames=10) == 100
@@ -0,0 +1,30 @@
+import pytest
+
+from maze_ai.runner import solve
+from maze_ai.trace import EXPAND, GOAL, Trace, TraceBuffer, TraceFile, heat_map, read_trace
+
+
+def test_trace_is_abstract():
+    with pytest.raises(TypeError):
+        Trace()
+
+
+def test_buffer_keeps_the_last_events():
+    trace = TraceBuffer(capacity=4)
+    for i in range(6):
+        trace.emit(EXPAND, (i, i))
+    assert len(trace) == 4
+    assert [cell for _, cell in trace.events()] == [(2, 2), (3, 3), (4, 4), (5, 5)]
+
+
+def test_file_round_trip(tmp_path):
+    maze = [[0, 0, 0], [1, 1, 0], [0, 0, 0]]
+    buffer = TraceBuffer()
+    solve(maze, (0, 0), (2, 0), "bfs", trace=buffer)
+    path = tmp_path / "maze.bfs.trace"
+    with TraceFile(path) as trace:
+        solve(maze, (0, 0), (2, 0), "bfs", trace=trace)
+    events = list(read_trace(path))
+    assert events == list(buffer.events())
+    assert events[-1] == (GOAL, (2, 0))
+    assert heat_map(events)[(0, 0)] == 1